@@ -0,0 +1,56 @@
+"""add llm_call_metric_rollups table
+
+Revision ID: 20261017_0007
+Revises: 20260607_0006
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_0007"
+down_revision: Union[str, Sequence[str], None] = "20260607_0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_call_metric_rollups",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("operation", sa.String(length=50), nullable=False),
+        sa.Column("model", sa.String(length=100), nullable=False),
+        sa.Column("call_count", sa.Integer(), nullable=False),
+        sa.Column("duration_sum_ms", sa.Float(), nullable=False),
+        sa.Column("duration_min_ms", sa.Float(), nullable=False),
+        sa.Column("duration_max_ms", sa.Float(), nullable=False),
+        sa.Column("input_tokens_sum", sa.BigInteger(), nullable=False),
+        sa.Column("input_tokens_count", sa.Integer(), nullable=False),
+        sa.Column("output_tokens_sum", sa.BigInteger(), nullable=False),
+        sa.Column("output_tokens_count", sa.Integer(), nullable=False),
+        sa.Column("total_tokens_sum", sa.BigInteger(), nullable=False),
+        sa.Column("total_tokens_count", sa.Integer(), nullable=False),
+        sa.Column("latency_buckets", sa.JSON(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "bucket_start", "operation", "model", name="uq_llm_call_metric_rollups_bucket"
+        ),
+    )
+    op.create_index(
+        op.f("ix_llm_call_metric_rollups_bucket_start"),
+        "llm_call_metric_rollups",
+        ["bucket_start"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_llm_call_metric_rollups_bucket_start"),
+        table_name="llm_call_metric_rollups",
+    )
+    op.drop_table("llm_call_metric_rollups")
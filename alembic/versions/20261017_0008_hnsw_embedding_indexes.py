@@ -0,0 +1,69 @@
+"""replace IVFFlat embedding indexes with HNSW
+
+IVFFlat centroids are computed at build time, and both indexes were built on
+empty tables, so their lists were meaningless. HNSW needs no training data
+and keeps recall stable as rows are added; search breadth is tuned per query
+via ``hnsw.ef_search`` (see ``VECTOR_EF_SEARCH``).
+
+Revision ID: 20261017_0008
+Revises: 20261017_0007
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_0008"
+down_revision: Union[str, Sequence[str], None] = "20261017_0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_HNSW_PARAMS = {"m": 16, "ef_construction": 64}
+
+
+def upgrade() -> None:
+    op.drop_index("ix_risk_analyses_embedding", table_name="risk_analyses")
+    op.create_index(
+        "ix_risk_analyses_embedding",
+        "risk_analyses",
+        ["embedding"],
+        unique=False,
+        postgresql_using="hnsw",
+        postgresql_ops={"embedding": "vector_cosine_ops"},
+        postgresql_with=_HNSW_PARAMS,
+    )
+    op.drop_index("ix_document_chunks_embedding", table_name="document_chunks")
+    op.create_index(
+        "ix_document_chunks_embedding",
+        "document_chunks",
+        ["embedding"],
+        unique=False,
+        postgresql_using="hnsw",
+        postgresql_ops={"embedding": "vector_cosine_ops"},
+        postgresql_with=_HNSW_PARAMS,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_document_chunks_embedding", table_name="document_chunks")
+    op.create_index(
+        "ix_document_chunks_embedding",
+        "document_chunks",
+        ["embedding"],
+        unique=False,
+        postgresql_using="ivfflat",
+        postgresql_ops={"embedding": "vector_cosine_ops"},
+        postgresql_with={"lists": 100},
+    )
+    op.drop_index("ix_risk_analyses_embedding", table_name="risk_analyses")
+    op.create_index(
+        "ix_risk_analyses_embedding",
+        "risk_analyses",
+        ["embedding"],
+        unique=False,
+        postgresql_using="ivfflat",
+        postgresql_ops={"embedding": "vector_cosine_ops"},
+        postgresql_with={"lists": 100},
+    )
@@ -0,0 +1,35 @@
+"""add full-text GIN index on document_chunks.chunk_text
+
+Backs the lexical half of hybrid RAG retrieval. The ``simple`` text search
+configuration does no stemming or stop-word removal, so tickers, CUSIPs
+and figures are indexed verbatim.
+
+Revision ID: 20261017_0009
+Revises: 20261017_0008
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_0009"
+down_revision: Union[str, Sequence[str], None] = "20261017_0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_document_chunks_chunk_text_tsv",
+        "document_chunks",
+        [sa.text("to_tsvector('simple'::regconfig, chunk_text)")],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_document_chunks_chunk_text_tsv", table_name="document_chunks")
@@ -0,0 +1,51 @@
+"""add risk_explanations table
+
+Stores generated /risk/{symbol}/explain answers keyed by a hash of the model
+and prompts, so identical prompts can be served from the database tier of
+the explanation cache.
+
+Revision ID: 20261017_0010
+Revises: 20261017_0009
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_0010"
+down_revision: Union[str, Sequence[str], None] = "20261017_0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Created by the initial migration; reused here without re-creating the type.
+_RISK_LEVEL = postgresql.ENUM("LOW", "MEDIUM", "HIGH", name="risk_level", create_type=False)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "risk_explanations",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("explanation_key", sa.String(length=64), nullable=False),
+        sa.Column("symbol", sa.String(length=10), nullable=False),
+        sa.Column("days", sa.Integer(), nullable=False),
+        sa.Column("risk_level", _RISK_LEVEL, nullable=False),
+        sa.Column("model", sa.String(length=100), nullable=False),
+        sa.Column("explanation", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_risk_explanations_key_created_at",
+        "risk_explanations",
+        ["explanation_key", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_risk_explanations_key_created_at", table_name="risk_explanations")
+    op.drop_table("risk_explanations")
@@ -0,0 +1,57 @@
+"""add ingestion_jobs table
+
+Backs the background document ingestion queue: uploads insert a queued job
+and local worker threads claim, run and report progress on it.
+
+Revision ID: 20261017_0011
+Revises: 20261017_0010
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_0011"
+down_revision: Union[str, Sequence[str], None] = "20261017_0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_STATUS = sa.Enum("queued", "running", "succeeded", "failed", name="ingestion_status")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ingestion_jobs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("document_id", sa.Integer(), nullable=False),
+        sa.Column("filename", sa.String(length=500), nullable=False),
+        sa.Column("file_bytes", sa.LargeBinary(), nullable=True),
+        sa.Column("status", _STATUS, nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("pages_total", sa.Integer(), nullable=True),
+        sa.Column("pages_extracted", sa.Integer(), nullable=False),
+        sa.Column("chunks_total", sa.Integer(), nullable=True),
+        sa.Column("chunks_embedded", sa.Integer(), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["document_id"], ["documents.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_ingestion_jobs_document_id"), "ingestion_jobs", ["document_id"], unique=False
+    )
+    op.create_index(
+        "ix_ingestion_jobs_status_id", "ingestion_jobs", ["status", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ingestion_jobs_status_id", table_name="ingestion_jobs")
+    op.drop_index(op.f("ix_ingestion_jobs_document_id"), table_name="ingestion_jobs")
+    op.drop_table("ingestion_jobs")
+    _STATUS.drop(op.get_bind(), checkfirst=True)
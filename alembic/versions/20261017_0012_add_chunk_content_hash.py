@@ -0,0 +1,50 @@
+"""add content_hash to document_chunks
+
+Lets ingestion reuse the embedding of an identical chunk from any document
+instead of recomputing it. The hash covers the embedding model name and the
+chunk text (see ``app.services.embeddings.content_hash``); existing rows are
+backfilled on PostgreSQL.
+
+Revision ID: 20261017_0012
+Revises: 20261017_0011
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_0012"
+down_revision: Union[str, Sequence[str], None] = "20261017_0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match app.services.embeddings._MODEL_NAME at the time of this migration.
+_MODEL_NAME = "all-MiniLM-L6-v2"
+
+
+def upgrade() -> None:
+    op.add_column(
+        "document_chunks", sa.Column("content_hash", sa.String(length=64), nullable=True)
+    )
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            sa.text(
+                "UPDATE document_chunks SET content_hash = encode(sha256("
+                "convert_to(:model, 'UTF8') || '\\x00'::bytea || convert_to(chunk_text, 'UTF8')"
+                "), 'hex') WHERE content_hash IS NULL"
+            ).bindparams(model=_MODEL_NAME)
+        )
+    op.create_index(
+        op.f("ix_document_chunks_content_hash"),
+        "document_chunks",
+        ["content_hash"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_document_chunks_content_hash"), table_name="document_chunks")
+    op.drop_column("document_chunks", "content_hash")
@@ -1,14 +1,18 @@
-"""Documents API — upload and ingest financial documents for RAG."""
+"""Documents API — upload financial documents, track their ingestion, and chat with them."""
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlmodel import Session
 
+from app.api.sse import sse_response
+from app.domain.ingestion import IngestionStatus
 from app.repositories.document_repo import DocumentRepository
+from app.repositories.ingestion_job_repo import IngestionJobRepository
 from app.repositories.session import get_session
 from app.schemas.errors import ErrorResponse
-from app.services.document_service import ingest_document
-from app.services.rag import answer_question
+from app.services.ingestion_jobs import submit_document
+from app.services.rag import answer_question, prepare_answer, stream_answer
 
 router = APIRouter()
 
@@ -33,18 +37,35 @@ _MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
 
 
 class DocumentUploadResponse(BaseModel):
-    """Response returned after a successful document upload."""
+    """Response returned after a document upload has been queued for ingestion."""
 
-    document_id: int = Field(description="ID of the stored document.")
+    job_id: int = Field(description="ID of the background ingestion job.")
+    document_id: int = Field(description="ID of the document being ingested.")
     filename: str = Field(description="Original filename.")
-    chunk_count: int = Field(description="Number of text chunks embedded and stored.")
+    status: IngestionStatus = Field(description="Current ingestion job status.")
     message: str = Field(description="Human-readable confirmation.")
 
 
+class DocumentStatusResponse(BaseModel):
+    """Ingestion progress of an uploaded document."""
+
+    document_id: int = Field(description="ID of the document.")
+    filename: str = Field(description="Original filename.")
+    job_id: int | None = Field(
+        description="ID of the latest ingestion job; None for documents ingested inline."
+    )
+    status: IngestionStatus = Field(description="Ingestion job status.")
+    pages_total: int | None = Field(description="Pages in the file, once known.")
+    pages_extracted: int = Field(description="Pages whose text has been extracted.")
+    chunks_total: int | None = Field(description="Chunks to embed, once known.")
+    chunks_embedded: int = Field(description="Chunks embedded so far.")
+    error: str | None = Field(description="Failure reason when the status is failed.")
+
+
 @router.post(
     "/documents/upload",
     response_model=DocumentUploadResponse,
-    status_code=201,
+    status_code=202,
     responses={
         400: {"model": ErrorResponse},
         401: {"model": ErrorResponse},
@@ -58,22 +79,24 @@ async def upload_document(
     file: UploadFile,
     session: Session = Depends(get_session),
 ) -> DocumentUploadResponse:
-    """Upload a PDF or text document and ingest it for RAG queries.
+    """Upload a PDF or text document and queue it for RAG ingestion.
 
-    The file is extracted, split into 500-character overlapping chunks,
-    embedded with ``all-MiniLM-L6-v2``, and stored in PostgreSQL.
+    The file is stored and a background worker extracts it, splits it into
+    500-character overlapping chunks, embeds them with ``all-MiniLM-L6-v2``
+    and stores them. Poll ``GET /documents/{document_id}/status`` until the
+    status is ``succeeded`` before chatting with the document.
 
     Args:
         file: Uploaded file (.pdf, .txt, or .md).
         session: Injected database session.
 
     Returns:
-        Document ID, filename, and number of chunks stored.
+        Job ID, document ID, filename, and the initial job status.
 
     Raises:
-        HTTPException: 400 for unsupported file type or empty PDF.
+        HTTPException: 400 for unsupported file type or empty file.
         HTTPException: 413 if the file exceeds 10 MB.
-        HTTPException: 500 on unexpected ingestion failure.
+        HTTPException: 500 if the job cannot be queued.
     """
     file_bytes = await file.read()
 
@@ -89,21 +112,69 @@ async def upload_document(
     filename = file.filename or "upload"
 
     try:
-        document_id, chunk_count = ingest_document(
-            filename=filename,
-            file_bytes=file_bytes,
-            session=session,
-        )
+        job = submit_document(filename=filename, file_bytes=file_bytes, session=session)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Ingestion failed: {e}") from e
+        raise HTTPException(status_code=500, detail=f"Could not queue ingestion: {e}") from e
 
     return DocumentUploadResponse(
-        document_id=document_id,
+        job_id=job.id,
+        document_id=job.document_id,
         filename=filename,
-        chunk_count=chunk_count,
-        message=f"Document ingested successfully into {chunk_count} chunks.",
+        status=job.status,
+        message="Document queued for ingestion.",
+    )
+
+
+@router.get(
+    "/documents/{document_id}/status",
+    response_model=DocumentStatusResponse,
+    responses={
+        401: {"model": ErrorResponse},
+        403: {"model": ErrorResponse},
+        404: {"model": ErrorResponse},
+        422: {"model": ErrorResponse},
+    },
+)
+def document_status(
+    document_id: int,
+    session: Session = Depends(get_session),
+) -> DocumentStatusResponse:
+    """Report ingestion progress for an uploaded document.
+
+    Raises:
+        HTTPException: 404 if the document does not exist.
+    """
+    document = DocumentRepository(session).get_document(document_id)
+    if document is None:
+        raise HTTPException(status_code=404, detail="Document not found.")
+
+    job = IngestionJobRepository(session).get_latest_for_document(document_id)
+    if job is None:
+        chunk_count = DocumentRepository(session).count_chunks(document_id)
+        return DocumentStatusResponse(
+            document_id=document_id,
+            filename=document.filename,
+            job_id=None,
+            status=IngestionStatus.succeeded,
+            pages_total=None,
+            pages_extracted=0,
+            chunks_total=chunk_count,
+            chunks_embedded=chunk_count,
+            error=None,
+        )
+
+    return DocumentStatusResponse(
+        document_id=document_id,
+        filename=document.filename,
+        job_id=job.id,
+        status=job.status,
+        pages_total=job.pages_total,
+        pages_extracted=job.pages_extracted,
+        chunks_total=job.chunks_total,
+        chunks_embedded=job.chunks_embedded,
+        error=job.error,
     )
 
 
@@ -147,3 +218,51 @@ def chat_document(
         answer=answer,
         sources=sources,
     )
+
+
+@router.post(
+    "/documents/{document_id}/chat/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"text/event-stream": {}}},
+        400: {"model": ErrorResponse},
+        401: {"model": ErrorResponse},
+        403: {"model": ErrorResponse},
+        404: {"model": ErrorResponse},
+        422: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+    },
+)
+def chat_document_stream(
+    document_id: int,
+    request: DocumentChatRequest,
+    session: Session = Depends(get_session),
+) -> StreamingResponse:
+    """Stream the answer to a question about a document as Server-Sent Events.
+
+    Retrieval runs before the response starts, so missing documents and
+    chunks still return 404. The stream emits a ``sources`` event with the
+    chunk texts used as context, one ``token`` event per generated text
+    fragment, then ``done``.
+    """
+    repo = DocumentRepository(session)
+    document = repo.get_document(document_id)
+
+    if document is None:
+        raise HTTPException(status_code=404, detail="Document not found.")
+
+    try:
+        prepared = prepare_answer(request.question, document_id, repo)
+    except ValueError as exc:
+        detail = str(exc)
+        if "No embedded chunks found" in detail:
+            raise HTTPException(status_code=404, detail=detail) from exc
+        raise HTTPException(status_code=500, detail=detail) from exc
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Document chat failed: {exc}") from exc
+
+    sources = list(prepared.cached.sources) if prepared.cached else prepared.sources
+    return sse_response(
+        stream_answer(prepared),
+        prelude=[("sources", {"document_id": document_id, "sources": sources})],
+    )
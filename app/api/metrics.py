@@ -4,8 +4,12 @@ from fastapi import APIRouter, Depends
 from pydantic import BaseModel, Field
 from sqlmodel import Session
 
+from app.infrastructure.market.yfinance_client import market_cache_stats
 from app.repositories.metrics_repo import MetricsRepository
 from app.repositories.session import get_session
+from app.services.answer_cache import get_answer_cache
+from app.services.embeddings import embedding_cache_stats
+from app.services.llm import explanation_cache_stats
 
 router = APIRouter()
 
@@ -14,7 +18,10 @@ class OperationStats(BaseModel):
     """Stats for a single operation."""
 
     avg_duration_ms: float = Field(description="Average latency in milliseconds.")
+    p50_duration_ms: float = Field(description="Median latency.")
+    p90_duration_ms: float = Field(description="90th percentile latency.")
     p95_duration_ms: float = Field(description="95th percentile latency.")
+    p99_duration_ms: float = Field(description="99th percentile latency.")
     call_count: int = Field(description="Number of calls in the period.")
 
 
@@ -26,6 +33,15 @@ class TokenStats(BaseModel):
     avg_total_tokens: float = Field(description="Average total tokens per call.")
 
 
+class CacheStats(BaseModel):
+    """Counters for an in-process cache."""
+
+    hits: int = Field(description="Lookups served from the cache.")
+    misses: int = Field(description="Lookups that triggered an upstream load.")
+    coalesced: int = Field(description="Concurrent misses that joined an in-flight load.")
+    size: int = Field(description="Live entries currently held.")
+
+
 class MetricsResponse(BaseModel):
     """AI system metrics and observability data."""
 
@@ -33,6 +49,18 @@ class MetricsResponse(BaseModel):
     avg_eval_score: float | None = Field(description="Average explanation quality score (1-5).")
     operations: dict[str, OperationStats] = Field(description="Latency stats by operation.")
     token_usage: dict[str, TokenStats] = Field(description="Token stats by LLM model.")
+    market_data_cache: dict[str, CacheStats] = Field(
+        default_factory=dict, description="Market data cache counters by function."
+    )
+    embedding_cache: dict[str, CacheStats] = Field(
+        default_factory=dict, description="Embedding cache counters by tier."
+    )
+    explanation_cache: dict[str, CacheStats] = Field(
+        default_factory=dict, description="Risk explanation cache counters by tier."
+    )
+    answer_cache: CacheStats | None = Field(
+        default=None, description="Document chat semantic answer cache counters."
+    )
 
 
 @router.get(
@@ -47,8 +75,12 @@ def get_metrics(
 
     This endpoint exposes:
     - Average explanation eval score (quality)
-    - P95 latency by operation
+    - P50/P90/P95/P99 latency by operation
     - Token usage per model
+    - Market data cache hit/miss/coalesce counters
+    - Embedding cache hit/miss counters (memory and persistent tiers)
+    - Explanation cache hit/miss counters (memory and database tiers)
+    - Document chat semantic answer cache hit/miss counters
 
     Args:
         days: Lookback window in days (default 7).
@@ -70,10 +102,23 @@ def get_metrics(
     token_stats = {
         model: TokenStats(**data) for model, data in tokens.items()
     }
+    cache_stats = {
+        name: CacheStats(**data) for name, data in market_cache_stats().items()
+    }
+    embedding_stats = {
+        tier: CacheStats(**data) for tier, data in embedding_cache_stats().items()
+    }
+    explanation_stats = {
+        tier: CacheStats(**data) for tier, data in explanation_cache_stats().items()
+    }
 
     return MetricsResponse(
         period_days=days,
         avg_eval_score=avg_score,
         operations=op_stats,
         token_usage=token_stats,
+        market_data_cache=cache_stats,
+        embedding_cache=embedding_stats,
+        explanation_cache=explanation_stats,
+        answer_cache=CacheStats(**get_answer_cache().stats()),
     )
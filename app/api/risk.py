@@ -1,7 +1,10 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+
+from app.api.sse import sse_response
 from app.schemas.errors import ErrorResponse
 from app.schemas.risk import DaysQueryParam, RiskExplainResponse, RiskMetrics, RiskResponse, SymbolPathParam
-from app.services.llm import explain_risk
+from app.services.llm import explain_risk, stream_explain_risk
 from app.services.risk_service import get_risk_metrics
 from app.domain.scoring import classify_risk
 
@@ -95,3 +98,63 @@ def risk_explain(symbol: SymbolPathParam, days: DaysQueryParam = 90) -> RiskExpl
         risk_level=risk_level,
         explanation=explanation,
     )
+
+
+@router.get(
+    "/risk/{symbol}/explain/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"text/event-stream": {}}},
+        401: {"model": ErrorResponse},
+        403: {"model": ErrorResponse},
+        404: {"model": ErrorResponse},
+        422: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+    },
+)
+def risk_explain_stream(symbol: SymbolPathParam, days: DaysQueryParam = 90) -> StreamingResponse:
+    """Stream a plain-English LLM explanation for a ticker as Server-Sent Events.
+
+    Emits a ``metadata`` event with the metrics and risk level, then one
+    ``token`` event per generated text fragment, then ``done``.
+
+    Args:
+        symbol: Asset ticker symbol.
+        days: Number of trailing days to analyze.
+
+    Returns:
+        ``text/event-stream`` response.
+
+    Raises:
+        HTTPException: 404 when historical data is unavailable.
+        HTTPException: 500 when the API key is missing.
+    """
+    normalized_symbol = symbol.upper()
+
+    try:
+        raw = get_risk_metrics(normalized_symbol, days)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+    metrics = RiskMetrics(**raw)
+    risk_level = classify_risk(metrics.volatility, metrics.max_drawdown)
+
+    try:
+        tokens = stream_explain_risk(
+            symbol=normalized_symbol,
+            days=days,
+            volatility=metrics.volatility,
+            max_drawdown=metrics.max_drawdown,
+            mean_return=metrics.mean_return,
+            risk_level=risk_level,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+    metadata = {
+        "symbol": normalized_symbol,
+        "days": days,
+        "metrics": metrics.model_dump(),
+        "risk_level": risk_level,
+    }
+    return sse_response(tokens, prelude=[("metadata", metadata)])
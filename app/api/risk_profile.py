@@ -2,13 +2,15 @@ from fastapi import APIRouter, HTTPException, Query
 from app.schemas.errors import ErrorResponse
 from app.schemas.risk import (
     DaysQueryParam,
+    RiskProfileBatchRequest,
+    RiskProfileBatchResponse,
     RiskProfileData,
     RiskProfileMode,
     RiskProfileResponse,
     SymbolPathParam,
 )
-from app.services.ml_service import get_ml_risk_profile
-from app.services.risk_service import get_risk_profile
+from app.services.ml_service import get_ml_risk_profile, get_ml_risk_profiles
+from app.services.risk_service import get_risk_profile, get_risk_profiles
 
 router = APIRouter()
 
@@ -61,3 +63,52 @@ def risk_profile(
         if mode == RiskProfileMode.ml:
             raise HTTPException(status_code=400, detail=str(e)) from e
         raise HTTPException(status_code=404, detail=str(e)) from e
+
+
+@router.post(
+    "/risk-profile/batch",
+    response_model=RiskProfileBatchResponse,
+    responses={
+        401: {"model": ErrorResponse},
+        403: {"model": ErrorResponse},
+        400: {"model": ErrorResponse},
+        422: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+    },
+)
+def risk_profile_batch(request: RiskProfileBatchRequest) -> RiskProfileBatchResponse:
+    """Return rule-based or machine learning risk profiles for many tickers.
+
+    Histories are fetched in bulk, features are computed in one vectorized
+    pass and, in ``ml`` mode, the model is called once for all symbols.
+    Symbols that cannot be profiled are reported in ``errors`` instead of
+    failing the request.
+
+    Args:
+        request: Symbols, trailing day window and classification mode.
+
+    Returns:
+        Response with per-symbol profiles and per-symbol errors.
+
+    Raises:
+        HTTPException: 400 when ML model artifacts are unavailable.
+    """
+    symbols = [symbol.upper() for symbol in request.symbols]
+
+    try:
+        if request.mode == RiskProfileMode.ml:
+            profiles, errors = get_ml_risk_profiles(symbols, request.days)
+        else:
+            profiles, errors = get_risk_profiles(symbols, request.days)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    return RiskProfileBatchResponse(
+        days=request.days,
+        mode=request.mode,
+        profiles={
+            symbol: RiskProfileData(**profile_data)
+            for symbol, profile_data in profiles.items()
+        },
+        errors=errors,
+    )
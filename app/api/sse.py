@@ -0,0 +1,61 @@
+"""Server-Sent Events helpers for streaming LLM output.
+
+Every event carries a JSON ``data`` payload so multi-line text stays within
+one event. A stream emits optional metadata events, one ``token`` event per
+text delta (``{"text": ...}``), and ends with ``done`` or, if generation
+fails after the response has started, ``error`` (``{"detail": ...}``).
+"""
+
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import structlog
+from fastapi.responses import StreamingResponse
+
+logger = structlog.get_logger()
+
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    # Stop nginx-style proxies from buffering the stream.
+    "X-Accel-Buffering": "no",
+}
+
+
+def format_sse(event: str, data: Any) -> str:
+    """Encode one SSE event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _events(
+    tokens: AsyncIterator[str], prelude: list[tuple[str, Any]]
+) -> AsyncIterator[str]:
+    for event, data in prelude:
+        yield format_sse(event, data)
+    try:
+        async for text in tokens:
+            yield format_sse("token", {"text": text})
+    except Exception as e:
+        logger.warning("sse.stream_failed", error=str(e))
+        yield format_sse("error", {"detail": f"Generation failed: {e}"})
+        return
+    yield format_sse("done", {})
+
+
+def sse_response(
+    tokens: AsyncIterator[str], prelude: list[tuple[str, Any]] | None = None
+) -> StreamingResponse:
+    """Wrap a token iterator in a ``text/event-stream`` response.
+
+    Args:
+        tokens: Async iterator of text deltas.
+        prelude: ``(event, data)`` pairs sent before the first token.
+
+    Returns:
+        Streaming response relaying each delta as it arrives.
+    """
+    return StreamingResponse(
+        _events(tokens, prelude or []),
+        media_type="text/event-stream",
+        headers=_SSE_HEADERS,
+    )
@@ -0,0 +1,161 @@
+"""Benchmark HNSW recall@k and latency against exact search on PostgreSQL.
+
+Loads ``--rows`` synthetic 384-dimensional embeddings (clustered and
+L2-normalized, like sentence-transformer output) into an unlogged scratch
+table, builds the same HNSW index the migrations create, and compares
+nearest-neighbour results for each ``--ef-search`` value against an exact
+sequential scan.
+
+Run inside the backend container::
+
+    python -m app.benchmarks.vector_search --rows 1000000 --ef-search 40 100 200
+"""
+
+import argparse
+import io
+import time
+from collections.abc import Sequence
+
+import numpy as np
+from sqlalchemy import Connection, text
+
+from app.repositories.session import get_engine
+
+DIMENSIONS = 384
+TABLE = "bench_embeddings"
+_LOAD_CHUNK_ROWS = 20_000
+
+
+def clustered_vectors(
+    rng: np.random.Generator, count: int, centroids: np.ndarray, noise: float = 0.35
+) -> np.ndarray:
+    """Return ``count`` unit vectors scattered around random ``centroids``."""
+    picks = centroids[rng.integers(0, len(centroids), size=count)]
+    vectors = picks + rng.normal(scale=noise, size=picks.shape).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def recall_at_k(approximate: Sequence[int], exact: Sequence[int]) -> float:
+    """Return the fraction of exact neighbours found by the approximate search."""
+    if not exact:
+        return 1.0
+    return len(set(approximate) & set(exact)) / len(exact)
+
+
+def _vector_literal(vector: np.ndarray) -> str:
+    return "[" + ",".join(f"{v:.6f}" for v in vector) + "]"
+
+
+def _load_table(conn: Connection, rows: int, rng: np.random.Generator, centroids: np.ndarray) -> None:
+    conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+    conn.execute(
+        text(f"CREATE UNLOGGED TABLE {TABLE} (id bigserial PRIMARY KEY, embedding vector({DIMENSIONS}))")
+    )
+    cursor = conn.connection.driver_connection.cursor()
+    for offset in range(0, rows, _LOAD_CHUNK_ROWS):
+        count = min(_LOAD_CHUNK_ROWS, rows - offset)
+        buffer = io.StringIO()
+        for vector in clustered_vectors(rng, count, centroids):
+            buffer.write(_vector_literal(vector) + "\n")
+        buffer.seek(0)
+        cursor.copy_expert(f"COPY {TABLE} (embedding) FROM STDIN", buffer)
+    conn.commit()
+
+
+def _build_index(conn: Connection) -> float:
+    start = time.perf_counter()
+    conn.execute(text("SET maintenance_work_mem = '2GB'"))
+    conn.execute(
+        text(
+            f"CREATE INDEX {TABLE}_hnsw ON {TABLE} USING hnsw (embedding vector_cosine_ops) "
+            "WITH (m = 16, ef_construction = 64)"
+        )
+    )
+    conn.execute(text(f"ANALYZE {TABLE}"))
+    conn.commit()
+    return time.perf_counter() - start
+
+
+def _search(conn: Connection, query: np.ndarray, k: int, settings: dict[str, str]) -> tuple[list[int], float]:
+    """Run one top-k query under transaction-local ``settings``; return ids and seconds."""
+    with conn.begin():
+        for name, value in settings.items():
+            conn.execute(text("SELECT set_config(:name, :value, true)"), {"name": name, "value": value})
+        start = time.perf_counter()
+        ids = conn.execute(
+            text(f"SELECT id FROM {TABLE} ORDER BY embedding <=> CAST(:q AS vector) LIMIT :k"),
+            {"q": _vector_literal(query), "k": k},
+        ).scalars().all()
+        elapsed = time.perf_counter() - start
+    return list(ids), elapsed
+
+
+def run_benchmark(
+    rows: int,
+    queries: int,
+    k: int,
+    ef_values: Sequence[int],
+    seed: int = 42,
+    reuse: bool = False,
+) -> list[dict[str, float]]:
+    """Load data, build the index and return recall/latency per ``ef_search`` value."""
+    rng = np.random.default_rng(seed)
+    centroids = rng.normal(size=(max(rows // 1000, 1), DIMENSIONS)).astype(np.float32)
+    engine = get_engine()
+    if engine.dialect.name != "postgresql":
+        raise SystemExit("The vector benchmark requires DATABASE_URL to point at PostgreSQL.")
+
+    with engine.connect() as conn:
+        if not reuse:
+            start = time.perf_counter()
+            _load_table(conn, rows, rng, centroids)
+            print(f"Loaded {rows} rows in {time.perf_counter() - start:.1f}s")
+            print(f"Built HNSW index in {_build_index(conn):.1f}s")
+        conn.commit()
+
+        query_vectors = clustered_vectors(np.random.default_rng(seed + 1), queries, centroids)
+        exact_settings = {"enable_indexscan": "off"}
+        exact = [_search(conn, q, k, exact_settings) for q in query_vectors]
+        results = [
+            {
+                "ef_search": 0,
+                "recall": 1.0,
+                "p50_ms": float(np.percentile([t for _, t in exact], 50) * 1000),
+                "p95_ms": float(np.percentile([t for _, t in exact], 95) * 1000),
+            }
+        ]
+        for ef in ef_values:
+            settings = {"hnsw.ef_search": str(ef), "hnsw.iterative_scan": "off"}
+            approx = [_search(conn, q, k, settings) for q in query_vectors]
+            results.append(
+                {
+                    "ef_search": ef,
+                    "recall": float(
+                        np.mean([recall_at_k(a, e) for (a, _), (e, _) in zip(approx, exact)])
+                    ),
+                    "p50_ms": float(np.percentile([t for _, t in approx], 50) * 1000),
+                    "p95_ms": float(np.percentile([t for _, t in approx], 95) * 1000),
+                }
+            )
+    return results
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--ef-search", type=int, nargs="+", default=[40, 100, 200, 400])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reuse", action="store_true", help="Skip loading; reuse the existing table.")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.rows, args.queries, args.k, args.ef_search, args.seed, args.reuse)
+    print(f"{'search':>12} {'recall@' + str(args.k):>10} {'p50 ms':>9} {'p95 ms':>9}")
+    for row in results:
+        label = "exact" if row["ef_search"] == 0 else f"ef={row['ef_search']}"
+        print(f"{label:>12} {row['recall']:>10.3f} {row['p50_ms']:>9.2f} {row['p95_ms']:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
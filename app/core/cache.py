@@ -0,0 +1,156 @@
+"""Thread-safe in-process TTL cache with LRU eviction and single-flight loading.
+
+Concurrent misses for the same key share one ``loader`` call: the first caller
+runs it, later callers block until it finishes and receive the same value (or
+the same exception). Failures are never cached.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+V = TypeVar("V")
+
+
+class _InflightCall(Generic[V]):
+    """A loader call in progress that waiting callers can join."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: V | None = None
+        self.error: BaseException | None = None
+
+
+class TTLCache(Generic[V]):
+    """Bounded mapping whose entries expire ``ttl_seconds`` after being stored."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of live entries; least recently used
+                entries are evicted first. ``0`` disables storage (single-flight
+                coalescing still applies).
+            ttl_seconds: Lifetime of an entry after it is stored.
+            clock: Monotonic time source, injectable for tests.
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self._inflight: dict[Hashable, _InflightCall[V]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def get(self, key: Hashable) -> V | None:
+        """Return a live cached value without loading, or None."""
+        with self._lock:
+            value = self._lookup(key)
+            if value is None:
+                self.misses += 1
+            return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entry if full."""
+        with self._lock:
+            self._store(key, value)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], V]) -> V:
+        """Return the cached value for ``key``, calling ``loader`` at most once per miss.
+
+        Args:
+            key: Hashable cache key.
+            loader: Zero-argument callable producing the value on a miss.
+
+        Returns:
+            Cached or freshly loaded value.
+
+        Raises:
+            Exception: Whatever ``loader`` raised, re-raised in every joined caller.
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is not None:
+                return value
+            call = self._inflight.get(key)
+            leader = call is None
+            if call is None:
+                call = _InflightCall()
+                self._inflight[key] = call
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value  # type: ignore[return-value]
+
+        try:
+            value = loader()
+        except BaseException as e:
+            call.error = e
+            with self._lock:
+                self._inflight.pop(key, None)
+            call.done.set()
+            raise
+
+        call.value = value
+        with self._lock:
+            self._store(key, value)
+            self._inflight.pop(key, None)
+        call.done.set()
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.coalesced = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return hit, miss and coalesce counters plus the current entry count."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "size": len(self._entries),
+            }
+
+    def _lookup(self, key: Hashable) -> V | None:
+        """Return a live entry and mark it recently used; caller must hold the lock."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def _store(self, key: Hashable, value: V) -> None:
+        """Insert an entry and enforce the size bound; caller must hold the lock."""
+        if self._max_entries <= 0:
+            return
+        self._entries[key] = (self._clock() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
@@ -2,6 +2,7 @@
 
 import os
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -16,10 +17,48 @@ class Settings(BaseModel):
     log_level: str = Field(default="INFO")
     database_url: str = Field(default="sqlite:///./finai.db")
     api_key_salt: str = Field(default="change-me-in-production")
+    api_key_cache_ttl_seconds: float = Field(default=60.0, ge=0)
+    api_key_cache_max_entries: int = Field(default=10000, ge=0)
+    api_key_negative_cache_ttl_seconds: float = Field(default=5.0, ge=0)
+    api_key_negative_cache_max_entries: int = Field(default=1024, ge=0)
     model_path: str = Field(default="artifacts/risk_model.joblib")
     model_encoder_path: str = Field(default="artifacts/risk_label_encoder.joblib")
     groq_api_key: str = Field(default="")
     groq_model: str = Field(default="llama-3.1-8b-instant")
+    llm_timeout_seconds: float = Field(default=30.0, gt=0)
+    llm_connect_timeout_seconds: float = Field(default=5.0, gt=0)
+    llm_max_retries: int = Field(default=2, ge=0)
+    llm_max_connections: int = Field(default=20, ge=1)
+    llm_keepalive_seconds: float = Field(default=60.0, ge=0)
+    explanation_cache_ttl_seconds: float = Field(default=3600.0, ge=0)
+    explanation_cache_max_entries: int = Field(default=1024, ge=0)
+    explanation_cache_db: bool = Field(default=True)
+    answer_cache_similarity_threshold: float = Field(default=0.92, ge=-1, le=1)
+    answer_cache_max_entries_per_document: int = Field(default=256, ge=0)
+    answer_cache_max_documents: int = Field(default=128, ge=0)
+    metrics_batch_size: int = Field(default=100, ge=1)
+    metrics_flush_interval_seconds: float = Field(default=2.0, gt=0)
+    metrics_queue_max: int = Field(default=10000, ge=1)
+    metrics_rollup_interval_seconds: float = Field(default=300.0, gt=0)
+    ingestion_workers: int = Field(default=2, ge=0)
+    ingestion_poll_interval_seconds: float = Field(default=2.0, gt=0)
+    ingestion_job_lease_seconds: float = Field(default=900.0, gt=0)
+    ingestion_max_attempts: int = Field(default=3, ge=1)
+    ingest_batch_size: int = Field(default=256, ge=1)
+    pdf_extract_workers: int = Field(default=0, ge=0)
+    pdf_parallel_min_pages: int = Field(default=64, ge=1)
+    price_store_dir: str = Field(default="data/prices")
+    market_cache_ttl_seconds: float = Field(default=60.0, ge=0)
+    market_cache_max_entries: int = Field(default=1024, ge=0)
+    market_fetch_max_workers: int = Field(default=8, ge=1)
+    embedding_cache_max_entries: int = Field(default=10000, ge=0)
+    embedding_cache_path: str = Field(default="")
+    vector_backend: Literal["auto", "pgvector", "numpy"] = Field(default="auto")
+    vector_index_dir: str = Field(default="data/vectors")
+    vector_ef_search: int = Field(default=100, ge=1, le=1000)
+    vector_iterative_scan: Literal["off", "strict_order", "relaxed_order"] = Field(
+        default="strict_order"
+    )
 
 
 @lru_cache
@@ -32,6 +71,14 @@ def get_settings() -> Settings:
         log_level=os.getenv("LOG_LEVEL", "INFO"),
         database_url=os.getenv("DATABASE_URL", "sqlite:///./finai.db"),
         api_key_salt=os.getenv("API_KEY_SALT", "change-me-in-production"),
+        api_key_cache_ttl_seconds=float(os.getenv("API_KEY_CACHE_TTL_SECONDS", "60")),
+        api_key_cache_max_entries=int(os.getenv("API_KEY_CACHE_MAX_ENTRIES", "10000")),
+        api_key_negative_cache_ttl_seconds=float(
+            os.getenv("API_KEY_NEGATIVE_CACHE_TTL_SECONDS", "5")
+        ),
+        api_key_negative_cache_max_entries=int(
+            os.getenv("API_KEY_NEGATIVE_CACHE_MAX_ENTRIES", "1024")
+        ),
         model_path=os.getenv("MODEL_PATH", "artifacts/risk_model.joblib"),
         model_encoder_path=os.getenv(
             "MODEL_ENCODER_PATH",
@@ -39,4 +86,47 @@ def get_settings() -> Settings:
         ),
         groq_api_key=os.getenv("GROQ_API_KEY", ""),
         groq_model=os.getenv("GROQ_MODEL", "llama-3.1-8b-instant"),
+        llm_timeout_seconds=float(os.getenv("LLM_TIMEOUT_SECONDS", "30")),
+        llm_connect_timeout_seconds=float(os.getenv("LLM_CONNECT_TIMEOUT_SECONDS", "5")),
+        llm_max_retries=int(os.getenv("LLM_MAX_RETRIES", "2")),
+        llm_max_connections=int(os.getenv("LLM_MAX_CONNECTIONS", "20")),
+        llm_keepalive_seconds=float(os.getenv("LLM_KEEPALIVE_SECONDS", "60")),
+        explanation_cache_ttl_seconds=float(os.getenv("EXPLANATION_CACHE_TTL_SECONDS", "3600")),
+        explanation_cache_max_entries=int(os.getenv("EXPLANATION_CACHE_MAX_ENTRIES", "1024")),
+        explanation_cache_db=os.getenv("EXPLANATION_CACHE_DB", "true").lower()
+        in ("1", "true", "yes"),
+        answer_cache_similarity_threshold=float(
+            os.getenv("ANSWER_CACHE_SIMILARITY_THRESHOLD", "0.92")
+        ),
+        answer_cache_max_entries_per_document=int(
+            os.getenv("ANSWER_CACHE_MAX_ENTRIES_PER_DOCUMENT", "256")
+        ),
+        answer_cache_max_documents=int(os.getenv("ANSWER_CACHE_MAX_DOCUMENTS", "128")),
+        metrics_batch_size=int(os.getenv("METRICS_BATCH_SIZE", "100")),
+        metrics_flush_interval_seconds=float(
+            os.getenv("METRICS_FLUSH_INTERVAL_SECONDS", "2.0")
+        ),
+        metrics_queue_max=int(os.getenv("METRICS_QUEUE_MAX", "10000")),
+        metrics_rollup_interval_seconds=float(
+            os.getenv("METRICS_ROLLUP_INTERVAL_SECONDS", "300")
+        ),
+        ingestion_workers=int(os.getenv("INGESTION_WORKERS", "2")),
+        ingestion_poll_interval_seconds=float(
+            os.getenv("INGESTION_POLL_INTERVAL_SECONDS", "2.0")
+        ),
+        ingestion_job_lease_seconds=float(os.getenv("INGESTION_JOB_LEASE_SECONDS", "900")),
+        ingestion_max_attempts=int(os.getenv("INGESTION_MAX_ATTEMPTS", "3")),
+        ingest_batch_size=int(os.getenv("INGEST_BATCH_SIZE", "256")),
+        pdf_extract_workers=int(os.getenv("PDF_EXTRACT_WORKERS", "0")),
+        pdf_parallel_min_pages=int(os.getenv("PDF_PARALLEL_MIN_PAGES", "64")),
+        price_store_dir=os.getenv("PRICE_STORE_DIR", "data/prices"),
+        market_cache_ttl_seconds=float(os.getenv("MARKET_CACHE_TTL_SECONDS", "60")),
+        market_cache_max_entries=int(os.getenv("MARKET_CACHE_MAX_ENTRIES", "1024")),
+        market_fetch_max_workers=int(os.getenv("MARKET_FETCH_MAX_WORKERS", "8")),
+        embedding_cache_max_entries=int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "10000")),
+        embedding_cache_path=os.getenv("EMBEDDING_CACHE_PATH", ""),
+        vector_backend=os.getenv("VECTOR_BACKEND", "auto"),
+        vector_index_dir=os.getenv("VECTOR_INDEX_DIR", "data/vectors"),
+        vector_ef_search=int(os.getenv("VECTOR_EF_SEARCH", "100")),
+        vector_iterative_scan=os.getenv("VECTOR_ITERATIVE_SCAN", "strict_order"),
     )
@@ -0,0 +1,104 @@
+"""Mergeable fixed log-bucket latency histogram.
+
+Bucket ``i`` covers ``(BASE_MS * GROWTH**(i-1), BASE_MS * GROWTH**i]``; bucket 0
+holds everything up to ``BASE_MS``. Quantiles are reported at the bucket's
+geometric midpoint, so their relative error is bounded by ``sqrt(GROWTH) - 1``
+(about 2.5%). Histograms merge by adding counts, which lets hourly rollups
+be combined over any window.
+"""
+
+import math
+from collections.abc import Iterable, Mapping
+
+BASE_MS = 1.0
+GROWTH = 1.05
+_LOG_GROWTH = math.log(GROWTH)
+
+
+class LogHistogram:
+    """Sparse bucket-count histogram with min/max tracking."""
+
+    def __init__(
+        self,
+        counts: Mapping[int, int] | None = None,
+        minimum: float | None = None,
+        maximum: float | None = None,
+    ) -> None:
+        self.counts: dict[int, int] = dict(counts or {})
+        self.minimum = minimum
+        self.maximum = maximum
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def add(self, value_ms: float) -> None:
+        """Record one observation."""
+        index = bucket_index(value_ms)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.minimum = value_ms if self.minimum is None else min(self.minimum, value_ms)
+        self.maximum = value_ms if self.maximum is None else max(self.maximum, value_ms)
+
+    def add_all(self, values_ms: Iterable[float]) -> None:
+        """Record many observations."""
+        for value in values_ms:
+            self.add(value)
+
+    def merge(self, other: "LogHistogram") -> None:
+        """Add another histogram's counts into this one."""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        if other.minimum is not None:
+            self.minimum = other.minimum if self.minimum is None else min(self.minimum, other.minimum)
+        if other.maximum is not None:
+            self.maximum = other.maximum if self.maximum is None else max(self.maximum, other.maximum)
+
+    def quantile(self, q: float) -> float | None:
+        """Return the approximate ``q`` quantile (0 ≤ q ≤ 1), or None when empty."""
+        total = self.total
+        if total == 0:
+            return None
+        if q <= 0 and self.minimum is not None:
+            return self.minimum
+        if q >= 1 and self.maximum is not None:
+            return self.maximum
+        rank = q * (total - 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen > rank:
+                value = bucket_midpoint(index)
+                if self.minimum is not None:
+                    value = max(value, self.minimum)
+                if self.maximum is not None:
+                    value = min(value, self.maximum)
+                return value
+        return self.maximum
+
+    def to_json(self) -> dict[str, int]:
+        """Return counts in a JSON-serializable form (string bucket keys)."""
+        return {str(index): count for index, count in sorted(self.counts.items())}
+
+    @classmethod
+    def from_json(
+        cls,
+        counts: Mapping[str, int],
+        minimum: float | None = None,
+        maximum: float | None = None,
+    ) -> "LogHistogram":
+        """Rebuild a histogram from ``to_json`` output."""
+        return cls({int(index): count for index, count in counts.items()}, minimum, maximum)
+
+
+def bucket_index(value_ms: float) -> int:
+    """Return the bucket holding ``value_ms``."""
+    if value_ms <= BASE_MS:
+        return 0
+    return math.ceil(math.log(value_ms / BASE_MS) / _LOG_GROWTH)
+
+
+def bucket_midpoint(index: int) -> float:
+    """Return the geometric midpoint of a bucket."""
+    if index == 0:
+        return BASE_MS
+    return BASE_MS * GROWTH ** (index - 0.5)
@@ -0,0 +1,12 @@
+"""Document ingestion job states."""
+
+from enum import Enum
+
+
+class IngestionStatus(str, Enum):
+    """Lifecycle of a background document ingestion job."""
+
+    queued = "queued"
+    running = "running"
+    succeeded = "succeeded"
+    failed = "failed"
@@ -1,5 +1,6 @@
 """Pure financial metric computations — no I/O, no dependencies on infrastructure."""
 
+import numpy as np
 import pandas as pd
 
 
@@ -38,3 +39,70 @@ def compute_max_drawdown(df: pd.DataFrame) -> float:
     cumulative_max = df["Close"].cummax()
     drawdown = (df["Close"] - cumulative_max) / cumulative_max
     return float(drawdown.min())
+
+
+def compute_metrics_matrix(prices: pd.DataFrame | np.ndarray) -> pd.DataFrame:
+    """Compute volatility, max drawdown and mean return for every column at once.
+
+    Vectorized equivalent of running ``compute_returns``, ``compute_volatility``,
+    ``compute_max_drawdown`` and ``returns.mean()`` per symbol. Each column is
+    evaluated over its own non-NaN prices, so ragged histories (late listings,
+    exchange-specific holidays) produce the same figures as the scalar path,
+    up to floating-point summation order.
+
+    Args:
+        prices: Close-price matrix shaped ``dates × symbols``.
+
+    Returns:
+        DataFrame indexed by symbol (column label) with ``volatility``,
+        ``max_drawdown`` and ``mean_return`` columns. Symbols with fewer than
+        two prices get NaN volatility and mean return.
+    """
+    if isinstance(prices, pd.DataFrame):
+        labels = prices.columns
+        values = prices.to_numpy(dtype=np.float64)
+    else:
+        values = np.asarray(prices, dtype=np.float64)
+        labels = pd.RangeIndex(values.shape[1])
+
+    # Work symbols × dates so every reduction runs over a contiguous row,
+    # matching the 1-D reductions pandas performs for a single Series.
+    close = _compact_rows(np.ascontiguousarray(values.T))
+    n_symbols, n_dates = close.shape
+
+    returns = np.full_like(close, np.nan)
+    if n_dates > 1:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns[:, 1:] = close[:, 1:] / close[:, :-1] - 1
+
+    valid = ~np.isnan(returns)
+    count = valid.sum(axis=1)
+    filled = np.where(valid, returns, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_return = np.where(count > 0, filled.sum(axis=1) / count, np.nan)
+        squared = np.where(valid, (mean_return[:, None] - filled) ** 2, 0.0)
+        variance = np.where(count > 1, squared.sum(axis=1) / (count - 1), np.nan)
+    volatility = np.sqrt(variance)
+
+    cumulative_max = np.fmax.accumulate(close, axis=1) if n_dates else close
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdown = (close - cumulative_max) / cumulative_max
+    has_price = (~np.isnan(close)).any(axis=1)
+    max_drawdown = np.full(n_symbols, np.nan)
+    if has_price.any():
+        max_drawdown[has_price] = np.nanmin(drawdown[has_price], axis=1)
+
+    return pd.DataFrame(
+        {
+            "volatility": volatility,
+            "max_drawdown": max_drawdown,
+            "mean_return": mean_return,
+        },
+        index=labels,
+    )
+
+
+def _compact_rows(values: np.ndarray) -> np.ndarray:
+    """Shift each row's non-NaN entries to the front, preserving their order."""
+    order = np.argsort(np.isnan(values), axis=1, kind="stable")
+    return np.take_along_axis(values, order, axis=1)
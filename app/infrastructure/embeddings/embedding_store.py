@@ -0,0 +1,106 @@
+"""Persistent embedding store — a single-table SQLite file keyed by content hash.
+
+Vectors are stored as raw ``float32`` bytes, which round-trips the output of
+sentence-transformers exactly. The store is a cache: a missing or corrupt
+file only costs recomputation, so I/O errors are logged and treated as misses.
+The entry count is read once when the file is opened and then tracked on
+insert, so ``stats()`` never scans the table; rows written by other
+processes afterwards are not reflected.
+"""
+
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# SQLite limits the number of bound parameters per statement.
+_MAX_KEYS_PER_QUERY = 500
+
+
+class EmbeddingStore:
+    """Thread-safe on-disk key → embedding mapping."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use; caller must hold the lock."""
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._size = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            self._conn = conn
+        return self._conn
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, list[float]]:
+        """Return stored vectors for the keys that are present."""
+        keys = list(dict.fromkeys(keys))
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            try:
+                conn = self._connect()
+                for offset in range(0, len(keys), _MAX_KEYS_PER_QUERY):
+                    batch = keys[offset : offset + _MAX_KEYS_PER_QUERY]
+                    placeholders = ",".join("?" * len(batch))
+                    rows = conn.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                        batch,
+                    )
+                    for key, blob in rows:
+                        found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+            except sqlite3.Error:
+                logger.warning("Embedding store read failed at %s", self._path, exc_info=True)
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, vectors: Mapping[str, list[float]]) -> None:
+        """Store vectors; keys already present are kept, as keys address content."""
+        if not vectors:
+            return
+        rows = [
+            (key, np.asarray(vector, dtype=np.float32).tobytes())
+            for key, vector in vectors.items()
+        ]
+        with self._lock:
+            try:
+                conn = self._connect()
+                before = conn.total_changes
+                with conn:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO embeddings (key, vector) VALUES (?, ?)", rows
+                    )
+                self._size += conn.total_changes - before
+            except sqlite3.Error:
+                logger.warning("Embedding store write failed at %s", self._path, exc_info=True)
+
+    def size(self) -> int:
+        """Return the number of stored vectors without querying the file."""
+        with self._lock:
+            return self._size
+
+    def stats(self) -> dict[str, int]:
+        """Return hit and miss counters plus the stored entry count."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "coalesced": 0, "size": self._size}
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
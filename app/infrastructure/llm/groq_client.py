@@ -0,0 +1,79 @@
+"""Process-wide Groq clients (OpenAI-compatible API) with pooled keep-alive connections.
+
+Building an ``OpenAI`` client per call opens a fresh connection pool, so
+every request paid a TCP + TLS handshake to api.groq.com. The clients here
+are created once per process and reused; the SDK retries connection
+errors, 408/409/429 and 5xx responses with exponential backoff and jitter
+up to ``LLM_MAX_RETRIES`` times.
+"""
+
+from functools import lru_cache
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+
+from app.core.config import get_settings
+
+GROQ_BASE_URL = "https://api.groq.com/openai/v1"
+
+
+def _timeout() -> httpx.Timeout:
+    settings = get_settings()
+    return httpx.Timeout(settings.llm_timeout_seconds, connect=settings.llm_connect_timeout_seconds)
+
+
+def _limits() -> httpx.Limits:
+    settings = get_settings()
+    return httpx.Limits(
+        max_connections=settings.llm_max_connections,
+        max_keepalive_connections=settings.llm_max_connections,
+        keepalive_expiry=settings.llm_keepalive_seconds,
+    )
+
+
+@lru_cache
+def get_llm_client() -> OpenAI:
+    """Return the shared synchronous Groq client.
+
+    Raises:
+        ValueError: If ``GROQ_API_KEY`` is not configured.
+    """
+    settings = get_settings()
+    if not settings.groq_api_key:
+        raise ValueError("GROQ_API_KEY is not set. Add it to your .env file to use this endpoint.")
+    return OpenAI(
+        api_key=settings.groq_api_key,
+        base_url=GROQ_BASE_URL,
+        timeout=_timeout(),
+        max_retries=settings.llm_max_retries,
+        http_client=DefaultHttpxClient(limits=_limits(), timeout=_timeout()),
+    )
+
+
+@lru_cache
+def get_async_llm_client() -> AsyncOpenAI:
+    """Return the shared asynchronous Groq client for use on the event loop.
+
+    Raises:
+        ValueError: If ``GROQ_API_KEY`` is not configured.
+    """
+    settings = get_settings()
+    if not settings.groq_api_key:
+        raise ValueError("GROQ_API_KEY is not set. Add it to your .env file to use this endpoint.")
+    return AsyncOpenAI(
+        api_key=settings.groq_api_key,
+        base_url=GROQ_BASE_URL,
+        timeout=_timeout(),
+        max_retries=settings.llm_max_retries,
+        http_client=DefaultAsyncHttpxClient(limits=_limits(), timeout=_timeout()),
+    )
+
+
+async def close_llm_clients() -> None:
+    """Close whichever shared clients were created and forget them."""
+    if get_llm_client.cache_info().currsize:
+        get_llm_client().close()
+    if get_async_llm_client.cache_info().currsize:
+        await get_async_llm_client().close()
+    get_llm_client.cache_clear()
+    get_async_llm_client.cache_clear()
@@ -0,0 +1,151 @@
+"""Local OHLCV store — per-symbol memory-mapped NumPy files under a configurable directory.
+
+Each symbol is persisted as two files:
+
+- ``<SYMBOL>.npy``: structured array of daily bars sorted by date.
+- ``<SYMBOL>.json``: coverage metadata (``covered_from`` / ``fetched_through``).
+
+Coverage is tracked separately from the bars because weekends and holidays
+mean the first stored bar rarely coincides with the first requested day.
+"""
+
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ("Open", "High", "Low", "Close", "Volume")
+
+_BAR_DTYPE = np.dtype([("date", "datetime64[D]")] + [(col, "f8") for col in OHLCV_COLUMNS])
+
+
+@dataclass(frozen=True)
+class Coverage:
+    """Calendar window for which a symbol's bars are known to be complete."""
+
+    covered_from: date
+    fetched_through: date
+
+
+class PriceStore:
+    """Append-only daily bar store backed by memory-mapped ``.npy`` files."""
+
+    def __init__(self, root: str | Path) -> None:
+        self._root = Path(root)
+        self._lock = threading.Lock()
+
+    def _data_path(self, symbol: str) -> Path:
+        return self._root / f"{symbol}.npy"
+
+    def _meta_path(self, symbol: str) -> Path:
+        return self._root / f"{symbol}.json"
+
+    def coverage(self, symbol: str) -> Coverage | None:
+        """Return the stored coverage window for ``symbol``, or None if unknown."""
+        meta_path = self._meta_path(symbol)
+        if not meta_path.exists() or not self._data_path(symbol).exists():
+            return None
+        try:
+            meta = json.loads(meta_path.read_text())
+            return Coverage(
+                covered_from=date.fromisoformat(meta["covered_from"]),
+                fetched_through=date.fromisoformat(meta["fetched_through"]),
+            )
+        except (ValueError, KeyError) as e:
+            logger.warning("Ignoring corrupt price store metadata for %s: %s", symbol, e)
+            return None
+
+    def read(self, symbol: str, start: date) -> pd.DataFrame:
+        """Return stored OHLCV bars on or after ``start`` as a DataFrame.
+
+        Args:
+            symbol: Asset ticker symbol.
+            start: First calendar day to include.
+
+        Returns:
+            DataFrame with OHLCV columns indexed by date; empty if nothing is stored.
+        """
+        path = self._data_path(symbol)
+        if not path.exists():
+            return _to_frame(np.empty(0, dtype=_BAR_DTYPE))
+
+        bars = np.load(path, mmap_mode="r")
+        offset = int(np.searchsorted(bars["date"], np.datetime64(start, "D"), side="left"))
+        return _to_frame(np.array(bars[offset:]))
+
+    def append(
+        self,
+        symbol: str,
+        frame: pd.DataFrame,
+        covered_from: date,
+        fetched_through: date,
+    ) -> None:
+        """Merge freshly downloaded bars into the store and widen its coverage.
+
+        Bars in ``frame`` replace stored bars for the same date, so re-fetching
+        the last stored day picks up a finalized close.
+
+        Args:
+            symbol: Asset ticker symbol.
+            frame: yfinance history DataFrame (any subset of OHLCV columns).
+            covered_from: First calendar day the download was requested for.
+            fetched_through: Calendar day the download was made on.
+        """
+        with self._lock:
+            existing = self.coverage(symbol)
+            if frame.empty and existing is None:
+                return
+
+            if existing is not None:
+                stored = np.load(self._data_path(symbol))
+                covered_from = min(covered_from, existing.covered_from)
+                fetched_through = max(fetched_through, existing.fetched_through)
+            else:
+                stored = np.empty(0, dtype=_BAR_DTYPE)
+
+            fresh = _to_bars(frame)
+            keep = ~np.isin(stored["date"], fresh["date"])
+            merged = np.concatenate([stored[keep], fresh])
+            merged = merged[np.argsort(merged["date"], kind="stable")]
+
+            self._root.mkdir(parents=True, exist_ok=True)
+            _atomic_write(self._data_path(symbol), lambda fh: np.save(fh, merged))
+            meta = {
+                "covered_from": covered_from.isoformat(),
+                "fetched_through": fetched_through.isoformat(),
+            }
+            _atomic_write(self._meta_path(symbol), lambda fh: fh.write(json.dumps(meta).encode()))
+
+
+def _to_bars(frame: pd.DataFrame) -> np.ndarray:
+    """Convert a yfinance history frame into a structured bar array."""
+    bars = np.empty(len(frame), dtype=_BAR_DTYPE)
+    index = pd.DatetimeIndex(frame.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    bars["date"] = index.normalize().values.astype("datetime64[D]")
+    for col in OHLCV_COLUMNS:
+        bars[col] = frame[col].to_numpy(dtype="f8") if col in frame else np.nan
+    return bars
+
+
+def _to_frame(bars: np.ndarray) -> pd.DataFrame:
+    """Convert a structured bar array into an OHLCV DataFrame indexed by date."""
+    index = pd.DatetimeIndex(bars["date"].astype("datetime64[ns]"), name="Date")
+    return pd.DataFrame({col: bars[col] for col in OHLCV_COLUMNS}, index=index)
+
+
+def _atomic_write(path: Path, write) -> None:
+    """Write ``path`` via a temp file and rename so readers never see partial data."""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "wb") as fh:
+        write(fh)
+    os.replace(tmp_path, path)
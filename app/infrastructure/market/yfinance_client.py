@@ -1,15 +1,87 @@
-"""yfinance adapter — isolates all external market data I/O in one place."""
+"""yfinance adapter — isolates all external market data I/O in one place.
+
+``fetch_price`` and ``fetch_history`` are fronted by in-process TTL caches with
+single-flight loading, so concurrent requests for the same symbol and window
+share one upstream call.
+"""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from functools import lru_cache
 
 import pandas as pd
 import yfinance as yf
 
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.infrastructure.market.price_store import PriceStore
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class HistoryBatch:
+    """Result of a multi-symbol history download.
+
+    Attributes:
+        frames: ``Close`` DataFrame per successfully fetched symbol.
+        errors: Error message per symbol that could not be fetched.
+    """
+
+    frames: dict[str, pd.DataFrame] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+
+    def close_matrix(self) -> pd.DataFrame:
+        """Return closes as one wide frame (dates × symbols) aligned on the union of dates.
+
+        Symbols with shorter histories are padded with NaN.
+        """
+        if not self.frames:
+            return pd.DataFrame()
+        return pd.concat(
+            {symbol: frame["Close"] for symbol, frame in self.frames.items()}, axis=1
+        ).sort_index()
+
+
+@lru_cache
+def _get_price_store() -> PriceStore | None:
+    """Return the local OHLCV store, or None when ``PRICE_STORE_DIR`` is empty."""
+
+    settings = get_settings()
+    if not settings.price_store_dir:
+        return None
+    return PriceStore(settings.price_store_dir)
+
+
+@lru_cache
+def _get_price_cache() -> TTLCache[float]:
+    """Return the process-wide latest-price cache keyed by symbol."""
+
+    settings = get_settings()
+    return TTLCache(settings.market_cache_max_entries, settings.market_cache_ttl_seconds)
+
+
+@lru_cache
+def _get_history_cache() -> TTLCache[pd.DataFrame]:
+    """Return the process-wide history cache keyed by ``(symbol, days)``."""
+
+    settings = get_settings()
+    return TTLCache(settings.market_cache_max_entries, settings.market_cache_ttl_seconds)
+
+
+def market_cache_stats() -> dict[str, dict[str, int]]:
+    """Return hit, miss and coalesce counters for the market data caches."""
+
+    return {
+        "price": _get_price_cache().stats(),
+        "history": _get_history_cache().stats(),
+    }
+
+
 def fetch_price(symbol: str) -> float:
-    """Return the latest close price for a ticker symbol.
+    """Return the latest close price for a ticker symbol (cached).
 
     Args:
         symbol: Asset ticker (for example, ``"AAPL"``).
@@ -20,6 +92,11 @@ def fetch_price(symbol: str) -> float:
     Raises:
         ValueError: No market data was returned for ``symbol``.
     """
+    return _get_price_cache().get_or_load(symbol, lambda: _download_price(symbol))
+
+
+def _download_price(symbol: str) -> float:
+    """Fetch the latest close price from Yahoo, bypassing the cache."""
     logger.debug("Fetching latest price for %s", symbol)
     ticker = yf.Ticker(symbol)
     data = ticker.history(period="1d")
@@ -31,8 +108,44 @@ def fetch_price(symbol: str) -> float:
     return float(data["Close"].iloc[-1])
 
 
+def _fetch_history_via_store(store: PriceStore, symbol: str, days: int) -> pd.DataFrame:
+    """Serve a trailing window from the local store, downloading only what is missing.
+
+    A window that starts before the stored coverage is downloaded in full;
+    otherwise only the days since the last download are requested (the last
+    stored day is re-fetched so a partial intraday bar gets finalized).
+    """
+    today = date.today()
+    start = today - timedelta(days=days)
+    coverage = store.coverage(symbol)
+
+    if coverage is None or coverage.covered_from > start:
+        logger.debug("Price store miss for %s — downloading %d days", symbol, days)
+        fresh = yf.Ticker(symbol).history(period=f"{days}d")
+        store.append(symbol, fresh, covered_from=start, fetched_through=today)
+    elif coverage.fetched_through < today:
+        logger.debug(
+            "Price store stale for %s — downloading bars since %s",
+            symbol,
+            coverage.fetched_through,
+        )
+        fresh = yf.Ticker(symbol).history(
+            start=coverage.fetched_through.isoformat(),
+            end=(today + timedelta(days=1)).isoformat(),
+        )
+        store.append(
+            symbol, fresh, covered_from=coverage.covered_from, fetched_through=today
+        )
+
+    return store.read(symbol, start)
+
+
 def fetch_history(symbol: str, days: int) -> pd.DataFrame:
-    """Return trailing historical close prices for a ticker.
+    """Return trailing historical close prices for a ticker (cached).
+
+    Reads from the local OHLCV store first when ``PRICE_STORE_DIR`` is set,
+    so repeat windows are served from disk without hitting Yahoo. The
+    returned frame is a copy and may be modified by the caller.
 
     Args:
         symbol: Asset ticker symbol.
@@ -44,9 +157,20 @@ def fetch_history(symbol: str, days: int) -> pd.DataFrame:
     Raises:
         ValueError: No historical data was returned for ``symbol``.
     """
+    cached = _get_history_cache().get_or_load(
+        (symbol, days), lambda: _load_history(symbol, days)
+    )
+    return cached.copy()
+
+
+def _load_history(symbol: str, days: int) -> pd.DataFrame:
+    """Load a trailing close-price window from the store or Yahoo, bypassing the cache."""
     logger.debug("Fetching %d-day price history for %s", days, symbol)
-    ticker = yf.Ticker(symbol)
-    data = ticker.history(period=f"{days}d")
+    store = _get_price_store()
+    if store is None:
+        data = yf.Ticker(symbol).history(period=f"{days}d")
+    else:
+        data = _fetch_history_via_store(store, symbol, days)
 
     if data.empty:
         logger.warning(
@@ -57,3 +181,43 @@ def fetch_history(symbol: str, days: int) -> pd.DataFrame:
         raise ValueError(f"No historical data for symbol {symbol}")
 
     return data[["Close"]]
+
+
+def fetch_history_many(symbols: list[str], days: int) -> HistoryBatch:
+    """Fetch trailing close-price history for many tickers concurrently.
+
+    Each symbol goes through ``fetch_history`` on a bounded thread pool, so
+    the local store and in-process cache are shared with single-symbol calls.
+    A failing symbol is recorded in ``errors`` and does not abort the batch.
+
+    Args:
+        symbols: Asset ticker symbols; duplicates are fetched once.
+        days: Number of trailing calendar days to request per symbol.
+
+    Returns:
+        ``HistoryBatch`` with per-symbol frames and errors, in input order.
+    """
+    unique_symbols = list(dict.fromkeys(symbols))
+    batch = HistoryBatch()
+    if not unique_symbols:
+        return batch
+
+    workers = min(get_settings().market_fetch_max_workers, len(unique_symbols))
+    logger.debug(
+        "Fetching %d-day history for %d symbols (workers=%d)",
+        days,
+        len(unique_symbols),
+        workers,
+    )
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            symbol: pool.submit(fetch_history, symbol, days) for symbol in unique_symbols
+        }
+        for symbol, future in futures.items():
+            try:
+                batch.frames[symbol] = future.result()
+            except Exception as e:
+                logger.warning("History fetch failed for %s: %s", symbol, e)
+                batch.errors[symbol] = str(e)
+
+    return batch
@@ -0,0 +1,161 @@
+"""PDF page text extraction, fanned out across a process pool for large files.
+
+``pypdf`` text extraction is CPU-bound pure Python, so threads do not help.
+PDFs with at least ``PDF_PARALLEL_MIN_PAGES`` pages are written once to a
+temporary file, and each worker process memory-maps it and extracts a
+contiguous page range, so the upload is never pickled per task. Smaller PDFs,
+or a pool size of 1, stay in-process. Pages are yielded in page order.
+"""
+
+import io
+import logging
+import math
+import mmap
+import multiprocessing
+import os
+import tempfile
+import threading
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+
+from pypdf import PdfReader
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Pages per task: small enough to balance load, large enough to amortize
+# re-parsing the document structure in each task.
+_MIN_PAGES_PER_TASK = 8
+_TASKS_PER_WORKER = 4
+# Default pool size cap: each spawned worker re-imports pypdf and the app
+# config, and CPU counts ignore container CPU quotas.
+_DEFAULT_MAX_WORKERS = 4
+
+_pool_lock = threading.Lock()
+_pool: ProcessPoolExecutor | None = None
+
+
+def _available_cpus() -> int:
+    """Return the CPUs this process may run on (not the host's total, where supported)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _pool_size() -> int:
+    configured = get_settings().pdf_extract_workers
+    if configured > 0:
+        return configured
+    return max(1, min(_available_cpus(), _DEFAULT_MAX_WORKERS))
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # "spawn" avoids forking a process that already runs request and
+            # background threads.
+            _pool = ProcessPoolExecutor(
+                max_workers=_pool_size(), mp_context=multiprocessing.get_context("spawn")
+            )
+        return _pool
+
+
+def shutdown_pdf_extraction_pool() -> None:
+    """Stop the worker processes, if any were started."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _extract_page_range(path: str, start: int, stop: int) -> list[str]:
+    """Extract pages ``[start, stop)`` from a memory-mapped PDF (runs in a worker)."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        reader = PdfReader(mapped)
+        return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def _iter_serial(
+    reader: PdfReader, start: int, progress: Callable[[int, int], None] | None
+) -> Iterator[str]:
+    total = len(reader.pages)
+    for index in range(start, total):
+        yield reader.pages[index].extract_text() or ""
+        if progress is not None:
+            progress(total, index + 1)
+
+
+def _iter_parallel(
+    file_bytes: bytes,
+    total: int,
+    workers: int,
+    progress: Callable[[int, int], None] | None,
+    done: list[int],
+) -> Iterator[str]:
+    """Yield pages from worker processes, keeping at most two ranges per worker in flight.
+
+    ``done[0]`` tracks pages already yielded so a caller can resume after a failure.
+    """
+    per_task = max(_MIN_PAGES_PER_TASK, math.ceil(total / (workers * _TASKS_PER_WORKER)))
+    ranges = iter([(start, min(start + per_task, total)) for start in range(0, total, per_task)])
+
+    fd, path = tempfile.mkstemp(suffix=".pdf")
+    pending: deque[Future[list[str]]] = deque()
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(file_bytes)
+        pool = _get_pool()
+        for start, stop in islice(ranges, workers * 2):
+            pending.append(pool.submit(_extract_page_range, path, start, stop))
+        while pending:
+            pages = pending.popleft().result()
+            next_range = next(ranges, None)
+            if next_range is not None:
+                pending.append(pool.submit(_extract_page_range, path, *next_range))
+            for text in pages:
+                yield text
+                done[0] += 1
+            if progress is not None:
+                progress(total, done[0])
+    finally:
+        for future in pending:
+            future.cancel()
+        os.unlink(path)
+
+
+def iter_pdf_pages(
+    file_bytes: bytes, progress: Callable[[int, int], None] | None = None
+) -> Iterator[str]:
+    """Yield the text of every page of a PDF, in page order.
+
+    Only a bounded number of page ranges is extracted ahead of the consumer,
+    so memory stays flat however many pages the PDF has.
+
+    Args:
+        file_bytes: Raw PDF content.
+        progress: Optional callback receiving ``(pages_total, pages_extracted)``.
+
+    Yields:
+        One string per page; pages without a text layer yield ``""``.
+    """
+    reader = PdfReader(io.BytesIO(file_bytes))
+    total = len(reader.pages)
+    workers = min(_pool_size(), math.ceil(total / _MIN_PAGES_PER_TASK))
+    if total < get_settings().pdf_parallel_min_pages or workers <= 1:
+        yield from _iter_serial(reader, 0, progress)
+        return
+
+    done = [0]
+    try:
+        yield from _iter_parallel(file_bytes, total, workers, progress, done)
+    except (BrokenProcessPool, OSError) as e:
+        logger.warning("PDF extraction pool unavailable, extracting in-process: %s", e)
+        shutdown_pdf_extraction_pool()
+        yield from _iter_serial(reader, done[0], progress)
+
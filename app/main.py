@@ -7,6 +7,8 @@ systems.
 """
 
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
@@ -20,16 +22,38 @@ from app.api.risk_profile import router as risk_profile_router
 from app.api.risk_search import router as risk_search_router
 from app.api.documents import router as documents_router
 from app.api.metrics import router as metrics_router
+from app.infrastructure.llm.groq_client import close_llm_clients
+from app.infrastructure.pdf.page_extractor import shutdown_pdf_extraction_pool
 from app.schemas.errors import ErrorDetail, ErrorResponse
 from app.schemas.risk import HealthResponse
 from app.security.api_key import require_api_key
+from app.services.ingestion_jobs import get_ingestion_worker_pool
+from app.services.metrics_logger import shutdown_metrics_writer
+from app.services.metrics_rollup import get_metrics_rollup_job
 
 settings = get_settings()
 configure_logging(settings.log_level)
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title=settings.app_name)
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """Start background jobs on startup and drain them on shutdown."""
+
+    rollup_job = get_metrics_rollup_job()
+    rollup_job.start()
+    ingestion_pool = get_ingestion_worker_pool()
+    ingestion_pool.start()
+    yield
+    ingestion_pool.stop(timeout=10.0)
+    shutdown_pdf_extraction_pool()
+    rollup_job.stop(timeout=10.0)
+    shutdown_metrics_writer()
+    await close_llm_clients()
+
+
+app = FastAPI(title=settings.app_name, lifespan=lifespan)
 
 protected_dependencies = [Depends(require_api_key)]
 
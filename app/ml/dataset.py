@@ -1,15 +1,20 @@
+import logging
+
 import pandas as pd
-from app.infrastructure.market.yfinance_client import fetch_history
-from app.domain.metrics import (
-    compute_returns,
-    compute_volatility,
-    compute_max_drawdown,
-)
+from app.infrastructure.market.yfinance_client import fetch_history_many
+from app.domain.metrics import compute_metrics_matrix
 from app.domain.scoring import classify_risk
 
+logger = logging.getLogger(__name__)
+
+
 def build_dataset(symbols: list[str], days: int = 180) -> pd.DataFrame:
     """Build a labeled training dataset from ticker history.
 
+    Histories are downloaded concurrently and features for all symbols are
+    computed in one vectorized pass; symbols that fail to fetch are logged
+    and left out of the dataset.
+
     Args:
         symbols: Ticker symbols to include.
         days: Number of trailing days used per symbol.
@@ -17,24 +22,21 @@ def build_dataset(symbols: list[str], days: int = 180) -> pd.DataFrame:
     Returns:
         DataFrame with engineered features and rule-based label.
     """
-    rows = []
+    batch = fetch_history_many(symbols, days)
+    if batch.errors:
+        logger.warning("Skipping %d symbols without history: %s", len(batch.errors), batch.errors)
 
-    for symbol in symbols:
-        df = fetch_history(symbol, days)
-        returns = compute_returns(df)
+    features = compute_metrics_matrix(batch.close_matrix())
 
-        volatility = compute_volatility(returns)
-        max_drawdown = compute_max_drawdown(df)
-        mean_return = float(returns.mean())
-
-        label = classify_risk(volatility, max_drawdown)
-
-        rows.append({
+    rows = [
+        {
             "symbol": symbol,
-            "volatility": volatility,
-            "max_drawdown": max_drawdown,
-            "mean_return": mean_return,
-            "label": label
-        })
-        
-    return pd.DataFrame(rows)
+            "volatility": float(row.volatility),
+            "max_drawdown": float(row.max_drawdown),
+            "mean_return": float(row.mean_return),
+            "label": classify_risk(row.volatility, row.max_drawdown),
+        }
+        for symbol, row in features.iterrows()
+    ]
+
+    return pd.DataFrame(rows, columns=["symbol", "volatility", "max_drawdown", "mean_return", "label"])
@@ -1,3 +1,9 @@
+import numpy as np
+import pandas as pd
+
+FEATURE_COLUMNS = ("volatility", "max_drawdown", "mean_return")
+
+
 class RiskModel:
     """Wrapper for the trained estimator and label encoder."""
 
@@ -21,10 +27,45 @@ class RiskModel:
         Returns:
             Decoded risk label.
         """
-        X = [[
-            features["volatility"],
-            features["max_drawdown"],
-            features["mean_return"]
-        ]]
-        y_pred = self.model.predict(X)
-        return self.encoder.inverse_transform(y_pred)[0]
+        X = np.array([[features[column] for column in FEATURE_COLUMNS]], dtype=np.float64)
+        return str(self.predict_batch(X)[0])
+
+    def predict_batch(self, features: pd.DataFrame | np.ndarray) -> np.ndarray:
+        """Predict decoded risk labels for many feature rows in one estimator call.
+
+        Args:
+            features: DataFrame with ``volatility``, ``max_drawdown`` and
+                ``mean_return`` columns, or an ``(n, 3)`` array in that order.
+
+        Returns:
+            Array of decoded risk labels, one per input row.
+        """
+        X = _to_feature_matrix(features)
+        if len(X) == 0:
+            return np.empty(0, dtype=object)
+        return self.encoder.inverse_transform(self.model.predict(X))
+
+    def predict_proba(self, features: pd.DataFrame | np.ndarray) -> pd.DataFrame:
+        """Return class probabilities for many feature rows in one estimator call.
+
+        Args:
+            features: Same layout as ``predict_batch``.
+
+        Returns:
+            DataFrame with one row per input row and one column per decoded
+            risk label.
+        """
+        X = _to_feature_matrix(features)
+        labels = self.encoder.inverse_transform(self.model.classes_)
+        if len(X) == 0:
+            return pd.DataFrame(columns=labels, dtype=np.float64)
+        index = features.index if isinstance(features, pd.DataFrame) else None
+        return pd.DataFrame(self.model.predict_proba(X), columns=labels, index=index)
+
+
+def _to_feature_matrix(features: pd.DataFrame | np.ndarray) -> np.ndarray:
+    """Return a contiguous ``(n, 3)`` float matrix in ``FEATURE_COLUMNS`` order."""
+    if isinstance(features, pd.DataFrame):
+        return features[list(FEATURE_COLUMNS)].to_numpy(dtype=np.float64)
+    X = np.asarray(features, dtype=np.float64)
+    return X.reshape(-1, len(FEATURE_COLUMNS))
@@ -1,10 +1,18 @@
 """Database package exports."""
 
-from app.repositories.models import ApiKey, ModelRegistry, RiskAnalysis
+from app.repositories.models import (
+    ApiKey,
+    LLMCallMetric,
+    LLMCallMetricRollup,
+    ModelRegistry,
+    RiskAnalysis,
+)
 from app.repositories.session import get_engine, get_session, init_db
 
 __all__ = [
     "ApiKey",
+    "LLMCallMetric",
+    "LLMCallMetricRollup",
     "ModelRegistry",
     "RiskAnalysis",
     "get_engine",
@@ -21,6 +21,12 @@ class ApiKeyRepository:
             select(ApiKey).where(ApiKey.name == name)
         ).first()
 
+    def get_by_hash(self, key_hash: str) -> ApiKey | None:
+        """Return the API key record with the given hash via the unique index, or None."""
+        return self._session.exec(
+            select(ApiKey).where(ApiKey.key_hash == key_hash)
+        ).first()
+
     def save(self, key: ApiKey) -> ApiKey:
         """Persist a new or updated API key record and return the refreshed row."""
         self._session.add(key)
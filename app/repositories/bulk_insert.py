@@ -0,0 +1,173 @@
+"""ORM-free bulk inserts — binary ``COPY`` on PostgreSQL, ``executemany`` elsewhere.
+
+Rows bypass the unit of work entirely: no identity map, no per-object flush
+and no primary key fetch. On PostgreSQL with psycopg2, batches of at least
+``_COPY_MIN_ROWS`` rows are streamed with ``COPY ... FROM STDIN (FORMAT
+binary)``. Binary matters for embeddings: a pgvector value is packed straight
+from its float32 buffer, whereas the text format spends microseconds printing
+each of its 384 floats. Smaller batches, other databases and tables with
+column types the encoder does not know use one ``executemany`` INSERT.
+"""
+
+import io
+import json
+import struct
+from collections.abc import Callable, Mapping, Sequence
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any
+
+import numpy as np
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Boolean,
+    DateTime,
+    Float,
+    Integer,
+    LargeBinary,
+    SmallInteger,
+    String,
+    Table,
+    insert,
+)
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeEngine
+from sqlmodel import Session, SQLModel
+
+# Below this, COPY's extra round trips cost more than they save.
+_COPY_MIN_ROWS = 100
+
+_COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+_COPY_TRAILER = struct.pack(">h", -1)
+_PG_EPOCH = datetime(2000, 1, 1)
+_PG_EPOCH_UTC = _PG_EPOCH.replace(tzinfo=timezone.utc)
+
+
+def _encode_timestamp(value: datetime) -> bytes:
+    epoch = _PG_EPOCH_UTC if value.tzinfo is not None else _PG_EPOCH
+    delta = value - epoch
+    micros = (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+    return struct.pack(">q", micros)
+
+
+def _encode_text(value: Any) -> bytes:
+    if isinstance(value, Enum):
+        # SQLAlchemy stores Python enums by member name.
+        value = value.name
+    return str(value).encode("utf-8")
+
+
+def _encode_vector(value: Any) -> bytes:
+    array = np.asarray(value, dtype=">f4")
+    return struct.pack(">HH", array.shape[0], 0) + array.tobytes()
+
+
+def _binary_encoder(column_type: TypeEngine) -> Callable[[Any], bytes] | None:
+    """Return the PostgreSQL binary COPY encoder for a column type, if supported."""
+    if isinstance(column_type, Vector):
+        return _encode_vector
+    if isinstance(column_type, Boolean):
+        return lambda value: b"\x01" if value else b"\x00"
+    if isinstance(column_type, BigInteger):
+        return lambda value: struct.pack(">q", value)
+    if isinstance(column_type, SmallInteger):
+        return lambda value: struct.pack(">h", value)
+    if isinstance(column_type, Integer):
+        return lambda value: struct.pack(">i", value)
+    if isinstance(column_type, Float):
+        return lambda value: struct.pack(">d", value)
+    if isinstance(column_type, DateTime):
+        return _encode_timestamp
+    if isinstance(column_type, JSON):
+        return lambda value: json.dumps(value).encode("utf-8")
+    if isinstance(column_type, LargeBinary):
+        return bytes
+    if isinstance(column_type, String):  # also covers Text and Enum
+        return _encode_text
+    return None
+
+
+def _row_mapping(row: SQLModel | Mapping[str, Any], table: Table) -> dict[str, Any]:
+    """Return column values for a model instance or mapping, skipping unset primary keys."""
+    if isinstance(row, Mapping):
+        values = dict(row)
+    else:
+        values = {column.name: getattr(row, column.name) for column in table.columns}
+    for column in table.primary_key.columns:
+        if values.get(column.name) is None:
+            values.pop(column.name, None)
+    return values
+
+
+def _copy_rows(
+    session: Session,
+    dialect: Dialect,
+    table: Table,
+    columns: list[str],
+    encoders: list[Callable[[Any], bytes]],
+    rows: list[dict[str, Any]],
+) -> None:
+    buffer = io.BytesIO()
+    buffer.write(_COPY_HEADER)
+    field_count = struct.pack(">h", len(columns))
+    null = struct.pack(">i", -1)
+    for row in rows:
+        buffer.write(field_count)
+        for name, encode in zip(columns, encoders):
+            value = row[name]
+            if value is None:
+                buffer.write(null)
+                continue
+            data = encode(value)
+            buffer.write(struct.pack(">i", len(data)))
+            buffer.write(data)
+    buffer.write(_COPY_TRAILER)
+    buffer.seek(0)
+
+    preparer = dialect.identifier_preparer
+    column_list = ", ".join(preparer.quote(name) for name in columns)
+    sql = f"COPY {preparer.format_table(table)} ({column_list}) FROM STDIN WITH (FORMAT binary)"
+    raw = session.connection().connection.driver_connection
+    with raw.cursor() as cursor:  # type: ignore[union-attr]
+        cursor.copy_expert(sql, buffer)
+
+
+def bulk_insert(
+    session: Session,
+    model: type[SQLModel],
+    rows: Sequence[SQLModel | Mapping[str, Any]],
+) -> int:
+    """Insert many rows of ``model`` without the ORM and commit.
+
+    Args:
+        session: Active database session.
+        model: Table model the rows belong to.
+        rows: Model instances or column mappings; every row must set the
+            same columns. Instances are not attached to the session and do
+            not receive generated IDs.
+
+    Returns:
+        Number of rows inserted.
+    """
+    if not rows:
+        return 0
+    table: Table = model.__table__  # type: ignore[attr-defined]
+    mappings = [_row_mapping(row, table) for row in rows]
+    dialect = session.get_bind().dialect
+
+    columns = list(mappings[0])
+    encoders = [_binary_encoder(table.columns[name].type) for name in columns]
+    use_copy = (
+        len(mappings) >= _COPY_MIN_ROWS
+        and dialect.name == "postgresql"
+        and dialect.driver == "psycopg2"
+        and all(encoder is not None for encoder in encoders)
+    )
+    if use_copy:
+        _copy_rows(session, dialect, table, columns, encoders, mappings)  # type: ignore[arg-type]
+    else:
+        session.execute(insert(table), mappings)
+    session.commit()
+    return len(mappings)
@@ -1,9 +1,22 @@
 """Document repository — persistence for uploaded documents and their chunks."""
 
-from sqlalchemy import text
+from collections.abc import Iterable
+
+from sqlalchemy import delete, func, literal_column
 from sqlmodel import Session, select
 
+from app.repositories.bulk_insert import bulk_insert
+from app.repositories.lexical_index import get_lexical_index_registry, tokenize
 from app.repositories.models import Document, DocumentChunk
+from app.repositories.vector_index import get_vector_index_registry
+from app.repositories.vector_search import search_nearest
+
+# Keeps IN lists well below bound-parameter limits (SQLite allows 999 by default).
+_MAX_HASHES_PER_QUERY = 500
+
+# Must match the expression of the ix_document_chunks_chunk_text_tsv GIN index.
+# "simple" keeps tickers, identifiers and figures unstemmed.
+_TS_CONFIG = literal_column("'simple'::regconfig")
 
 
 class DocumentRepository:
@@ -24,11 +37,69 @@ class DocumentRepository:
         """Return a document by ID, or None if not found."""
         return self._session.get(Document, document_id)
 
-    def save_chunks(self, chunks: list[DocumentChunk]) -> None:
-        """Bulk-insert a list of document chunks."""
-        for chunk in chunks:
-            self._session.add(chunk)
+    def update_document_text(self, document_id: int, content_text: str) -> Document:
+        """Set the extracted text of an existing document and return it.
+
+        Raises:
+            ValueError: If the document does not exist.
+        """
+        doc = self._session.get(Document, document_id)
+        if doc is None:
+            raise ValueError(f"Document {document_id} not found.")
+        doc.content_text = content_text
+        self._session.add(doc)
         self._session.commit()
+        self._session.refresh(doc)
+        return doc
+
+    def count_chunks(self, document_id: int) -> int:
+        """Return the number of stored chunks for a document."""
+        return self._session.exec(
+            select(func.count()).select_from(DocumentChunk).where(DocumentChunk.document_id == document_id)
+        ).one()
+
+    def delete_chunks(self, document_id: int) -> None:
+        """Delete every chunk of a document, e.g. before a retried ingestion.
+
+        The in-process vector and lexical indexes covering the document are
+        discarded too: they only catch up on ids above their last one, and
+        re-inserted chunks may reuse the deleted ids.
+        """
+        self._session.execute(delete(DocumentChunk).where(DocumentChunk.document_id == document_id))
+        self._session.commit()
+        for partition in (f"document_chunks/{document_id}", "document_chunks"):
+            get_vector_index_registry().invalidate(partition)
+            get_lexical_index_registry().invalidate(partition)
+
+    def save_chunks(self, chunks: list[DocumentChunk]) -> None:
+        """Bulk-insert a list of document chunks.
+
+        Uses the ORM-free ``bulk_insert`` path, so the chunk objects are not
+        attached to the session and keep ``id=None``.
+        """
+        bulk_insert(self._session, DocumentChunk, chunks)
+
+    def find_embeddings_by_hash(self, content_hashes: Iterable[str]) -> dict[str, list[float]]:
+        """Return a stored embedding for each given content hash that has one.
+
+        Args:
+            content_hashes: ``DocumentChunk.content_hash`` values to look up.
+
+        Returns:
+            Mapping of content hash to embedding, from any document.
+        """
+        unique = list(dict.fromkeys(content_hashes))
+        found: dict[str, list[float]] = {}
+        for start in range(0, len(unique), _MAX_HASHES_PER_QUERY):
+            rows = self._session.exec(
+                select(DocumentChunk.content_hash, DocumentChunk.embedding).where(
+                    DocumentChunk.content_hash.in_(unique[start : start + _MAX_HASHES_PER_QUERY]),  # type: ignore[union-attr]
+                    DocumentChunk.embedding.is_not(None),  # type: ignore[union-attr]
+                )
+            ).all()
+            for content_hash, embedding in rows:
+                found.setdefault(content_hash, embedding)
+        return found
 
     def search_chunks_by_embedding(
         self, embedding: list[float], document_id: int | None = None, limit: int = 5
@@ -42,14 +113,75 @@ class DocumentRepository:
 
         Returns:
             List of DocumentChunk rows ordered by cosine similarity (closest first).
+            With iterative index scans enabled, a ``document_id`` filter still
+            yields up to ``limit`` rows instead of whatever survived one scan.
+            Without PostgreSQL, each document is searched through its own
+            lazily loaded in-process index.
         """
-        vector_literal = "[" + ",".join(str(v) for v in embedding) + "]"
-        stmt = (
-            select(DocumentChunk)
-            .where(DocumentChunk.embedding.is_not(None))  # type: ignore[union-attr]
-            .order_by(text(f"embedding <=> '{vector_literal}'::vector"))
-            .limit(limit)
+        if document_id is None:
+            return search_nearest(self._session, DocumentChunk, embedding, limit, "document_chunks")
+        return search_nearest(
+            self._session,
+            DocumentChunk,
+            embedding,
+            limit,
+            f"document_chunks/{document_id}",
+            DocumentChunk.document_id == document_id,
         )
-        if document_id is not None:
-            stmt = stmt.where(DocumentChunk.document_id == document_id)
-        return list(self._session.exec(stmt).all())
+
+    def search_chunks_by_text(
+        self, query: str, document_id: int | None = None, limit: int = 5
+    ) -> list[DocumentChunk]:
+        """Return the chunks that best match the query's keywords.
+
+        Any query term may match. On PostgreSQL this uses the ``tsvector``
+        GIN index ranked by ``ts_rank_cd``; elsewhere an in-process BM25
+        inverted index per document.
+
+        Args:
+            query: Free-text query; tickers and figures are matched exactly.
+            document_id: If provided, restrict search to this document only.
+            limit: Maximum number of results.
+
+        Returns:
+            List of DocumentChunk rows ordered by keyword relevance.
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+        filters = [] if document_id is None else [DocumentChunk.document_id == document_id]
+
+        if self._session.get_bind().dialect.name == "postgresql":
+            tsquery = func.to_tsquery(_TS_CONFIG, " | ".join(f"'{term}'" for term in dict.fromkeys(terms)))
+            tsvector = func.to_tsvector(_TS_CONFIG, DocumentChunk.chunk_text)
+            stmt = (
+                select(DocumentChunk)
+                .where(tsvector.op("@@")(tsquery), *filters)
+                .order_by(func.ts_rank_cd(tsvector, tsquery).desc())
+                .limit(limit)
+            )
+            return list(self._session.exec(stmt).all())
+
+        partition = "document_chunks" if document_id is None else f"document_chunks/{document_id}"
+        index = get_lexical_index_registry().get(partition)
+
+        def fetch_since(last_id: int) -> list[tuple[int, str]]:
+            rows = self._session.exec(
+                select(DocumentChunk.id, DocumentChunk.chunk_text)
+                .where(DocumentChunk.id > last_id, *filters)  # type: ignore[operator]
+                .order_by(DocumentChunk.id)
+            ).all()
+            return [(row_id, chunk_text) for row_id, chunk_text in rows]
+
+        index.catch_up(fetch_since)
+        hits = index.search(query, limit)
+        if not hits:
+            return []
+        ids = [row_id for row_id, _ in hits]
+        found = {
+            chunk.id: chunk
+            for chunk in self._session.exec(
+                select(DocumentChunk).where(DocumentChunk.id.in_(ids))  # type: ignore[union-attr]
+            )
+        }
+        return [found[row_id] for row_id in ids if row_id in found]
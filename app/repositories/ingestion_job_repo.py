@@ -0,0 +1,185 @@
+"""Ingestion job repository — database-backed queue for background document ingestion."""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import update
+from sqlmodel import Session, select
+
+from app.domain.ingestion import IngestionStatus
+from app.repositories.models import IngestionJob, utc_now
+
+
+class IngestionJobRepository:
+    """Enqueues, claims and tracks document ingestion jobs.
+
+    Claiming is a conditional ``UPDATE ... WHERE status = 'queued'``, so
+    concurrent workers (threads or processes sharing the database) never run
+    the same job twice.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def enqueue(self, document_id: int, filename: str, file_bytes: bytes) -> IngestionJob:
+        """Persist a queued job holding the uploaded bytes and return it."""
+        job = IngestionJob(document_id=document_id, filename=filename, file_bytes=file_bytes)
+        self._session.add(job)
+        self._session.commit()
+        self._session.refresh(job)
+        return job
+
+    def get(self, job_id: int) -> IngestionJob | None:
+        """Return a job by ID, or None if not found."""
+        return self._session.get(IngestionJob, job_id)
+
+    def get_latest_for_document(self, document_id: int) -> IngestionJob | None:
+        """Return the most recent job for a document, or None if it has none."""
+        return self._session.exec(
+            select(IngestionJob)
+            .where(IngestionJob.document_id == document_id)
+            .order_by(IngestionJob.id.desc())  # type: ignore[union-attr]
+            .limit(1)
+        ).first()
+
+    def claim_next(self, batch: int = 8) -> IngestionJob | None:
+        """Atomically mark the oldest queued job as running and return it.
+
+        Args:
+            batch: Queued candidates to try before giving up; others may be
+                claimed by concurrent workers in the meantime.
+
+        Returns:
+            The claimed job, or None when nothing is queued.
+        """
+        candidates = self._session.exec(
+            select(IngestionJob.id)
+            .where(IngestionJob.status == IngestionStatus.queued)
+            .order_by(IngestionJob.id)  # type: ignore[arg-type]
+            .limit(batch)
+        ).all()
+        for job_id in candidates:
+            now = utc_now()
+            result = self._session.execute(
+                update(IngestionJob)
+                .where(IngestionJob.id == job_id, IngestionJob.status == IngestionStatus.queued)
+                .values(
+                    status=IngestionStatus.running,
+                    attempts=IngestionJob.attempts + 1,
+                    updated_at=now,
+                )
+            )
+            self._session.commit()
+            if result.rowcount == 1:
+                job = self._session.get(IngestionJob, job_id)
+                if job is not None:
+                    self._session.refresh(job)
+                return job
+        return None
+
+    @staticmethod
+    def _is_current_attempt(job_id: int, attempt: int) -> tuple[Any, ...]:
+        """Match a job only while it is still running the given attempt.
+
+        A worker whose lease lapsed may finish after the job was requeued and
+        claimed again; its writes must not touch the newer attempt.
+        """
+        return (
+            IngestionJob.id == job_id,
+            IngestionJob.status == IngestionStatus.running,
+            IngestionJob.attempts == attempt,
+        )
+
+    def update_progress(self, job_id: int, attempt: int, **fields: int | None) -> bool:
+        """Record progress counters and refresh the job heartbeat.
+
+        Returns:
+            False if the attempt is no longer current and nothing was written.
+        """
+        result = self._session.execute(
+            update(IngestionJob)
+            .where(*self._is_current_attempt(job_id, attempt))
+            .values(**fields, updated_at=utc_now())
+        )
+        self._session.commit()
+        return result.rowcount == 1
+
+    def mark_succeeded(self, job_id: int, attempt: int) -> bool:
+        """Mark a job finished and release its stored upload.
+
+        Returns:
+            False if the attempt is no longer current and nothing was written.
+        """
+        now = utc_now()
+        result = self._session.execute(
+            update(IngestionJob)
+            .where(*self._is_current_attempt(job_id, attempt))
+            .values(
+                status=IngestionStatus.succeeded,
+                file_bytes=None,
+                error=None,
+                updated_at=now,
+                finished_at=now,
+            )
+        )
+        self._session.commit()
+        return result.rowcount == 1
+
+    def mark_failed(self, job_id: int, attempt: int, error: str) -> bool:
+        """Mark a job failed with an error message; the upload is released.
+
+        Returns:
+            False if the attempt is no longer current and nothing was written.
+        """
+        now = utc_now()
+        result = self._session.execute(
+            update(IngestionJob)
+            .where(*self._is_current_attempt(job_id, attempt))
+            .values(
+                status=IngestionStatus.failed,
+                file_bytes=None,
+                error=error,
+                updated_at=now,
+                finished_at=now,
+            )
+        )
+        self._session.commit()
+        return result.rowcount == 1
+
+    def requeue_stale(self, heartbeat_before: datetime, max_attempts: int) -> int:
+        """Return abandoned running jobs to the queue, or fail them after ``max_attempts``.
+
+        Args:
+            heartbeat_before: Running jobs last updated before this are abandoned.
+            max_attempts: Attempts after which an abandoned job is failed instead.
+
+        Returns:
+            Number of jobs requeued or failed.
+        """
+        stale = (
+            IngestionJob.status == IngestionStatus.running,
+            IngestionJob.updated_at < heartbeat_before,
+        )
+        # Loaded rows may hold naive datetimes (SQLite), so skip in-Python matching.
+        no_sync = {"synchronize_session": False}
+        now = utc_now()
+        failed = self._session.execute(
+            update(IngestionJob)
+            .where(*stale, IngestionJob.attempts >= max_attempts)
+            .values(
+                status=IngestionStatus.failed,
+                file_bytes=None,
+                error="Ingestion worker stopped responding.",
+                updated_at=now,
+                finished_at=now,
+            )
+            .execution_options(**no_sync)
+        )
+        requeued = self._session.execute(
+            update(IngestionJob)
+            .where(*stale)
+            .values(status=IngestionStatus.queued, updated_at=now)
+            .execution_options(**no_sync)
+        )
+        self._session.commit()
+        return failed.rowcount + requeued.rowcount
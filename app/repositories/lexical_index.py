@@ -0,0 +1,120 @@
+"""In-process inverted index with BM25 ranking for keyword search over chunks.
+
+Used when the database is not PostgreSQL (PostgreSQL uses a ``tsvector`` GIN
+index instead). Like the vector index, each partition is built lazily from
+the database on first search and caught up by row id afterwards; it is
+cheap to rebuild from chunk text, so it is kept in memory only.
+"""
+
+import heapq
+import math
+import re
+import threading
+from collections import Counter
+from collections.abc import Callable
+from functools import lru_cache
+
+from app.core.cache import TTLCache
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[.,][a-z0-9]+)*")
+_STOPWORDS = frozenset(
+    "a an and are as at be by does did do for from has have how in is it its of on or"
+    " that the their there this to was were what when where which who why will with".split()
+)
+_MAX_LOADED_PARTITIONS = 256
+
+# Standard BM25 parameters.
+_K1 = 1.2
+_B = 0.75
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase ``text`` and split it into searchable terms.
+
+    Numbers keep their internal separators (``1,234.56``) so exact figures,
+    tickers and identifiers such as CUSIPs survive as single terms.
+    """
+    return [
+        token
+        for token in _TOKEN_PATTERN.findall(text.lower())
+        if token not in _STOPWORDS and (len(token) > 1 or token.isdigit())
+    ]
+
+
+class InvertedIndex:
+    """Append-only term → posting-list index scored with BM25."""
+
+    def __init__(self) -> None:
+        self._postings: dict[str, dict[int, int]] = {}
+        self._lengths: dict[int, int] = {}
+        self._total_length = 0
+        self._last_id = 0
+        self.lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    @property
+    def last_id(self) -> int:
+        return self._last_id
+
+    def add(self, row_id: int, text: str) -> None:
+        """Index one row; ids must be added in increasing order."""
+        terms = Counter(tokenize(text))
+        with self.lock:
+            for term, count in terms.items():
+                self._postings.setdefault(term, {})[row_id] = count
+            length = sum(terms.values())
+            self._lengths[row_id] = length
+            self._total_length += length
+            self._last_id = max(self._last_id, row_id)
+
+    def search(self, query: str, k: int) -> list[tuple[int, float]]:
+        """Return up to ``k`` ``(id, score)`` pairs, best match first."""
+        terms = set(tokenize(query))
+        with self.lock:
+            count = len(self._lengths)
+            if not terms or count == 0 or k <= 0:
+                return []
+            avg_length = self._total_length / count
+            scores: dict[int, float] = {}
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for row_id, tf in postings.items():
+                    norm = tf + _K1 * (1 - _B + _B * self._lengths[row_id] / avg_length)
+                    scores[row_id] = scores.get(row_id, 0.0) + idf * tf * (_K1 + 1) / norm
+        return heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
+
+    def catch_up(self, fetch_since: Callable[[int], list[tuple[int, str]]]) -> None:
+        """Index rows newer than ``last_id`` returned by ``fetch_since(last_id)``."""
+        with self.lock:
+            for row_id, text in fetch_since(self._last_id):
+                self.add(row_id, text)
+
+
+class LexicalIndexRegistry:
+    """Lazily built, LRU-bounded set of per-partition ``InvertedIndex`` objects."""
+
+    def __init__(self, max_partitions: int = _MAX_LOADED_PARTITIONS) -> None:
+        self._indexes: TTLCache[InvertedIndex] = TTLCache(max_partitions, math.inf)
+
+    def get(self, partition: str) -> InvertedIndex:
+        """Return the index for ``partition`` (e.g. ``"document_chunks/12"``)."""
+        return self._indexes.get_or_load(partition, InvertedIndex)
+
+    def invalidate(self, partition: str) -> None:
+        """Discard ``partition`` so the next search rebuilds it from the database."""
+        self._indexes.invalidate(partition)
+
+    def clear(self) -> None:
+        """Drop all partitions."""
+        self._indexes.clear()
+
+
+@lru_cache
+def get_lexical_index_registry() -> LexicalIndexRegistry:
+    """Return the process-wide lexical index registry."""
+    return LexicalIndexRegistry()
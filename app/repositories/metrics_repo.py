@@ -1,11 +1,95 @@
-"""Metrics repository — persistence for LLM call metrics."""
+"""Metrics repository — persistence for LLM call metrics.
 
-from datetime import datetime, timedelta
+Aggregations read hourly rollups (``llm_call_metric_rollups``) for complete
+hours that have been rolled up, and raw ``llm_call_metrics`` rows only for
+the partial hours at the edges of the window. Until the first rollup exists
+they fall back to exact queries over raw rows.
+"""
 
-from sqlalchemy import func, text
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import Integer, case, cast, delete, func, insert, null, or_, text
 from sqlmodel import Session, select
 
-from app.repositories.models import LLMCallMetric, RiskAnalysis
+from app.core.histogram import LogHistogram
+from app.repositories.models import LLMCallMetric, LLMCallMetricRollup, RiskAnalysis
+
+LATENCY_PERCENTILES = (0.5, 0.9, 0.95, 0.99)
+
+_TOKEN_FIELDS = ("input_tokens", "output_tokens", "total_tokens")
+_HOUR = timedelta(hours=1)
+# Arbitrary application-wide key for pg_advisory_xact_lock around rollup refreshes.
+_ROLLUP_LOCK_KEY = 7_320_114_583
+
+
+def _as_naive_utc(value: datetime) -> datetime:
+    """Normalize DB timestamps to the naive-UTC convention used for cutoffs."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _floor_hour(value: datetime) -> datetime:
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def _ceil_hour(value: datetime) -> datetime:
+    floored = _floor_hour(value)
+    return floored if floored == value else floored + _HOUR
+
+
+@dataclass
+class _Accumulator:
+    """Running totals for one group of metrics, mergeable from raw rows or rollups."""
+
+    call_count: int = 0
+    duration_sum_ms: float = 0.0
+    histogram: LogHistogram = field(default_factory=LogHistogram)
+    token_sums: dict[str, int] = field(default_factory=lambda: dict.fromkeys(_TOKEN_FIELDS, 0))
+    token_counts: dict[str, int] = field(
+        default_factory=lambda: dict.fromkeys(_TOKEN_FIELDS, 0)
+    )
+
+    def add_raw(self, duration_ms: float, tokens: dict[str, int | None]) -> None:
+        self.call_count += 1
+        self.duration_sum_ms += duration_ms
+        self.histogram.add(duration_ms)
+        for name, value in tokens.items():
+            if value is not None:
+                self.token_sums[name] += value
+                self.token_counts[name] += 1
+
+    def add_rollup(self, rollup: LLMCallMetricRollup) -> None:
+        self.call_count += rollup.call_count
+        self.duration_sum_ms += rollup.duration_sum_ms
+        self.histogram.merge(
+            LogHistogram.from_json(
+                rollup.latency_buckets, rollup.duration_min_ms, rollup.duration_max_ms
+            )
+        )
+        for name in _TOKEN_FIELDS:
+            self.token_sums[name] += getattr(rollup, f"{name}_sum")
+            self.token_counts[name] += getattr(rollup, f"{name}_count")
+
+    def avg_tokens(self, name: str) -> float:
+        count = self.token_counts[name]
+        return self.token_sums[name] / count if count else 0
+
+    def to_rollup(self, bucket_start: datetime, operation: str, model: str) -> LLMCallMetricRollup:
+        return LLMCallMetricRollup(
+            bucket_start=bucket_start,
+            operation=operation,
+            model=model,
+            call_count=self.call_count,
+            duration_sum_ms=self.duration_sum_ms,
+            duration_min_ms=self.histogram.minimum,
+            duration_max_ms=self.histogram.maximum,
+            latency_buckets=self.histogram.to_json(),
+            **{f"{name}_sum": self.token_sums[name] for name in _TOKEN_FIELDS},
+            **{f"{name}_count": self.token_counts[name] for name in _TOKEN_FIELDS},
+        )
 
 
 class MetricsRepository:
@@ -39,6 +123,22 @@ class MetricsRepository:
         self._session.refresh(metric)
         return metric
 
+    def save_metrics(self, records: list[dict[str, Any]]) -> int:
+        """Persist many LLM call metrics with a single multi-row INSERT.
+
+        Args:
+            records: Column mappings for ``llm_call_metrics``; every record
+                must carry the same keys.
+
+        Returns:
+            Number of rows inserted.
+        """
+        if not records:
+            return 0
+        self._session.execute(insert(LLMCallMetric).values(records))
+        self._session.commit()
+        return len(records)
+
     def get_avg_eval_score(self, days: int = 7) -> float | None:
         """Return the average eval score over the last N days."""
         cutoff = datetime.utcnow() - timedelta(days=days)
@@ -53,20 +153,122 @@ class MetricsRepository:
     def get_p95_latency_ms(self, operation: str | None = None, days: int = 7) -> float | None:
         """Return the 95th percentile latency in milliseconds."""
         cutoff = datetime.utcnow() - timedelta(days=days)
-        stmt = select(LLMCallMetric).where(LLMCallMetric.created_at >= cutoff)
+        summary = self._latency_summary(cutoff, operation=operation, by_operation=False)
+        if not summary:
+            return None
+        return summary[0][3][0.95]
+
+    def _is_postgresql(self) -> bool:
+        return self._session.get_bind().dialect.name == "postgresql"
+
+    def _latency_summary(
+        self,
+        cutoff: datetime,
+        operation: str | None = None,
+        by_operation: bool = True,
+    ) -> list[tuple[str | None, float, int, dict[float, float]]]:
+        """Return avg, count and ``LATENCY_PERCENTILES`` latencies in a single query.
+
+        PostgreSQL computes ``percentile_cont`` natively. Other dialects rank
+        rows with window functions and pick the two neighbours of each
+        percentile position, which are then linearly interpolated exactly as
+        ``percentile_cont`` does.
+
+        Returns:
+            One ``(operation, avg_ms, count, {percentile: ms})`` tuple per
+            operation, or a single tuple with ``operation=None`` when
+            ``by_operation`` is False. Empty when no rows match.
+        """
+        filters = [LLMCallMetric.created_at >= cutoff]
         if operation:
-            stmt = stmt.where(LLMCallMetric.operation == operation)
+            filters.append(LLMCallMetric.operation == operation)
+        group_key = LLMCallMetric.operation if by_operation else null()
 
-        rows = self._session.exec(stmt.order_by(LLMCallMetric.duration_ms)).all()
-        if not rows:
-            return None
+        if self._is_postgresql():
+            stmt = select(
+                group_key.label("operation"),
+                func.avg(LLMCallMetric.duration_ms),
+                func.count(LLMCallMetric.id),
+                *[
+                    func.percentile_cont(p).within_group(LLMCallMetric.duration_ms)
+                    for p in LATENCY_PERCENTILES
+                ],
+            ).where(*filters)
+            if by_operation:
+                stmt = stmt.group_by(LLMCallMetric.operation)
+            return [
+                (
+                    row[0],
+                    float(row[1]),
+                    int(row[2]),
+                    {p: float(v) for p, v in zip(LATENCY_PERCENTILES, row[3:])},
+                )
+                for row in self._session.exec(stmt).all()
+                if row[2]
+            ]
+
+        partition = [LLMCallMetric.operation] if by_operation else None
+        ranked = (
+            select(
+                group_key.label("operation"),
+                LLMCallMetric.duration_ms.label("duration_ms"),
+                (
+                    func.row_number().over(
+                        partition_by=partition, order_by=LLMCallMetric.duration_ms
+                    )
+                    - 1
+                ).label("rn"),
+                func.count().over(partition_by=partition).label("cnt"),
+            )
+            .where(*filters)
+            .subquery()
+        )
+        neighbours = []
+        for p in LATENCY_PERCENTILES:
+            lower = cast(p * (ranked.c.cnt - 1), Integer)
+            neighbours.append(func.max(case((ranked.c.rn == lower, ranked.c.duration_ms))))
+            neighbours.append(
+                func.max(case((ranked.c.rn == lower + 1, ranked.c.duration_ms)))
+            )
+        stmt = select(
+            ranked.c.operation,
+            func.avg(ranked.c.duration_ms),
+            func.count(),
+            *neighbours,
+        ).group_by(ranked.c.operation)
 
-        idx = int(len(rows) * 0.95)
-        return rows[idx].duration_ms if idx < len(rows) else rows[-1].duration_ms
+        summary = []
+        for row in self._session.exec(stmt).all():
+            operation_name, avg_duration, count = row[0], row[1], int(row[2])
+            if not count:
+                continue
+            percentiles = {}
+            for i, p in enumerate(LATENCY_PERCENTILES):
+                lower_value, upper_value = row[3 + 2 * i], row[4 + 2 * i]
+                position = p * (count - 1)
+                fraction = position - int(position)
+                if upper_value is None or fraction == 0:
+                    percentiles[p] = float(lower_value)
+                else:
+                    percentiles[p] = lower_value + fraction * (upper_value - lower_value)
+            summary.append((operation_name, float(avg_duration), count, percentiles))
+        return summary
 
     def get_avg_tokens_by_model(self, days: int = 7) -> dict[str, dict[str, float]]:
         """Return average token consumption (input, output, total) by model."""
         cutoff = datetime.utcnow() - timedelta(days=days)
+        coverage = self._rollup_coverage(cutoff)
+        if coverage is not None:
+            groups = self._accumulate_window(cutoff, coverage, by="model")
+            return {
+                model: {
+                    "avg_input_tokens": acc.avg_tokens("input_tokens"),
+                    "avg_output_tokens": acc.avg_tokens("output_tokens"),
+                    "avg_total_tokens": acc.avg_tokens("total_tokens"),
+                }
+                for model, acc in groups.items()
+            }
+
         rows = self._session.exec(
             select(
                 LLMCallMetric.model,
@@ -89,25 +291,159 @@ class MetricsRepository:
         return result
 
     def get_operation_stats(self, days: int = 7) -> dict[str, dict[str, float]]:
-        """Return latency stats (avg, p95) per operation."""
+        """Return latency stats (avg, p50, p90, p95, p99) per operation.
+
+        Uses hourly rollups when available (percentiles are then approximate,
+        within the ``LogHistogram`` bucket error); otherwise a single exact
+        grouped query over raw rows.
+        """
         cutoff = datetime.utcnow() - timedelta(days=days)
-        rows = self._session.exec(
-            select(
-                LLMCallMetric.operation,
-                func.avg(LLMCallMetric.duration_ms).label("avg_duration"),
-                func.count(LLMCallMetric.id).label("call_count"),
-            )
-            .where(LLMCallMetric.created_at >= cutoff)
-            .group_by(LLMCallMetric.operation)
-        ).all()
+        coverage = self._rollup_coverage(cutoff)
+
+        if coverage is not None:
+            groups = self._accumulate_window(cutoff, coverage, by="operation")
+            return {
+                operation: {
+                    "avg_duration_ms": acc.duration_sum_ms / acc.call_count,
+                    **{
+                        f"p{round(p * 100)}_duration_ms": acc.histogram.quantile(p)
+                        for p in LATENCY_PERCENTILES
+                    },
+                    "call_count": acc.call_count,
+                }
+                for operation, acc in groups.items()
+                if acc.call_count
+            }
 
         result = {}
-        for row in rows:
-            operation, avg_duration, call_count = row
-            p95 = self.get_p95_latency_ms(operation=operation, days=days)
+        for operation, avg_duration, call_count, percentiles in self._latency_summary(cutoff):
             result[operation] = {
-                "avg_duration_ms": float(avg_duration) if avg_duration else 0,
-                "p95_duration_ms": p95 or 0,
+                "avg_duration_ms": avg_duration,
+                "p50_duration_ms": percentiles[0.5],
+                "p90_duration_ms": percentiles[0.9],
+                "p95_duration_ms": percentiles[0.95],
+                "p99_duration_ms": percentiles[0.99],
                 "call_count": call_count,
             }
         return result
+
+    def _rollup_coverage(self, cutoff: datetime) -> tuple[datetime, datetime] | None:
+        """Return the ``[start, end)`` span of complete rolled-up hours inside the window.
+
+        Returns None when no rollups overlap the window.
+        """
+        last_bucket = self._session.exec(select(func.max(LLMCallMetricRollup.bucket_start))).first()
+        if last_bucket is None:
+            return None
+        start = _ceil_hour(cutoff)
+        end = _as_naive_utc(last_bucket) + _HOUR
+        if end <= start:
+            return None
+        return start, end
+
+    def _accumulate_window(
+        self,
+        cutoff: datetime,
+        coverage: tuple[datetime, datetime],
+        by: str,
+    ) -> dict[str, _Accumulator]:
+        """Merge rollups inside ``coverage`` with raw rows outside it, grouped by a column."""
+        start, end = coverage
+        groups: dict[str, _Accumulator] = {}
+
+        rollups = self._session.exec(
+            select(LLMCallMetricRollup).where(
+                LLMCallMetricRollup.bucket_start >= start,
+                LLMCallMetricRollup.bucket_start < end,
+            )
+        ).all()
+        for rollup in rollups:
+            groups.setdefault(getattr(rollup, by), _Accumulator()).add_rollup(rollup)
+
+        raw_rows = self._session.exec(
+            select(
+                getattr(LLMCallMetric, by),
+                LLMCallMetric.duration_ms,
+                LLMCallMetric.input_tokens,
+                LLMCallMetric.output_tokens,
+                LLMCallMetric.total_tokens,
+            ).where(
+                LLMCallMetric.created_at >= cutoff,
+                or_(LLMCallMetric.created_at < start, LLMCallMetric.created_at >= end),
+            )
+        ).all()
+        for key, duration_ms, *tokens in raw_rows:
+            groups.setdefault(key, _Accumulator()).add_raw(
+                duration_ms, dict(zip(_TOKEN_FIELDS, tokens))
+            )
+        return groups
+
+    def refresh_rollups(self, now: datetime | None = None) -> int:
+        """Roll raw metrics up into hourly buckets, incrementally.
+
+        Recomputes every complete hour from the latest existing bucket (to
+        absorb rows that arrived late) up to the start of the current hour.
+        On first run it backfills from the oldest raw row. On PostgreSQL a
+        transaction-level advisory lock serializes refreshes across
+        processes, so concurrent workers do not insert the same buckets.
+
+        Args:
+            now: Reference time (naive UTC); defaults to the current time.
+
+        Returns:
+            Number of rollup rows written.
+        """
+        current_hour = _floor_hour(now or datetime.utcnow())
+        if self._is_postgresql():
+            # Held until commit; a waiting worker then sees the new buckets.
+            self._session.execute(
+                text("SELECT pg_advisory_xact_lock(:key)"), {"key": _ROLLUP_LOCK_KEY}
+            )
+        last_bucket = self._session.exec(select(func.max(LLMCallMetricRollup.bucket_start))).first()
+        if last_bucket is not None:
+            start = _as_naive_utc(last_bucket)
+        else:
+            first_row = self._session.exec(select(func.min(LLMCallMetric.created_at))).first()
+            if first_row is None:
+                self._session.commit()  # releases the advisory lock
+                return 0
+            start = _floor_hour(_as_naive_utc(first_row))
+        if start >= current_hour:
+            self._session.commit()
+            return 0
+
+        groups: dict[tuple[datetime, str, str], _Accumulator] = {}
+        rows = self._session.exec(
+            select(
+                LLMCallMetric.created_at,
+                LLMCallMetric.operation,
+                LLMCallMetric.model,
+                LLMCallMetric.duration_ms,
+                LLMCallMetric.input_tokens,
+                LLMCallMetric.output_tokens,
+                LLMCallMetric.total_tokens,
+            )
+            .where(
+                LLMCallMetric.created_at >= start,
+                LLMCallMetric.created_at < current_hour,
+            )
+            .execution_options(yield_per=5000)
+        )
+        for created_at, operation, model, duration_ms, *tokens in rows:
+            key = (_floor_hour(_as_naive_utc(created_at)), operation, model)
+            groups.setdefault(key, _Accumulator()).add_raw(
+                duration_ms, dict(zip(_TOKEN_FIELDS, tokens))
+            )
+
+        self._session.execute(
+            delete(LLMCallMetricRollup).where(
+                LLMCallMetricRollup.bucket_start >= start,
+                LLMCallMetricRollup.bucket_start < current_hour,
+            )
+        )
+        self._session.add_all(
+            acc.to_rollup(bucket_start, operation, model)
+            for (bucket_start, operation, model), acc in groups.items()
+        )
+        self._session.commit()
+        return len(groups)
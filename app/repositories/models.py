@@ -4,9 +4,23 @@ from datetime import datetime, timezone
 from typing import Any
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import JSON, Column, DateTime, Enum as SAEnum, Index, Integer, String
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Column,
+    DateTime,
+    Enum as SAEnum,
+    Float,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlmodel import Field, SQLModel
 
+from app.domain.ingestion import IngestionStatus
 from app.domain.risk_level import AnalysisMode, RiskLevel  # noqa: F401
 
 
@@ -69,6 +83,32 @@ class RiskAnalysis(SQLModel, table=True):
     )
 
 
+class RiskExplanation(SQLModel, table=True):
+    """LLM explanation of a risk profile, stored for the explanation cache."""
+
+    __tablename__ = "risk_explanations"
+    __table_args__ = (
+        Index("ix_risk_explanations_key_created_at", "explanation_key", "created_at"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    explanation_key: str = Field(
+        sa_column=Column(String(64), nullable=False),
+        description="Hash of the model and prompts that produced ``explanation``.",
+    )
+    symbol: str = Field(sa_column=Column(String(10), nullable=False))
+    days: int = Field(nullable=False)
+    risk_level: RiskLevel = Field(
+        sa_column=Column(SAEnum(RiskLevel, name="risk_level"), nullable=False)
+    )
+    model: str = Field(sa_column=Column(String(100), nullable=False))
+    explanation: str = Field(sa_column=Column(Text, nullable=False))
+    created_at: datetime = Field(
+        default_factory=utc_now,
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
+
+
 class Document(SQLModel, table=True):
     """Uploaded document (PDF or plain text) stored for RAG queries."""
 
@@ -93,6 +133,11 @@ class DocumentChunk(SQLModel, table=True):
     document_id: int = Field(nullable=False, foreign_key="documents.id")
     chunk_index: int = Field(nullable=False)
     chunk_text: str = Field(sa_column=Column(String, nullable=False))
+    content_hash: str | None = Field(
+        default=None,
+        sa_column=Column(String(64), nullable=True, index=True),
+        description="SHA-256 of the embedding model name and chunk text.",
+    )
     embedding: list[float] | None = Field(
         default=None,
         sa_column=Column(Vector(384), nullable=True),
@@ -103,6 +148,45 @@ class DocumentChunk(SQLModel, table=True):
     )
 
 
+class IngestionJob(SQLModel, table=True):
+    """Queued background ingestion of an uploaded document.
+
+    The uploaded bytes are kept until the job finishes. ``updated_at`` doubles
+    as the worker heartbeat: running jobs that stop updating are requeued.
+    """
+
+    __tablename__ = "ingestion_jobs"
+    __table_args__ = (Index("ix_ingestion_jobs_status_id", "status", "id"),)
+
+    id: int | None = Field(default=None, primary_key=True)
+    document_id: int = Field(nullable=False, foreign_key="documents.id", index=True)
+    filename: str = Field(sa_column=Column(String(500), nullable=False))
+    file_bytes: bytes | None = Field(
+        default=None, sa_column=Column(LargeBinary, nullable=True)
+    )
+    status: IngestionStatus = Field(
+        default=IngestionStatus.queued,
+        sa_column=Column(SAEnum(IngestionStatus, name="ingestion_status"), nullable=False),
+    )
+    attempts: int = Field(default=0, nullable=False)
+    pages_total: int | None = Field(default=None)
+    pages_extracted: int = Field(default=0, nullable=False)
+    chunks_total: int | None = Field(default=None)
+    chunks_embedded: int = Field(default=0, nullable=False)
+    error: str | None = Field(default=None, sa_column=Column(Text, nullable=True))
+    created_at: datetime = Field(
+        default_factory=utc_now,
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
+    updated_at: datetime = Field(
+        default_factory=utc_now,
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
+    finished_at: datetime | None = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=True)
+    )
+
+
 class ModelRegistry(SQLModel, table=True):
     """Registered ML model artifacts and metadata."""
 
@@ -144,5 +228,41 @@ class LLMCallMetric(SQLModel, table=True):
     eval_score: int | None = Field(default=None, description="If eval operation, the score (1-5).")
     created_at: datetime = Field(
         default_factory=utc_now,
-        sa_column=Column(DateTime(timezone=True), nullable=False, index=True),
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
+
+
+class LLMCallMetricRollup(SQLModel, table=True):
+    """Hourly pre-aggregate of ``llm_call_metrics`` per operation and model.
+
+    Token averages ignore NULLs, so each token sum carries its own count of
+    non-null rows. ``latency_buckets`` is a ``LogHistogram`` in JSON form.
+    """
+
+    __tablename__ = "llm_call_metric_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "bucket_start", "operation", "model", name="uq_llm_call_metric_rollups_bucket"
+        ),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    bucket_start: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False, index=True)
+    )
+    operation: str = Field(sa_column=Column(String(50), nullable=False))
+    model: str = Field(sa_column=Column(String(100), nullable=False))
+    call_count: int = Field(nullable=False)
+    duration_sum_ms: float = Field(sa_column=Column(Float, nullable=False))
+    duration_min_ms: float = Field(sa_column=Column(Float, nullable=False))
+    duration_max_ms: float = Field(sa_column=Column(Float, nullable=False))
+    input_tokens_sum: int = Field(default=0, sa_column=Column(BigInteger, nullable=False))
+    input_tokens_count: int = Field(default=0, nullable=False)
+    output_tokens_sum: int = Field(default=0, sa_column=Column(BigInteger, nullable=False))
+    output_tokens_count: int = Field(default=0, nullable=False)
+    total_tokens_sum: int = Field(default=0, sa_column=Column(BigInteger, nullable=False))
+    total_tokens_count: int = Field(default=0, nullable=False)
+    latency_buckets: dict[str, int] = Field(
+        default_factory=dict,
+        sa_column=Column(JSON, nullable=False),
     )
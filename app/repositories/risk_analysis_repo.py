@@ -1,9 +1,10 @@
 """RiskAnalysis repository — encapsulates all database queries for risk analysis records."""
 
-from sqlalchemy import text
 from sqlmodel import Session, select
 
+from app.repositories.bulk_insert import bulk_insert
 from app.repositories.models import RiskAnalysis
+from app.repositories.vector_search import search_nearest
 
 
 class RiskAnalysisRepository:
@@ -19,6 +20,14 @@ class RiskAnalysisRepository:
         self._session.refresh(analysis)
         return analysis
 
+    def save_many(self, analyses: list[RiskAnalysis]) -> int:
+        """Bulk-insert risk analysis snapshots and return how many were written.
+
+        Uses the ORM-free ``bulk_insert`` path (``COPY`` on PostgreSQL), so
+        the objects are not attached to the session and keep ``id=None``.
+        """
+        return bulk_insert(self._session, RiskAnalysis, analyses)
+
     def get_by_symbol(self, symbol: str) -> list[RiskAnalysis]:
         """Return all risk analysis records for a given ticker symbol."""
         return list(
@@ -33,7 +42,8 @@ class RiskAnalysisRepository:
         """Return the closest risk analyses to the given embedding vector.
 
         Uses pgvector cosine distance operator ``<=>`` for nearest-neighbor
-        lookup. Only rows that have a stored embedding are considered.
+        lookup on PostgreSQL and the in-process vector index elsewhere.
+        Only rows that have a stored embedding are considered.
 
         Args:
             embedding: Query vector (384 dimensions).
@@ -42,11 +52,4 @@ class RiskAnalysisRepository:
         Returns:
             List of RiskAnalysis rows ordered by similarity (closest first).
         """
-        vector_literal = "[" + ",".join(str(v) for v in embedding) + "]"
-        rows = self._session.exec(
-            select(RiskAnalysis)
-            .where(RiskAnalysis.embedding.is_not(None))  # type: ignore[union-attr]
-            .order_by(text(f"embedding <=> '{vector_literal}'::vector"))
-            .limit(limit)
-        ).all()
-        return list(rows)
+        return search_nearest(self._session, RiskAnalysis, embedding, limit, "risk_analyses")
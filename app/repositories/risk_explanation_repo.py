@@ -0,0 +1,33 @@
+"""RiskExplanation repository — stored LLM explanations keyed by prompt hash."""
+
+from datetime import datetime
+
+from sqlmodel import Session, select
+
+from app.repositories.models import RiskExplanation
+
+
+class RiskExplanationRepository:
+    """Persists generated risk explanations and looks them up by prompt key."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def save(self, explanation: RiskExplanation) -> RiskExplanation:
+        """Persist a generated explanation and return the refreshed row."""
+        self._session.add(explanation)
+        self._session.commit()
+        self._session.refresh(explanation)
+        return explanation
+
+    def find_latest(self, explanation_key: str, since: datetime) -> str | None:
+        """Return the newest explanation stored for a prompt key after ``since``, or None."""
+        return self._session.exec(
+            select(RiskExplanation.explanation)
+            .where(
+                RiskExplanation.explanation_key == explanation_key,
+                RiskExplanation.created_at >= since,
+            )
+            .order_by(RiskExplanation.created_at.desc())  # type: ignore[attr-defined]
+            .limit(1)
+        ).first()
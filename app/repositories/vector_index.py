@@ -0,0 +1,283 @@
+"""In-process vector index — exact cosine search over a float32 NumPy matrix.
+
+Used instead of pgvector when the database is not PostgreSQL. Each partition
+(e.g. one document's chunks) is an append-only index that is loaded lazily
+on first search and caught up from the database by row id, so rows written
+by any process are picked up. With a directory configured, every partition
+is persisted as two append-only files:
+
+- ``<partition>.f32``: raw float32 rows of L2-normalized embeddings.
+- ``<partition>.ids``: raw int64 database ids, one per row.
+
+Appends only write the new rows. A crash between the two writes leaves one
+file longer than the other; loading keeps the common prefix and the
+database catch-up re-adds anything lost.
+
+The files are only valid for the database they were built from. The root
+holds a ``DATABASE`` file with a fingerprint of ``DATABASE_URL`` and is
+wiped when it changes, and every catch-up compares the index with the row
+count and highest id the database reports up to ``last_id``; a mismatch
+(e.g. a reset database or deleted rows) rebuilds the partition. Callers
+that delete and re-insert rows must still ``invalidate`` the partition,
+because reused ids pass that check.
+"""
+
+import hashlib
+import logging
+import math
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from functools import lru_cache
+from pathlib import Path
+from typing import Protocol
+
+import numpy as np
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_DIMENSIONS = 384
+_MAX_LOADED_PARTITIONS = 256
+_IDENTITY_FILE = "DATABASE"
+_INDEX_SUFFIXES = (".f32", ".ids")
+
+
+class VectorIndex(Protocol):
+    """Nearest-neighbour index over embeddings keyed by database row id."""
+
+    @property
+    def last_id(self) -> int:
+        """Highest row id held by the index, or 0 when empty."""
+        ...
+
+    def add(self, ids: Sequence[int], vectors: Iterable[Sequence[float]]) -> None:
+        """Append rows; ids must be greater than ``last_id``."""
+        ...
+
+    def search(self, query: Sequence[float], k: int) -> list[tuple[int, float]]:
+        """Return up to ``k`` ``(id, cosine_distance)`` pairs, closest first."""
+        ...
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length, leaving all-zero rows unchanged."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class NumpyVectorIndex:
+    """Contiguous float32 matrix of normalized embeddings with top-k by dot product."""
+
+    def __init__(self, dimensions: int = EMBEDDING_DIMENSIONS, path: str | Path | None = None) -> None:
+        """Initialize an index, loading any rows already persisted at ``path``.
+
+        Args:
+            dimensions: Embedding width.
+            path: File stem for persistence; None keeps the index in memory only.
+        """
+        self._dimensions = dimensions
+        self._path = Path(path) if path is not None else None
+        self._vectors = np.empty((0, dimensions), dtype=np.float32)
+        self._ids = np.empty(0, dtype=np.int64)
+        self._size = 0
+        self.lock = threading.RLock()
+        if self._path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def last_id(self) -> int:
+        return int(self._ids[self._size - 1]) if self._size else 0
+
+    def _files(self) -> tuple[Path, Path]:
+        assert self._path is not None
+        return self._path.with_suffix(".f32"), self._path.with_suffix(".ids")
+
+    def reset(self) -> None:
+        """Drop every row from memory and delete the persisted files."""
+        with self.lock:
+            self._vectors = np.empty((0, self._dimensions), dtype=np.float32)
+            self._ids = np.empty(0, dtype=np.int64)
+            self._size = 0
+            if self._path is not None:
+                for file in self._files():
+                    file.unlink(missing_ok=True)
+
+    def _load(self) -> None:
+        vector_file, id_file = self._files()
+        if not vector_file.exists() or not id_file.exists():
+            return
+        try:
+            vectors = np.fromfile(vector_file, dtype=np.float32)
+            ids = np.fromfile(id_file, dtype=np.int64)
+        except OSError:
+            logger.warning("Could not read vector index %s; rebuilding", self._path, exc_info=True)
+            return
+        rows = min(len(vectors) // self._dimensions, len(ids))
+        self._vectors = np.ascontiguousarray(vectors[: rows * self._dimensions].reshape(rows, self._dimensions))
+        self._ids = ids[:rows].copy()
+        self._size = rows
+        if rows < len(ids) or rows * self._dimensions < len(vectors):
+            self._rewrite()
+
+    def _rewrite(self) -> None:
+        """Replace the files with the in-memory rows (used after a torn append)."""
+        vector_file, id_file = self._files()
+        self._vectors[: self._size].tofile(vector_file)
+        self._ids[: self._size].tofile(id_file)
+
+    def add(self, ids: Sequence[int], vectors: Iterable[Sequence[float]]) -> None:
+        """Append normalized rows to memory and, when persistent, to disk."""
+        new_ids = np.asarray(ids, dtype=np.int64)
+        if len(new_ids) == 0:
+            return
+        new_vectors = _normalize(np.asarray(list(vectors), dtype=np.float32).reshape(-1, self._dimensions))
+        with self.lock:
+            needed = self._size + len(new_ids)
+            if needed > len(self._ids):
+                capacity = max(needed, 2 * len(self._ids), 64)
+                vectors_buf = np.empty((capacity, self._dimensions), dtype=np.float32)
+                ids_buf = np.empty(capacity, dtype=np.int64)
+                vectors_buf[: self._size] = self._vectors[: self._size]
+                ids_buf[: self._size] = self._ids[: self._size]
+                self._vectors, self._ids = vectors_buf, ids_buf
+            self._vectors[self._size : needed] = new_vectors
+            self._ids[self._size : needed] = new_ids
+            self._size = needed
+            if self._path is not None:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                vector_file, id_file = self._files()
+                with vector_file.open("ab") as f:
+                    new_vectors.tofile(f)
+                with id_file.open("ab") as f:
+                    new_ids.tofile(f)
+
+    def search(self, query: Sequence[float], k: int) -> list[tuple[int, float]]:
+        """Return the ``k`` closest rows by cosine distance, closest first."""
+        with self.lock:
+            size = self._size
+            vectors = self._vectors[:size]
+            ids = self._ids[:size]
+        k = min(k, size)
+        if k <= 0:
+            return []
+        q = _normalize(np.asarray(query, dtype=np.float32).reshape(1, -1))[0]
+        scores = vectors @ q
+        if k < size:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(size)
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(ids[i]), float(1.0 - scores[i])) for i in top]
+
+    def catch_up(
+        self,
+        fetch_since: Callable[[int], list[tuple[int, Sequence[float]]]],
+        fetch_watermark: Callable[[int], tuple[int, int]] | None = None,
+    ) -> None:
+        """Append rows newer than ``last_id`` returned by ``fetch_since(last_id)``.
+
+        Args:
+            fetch_since: Returns ``(id, embedding)`` rows with ids above its
+                argument, in id order.
+            fetch_watermark: Returns ``(row_count, max_id)`` of the rows with
+                ids up to its argument. When it disagrees with the index, the
+                index is rebuilt from scratch.
+        """
+        with self.lock:
+            if self._size and fetch_watermark is not None:
+                expected = (self._size, self.last_id)
+                actual = fetch_watermark(self.last_id)
+                if tuple(actual) != expected:
+                    logger.warning(
+                        "Vector index %s out of sync (index %s, database %s); rebuilding",
+                        self._path,
+                        expected,
+                        tuple(actual),
+                    )
+                    self.reset()
+            rows = fetch_since(self.last_id)
+            if rows:
+                self.add([row_id for row_id, _ in rows], [vector for _, vector in rows])
+
+
+class VectorIndexRegistry:
+    """Lazily loaded, LRU-bounded set of per-partition ``NumpyVectorIndex`` objects."""
+
+    def __init__(
+        self,
+        root: str | Path | None,
+        max_partitions: int = _MAX_LOADED_PARTITIONS,
+        identity: str | None = None,
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            root: Directory for persisted partitions; None keeps them in memory.
+            max_partitions: Partitions kept loaded at once.
+            identity: Fingerprint of the database the files belong to; files
+                written for a different fingerprint are deleted.
+        """
+        self._root = Path(root) if root else None
+        self._indexes: TTLCache[NumpyVectorIndex] = TTLCache(max_partitions, math.inf)
+        if self._root is not None and identity is not None:
+            self._claim_root(identity)
+
+    def _claim_root(self, identity: str) -> None:
+        assert self._root is not None
+        marker = self._root / _IDENTITY_FILE
+        try:
+            current = marker.read_text().strip()
+        except OSError:
+            current = None
+        if current == identity:
+            return
+        if self._root.exists():
+            logger.warning("Vector index directory %s belongs to another database; clearing", self._root)
+            for suffix in _INDEX_SUFFIXES:
+                for file in self._root.rglob(f"*{suffix}"):
+                    file.unlink(missing_ok=True)
+        self._root.mkdir(parents=True, exist_ok=True)
+        marker.write_text(identity)
+
+    def get(self, partition: str) -> NumpyVectorIndex:
+        """Return the index for ``partition`` (e.g. ``"document_chunks/12"``)."""
+        return self._indexes.get_or_load(partition, lambda: self._open(partition))
+
+    def _open(self, partition: str) -> NumpyVectorIndex:
+        path = self._root / partition if self._root is not None else None
+        return NumpyVectorIndex(EMBEDDING_DIMENSIONS, path)
+
+    def invalidate(self, partition: str) -> None:
+        """Discard ``partition`` in memory and on disk so the next search rebuilds it."""
+        index = self._indexes.get(partition)
+        if index is not None:
+            index.reset()
+        self._indexes.invalidate(partition)
+        if self._root is not None:
+            for suffix in _INDEX_SUFFIXES:
+                (self._root / partition).with_suffix(suffix).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Drop all loaded partitions (persisted files are kept)."""
+        self._indexes.clear()
+
+
+def database_fingerprint(database_url: str) -> str:
+    """Return a stable identifier for a database URL that does not reveal credentials."""
+    return hashlib.sha256(database_url.encode("utf-8")).hexdigest()[:16]
+
+
+@lru_cache
+def get_vector_index_registry() -> VectorIndexRegistry:
+    """Return the process-wide registry rooted at ``VECTOR_INDEX_DIR``."""
+    settings = get_settings()
+    return VectorIndexRegistry(
+        settings.vector_index_dir,
+        identity=database_fingerprint(settings.database_url),
+    )
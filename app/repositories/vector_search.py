@@ -0,0 +1,157 @@
+"""Shared nearest-neighbour search for repositories that store embeddings.
+
+Searches run through pgvector on PostgreSQL and through the in-process
+``NumpyVectorIndex`` elsewhere (``VECTOR_BACKEND`` overrides the choice).
+"""
+
+import logging
+import re
+import threading
+from collections.abc import Sequence
+from typing import Any, TypeVar
+
+from sqlalchemy import func, text
+from sqlmodel import Session, SQLModel, select
+
+from app.core.config import get_settings
+from app.repositories.vector_index import get_vector_index_registry
+
+logger = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT", bound=SQLModel)
+
+# pgvector rejects hnsw.ef_search values above this.
+_MAX_EF_SEARCH = 1000
+# First pgvector release with hnsw.iterative_scan; older versions reject the setting.
+_ITERATIVE_SCAN_MIN_VERSION = (0, 8, 0)
+
+_SET_HNSW_OPTIONS = text(
+    "SELECT set_config('hnsw.ef_search', :ef_search, true), "
+    "set_config('hnsw.iterative_scan', :iterative_scan, true)"
+)
+_SET_EF_SEARCH = text("SELECT set_config('hnsw.ef_search', :ef_search, true)")
+_PGVECTOR_VERSION = text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+
+_versions_lock = threading.Lock()
+_pgvector_versions: dict[str, tuple[int, ...]] = {}
+
+
+def _pgvector_version(session: Session) -> tuple[int, ...]:
+    """Return the installed pgvector version, queried once per database URL.
+
+    Returns ``()`` when the extension is not installed.
+    """
+    url = str(session.get_bind().engine.url)
+    with _versions_lock:
+        version = _pgvector_versions.get(url)
+    if version is None:
+        installed = session.execute(_PGVECTOR_VERSION).scalar()
+        version = tuple(int(part) for part in re.findall(r"\d+", installed or "")[:3])
+        if version < _ITERATIVE_SCAN_MIN_VERSION and get_settings().vector_iterative_scan != "off":
+            logger.warning(
+                "pgvector %s does not support hnsw.iterative_scan (needs 0.8.0+); "
+                "filtered vector searches may return fewer rows than requested",
+                installed or "(not installed)",
+            )
+        with _versions_lock:
+            _pgvector_versions[url] = version
+    return version
+
+
+def apply_vector_search_settings(session: Session, limit: int) -> None:
+    """Configure HNSW search for the session's current transaction.
+
+    ``hnsw.ef_search`` is raised to at least ``limit`` so the index can return
+    ``limit`` candidates, and iterative scans let filtered searches keep
+    walking the graph until enough rows pass the filter. Iterative scans need
+    pgvector 0.8.0 or later and are left out on older installs. The settings
+    are transaction-local and are skipped on databases other than PostgreSQL.
+
+    Args:
+        session: Session that will run the vector query.
+        limit: Number of nearest neighbours the query will request.
+    """
+    if session.get_bind().dialect.name != "postgresql":
+        return
+    settings = get_settings()
+    ef_search = str(min(max(settings.vector_ef_search, limit), _MAX_EF_SEARCH))
+    if _pgvector_version(session) < _ITERATIVE_SCAN_MIN_VERSION:
+        session.execute(_SET_EF_SEARCH, {"ef_search": ef_search})
+        return
+    session.execute(
+        _SET_HNSW_OPTIONS,
+        {"ef_search": ef_search, "iterative_scan": settings.vector_iterative_scan},
+    )
+
+
+def uses_pgvector(session: Session) -> bool:
+    """Return True when vector searches should run in the database."""
+    backend = get_settings().vector_backend
+    if backend == "auto":
+        return session.get_bind().dialect.name == "postgresql"
+    return backend == "pgvector"
+
+
+def search_nearest(
+    session: Session,
+    model: type[ModelT],
+    embedding: Sequence[float],
+    limit: int,
+    partition: str,
+    *filters: Any,
+) -> list[ModelT]:
+    """Return up to ``limit`` rows of ``model`` closest to ``embedding`` by cosine distance.
+
+    Args:
+        session: Active database session.
+        model: Table model with ``id`` and ``embedding`` columns.
+        embedding: Query vector.
+        limit: Maximum number of rows.
+        partition: In-process index partition covering exactly the rows
+            matched by ``filters`` (e.g. ``"document_chunks/12"``).
+        *filters: Extra WHERE clauses restricting the candidate rows.
+
+    Returns:
+        Matching rows, closest first.
+    """
+    column = model.embedding  # type: ignore[attr-defined]
+    if uses_pgvector(session):
+        apply_vector_search_settings(session, limit)
+        stmt = (
+            select(model)
+            .where(column.is_not(None), *filters)
+            .order_by(column.cosine_distance(embedding))
+            .limit(limit)
+        )
+        return list(session.exec(stmt).all())
+
+    model_id = model.id  # type: ignore[attr-defined]
+
+    def fetch_since(last_id: int) -> list[tuple[int, Sequence[float]]]:
+        # Ids are assigned in commit order on single-writer databases, so
+        # everything not yet indexed has a higher id than the last indexed row.
+        rows = session.exec(
+            select(model_id, column)
+            .where(column.is_not(None), model_id > last_id, *filters)
+            .order_by(model_id)
+        ).all()
+        return [(row_id, vector) for row_id, vector in rows]
+
+    def fetch_watermark(last_id: int) -> tuple[int, int]:
+        count, max_id = session.exec(
+            select(func.count(), func.max(model_id)).where(
+                column.is_not(None), model_id <= last_id, *filters
+            )
+        ).one()
+        return count, max_id or 0
+
+    index = get_vector_index_registry().get(partition)
+    index.catch_up(fetch_since, fetch_watermark)
+    hits = index.search(embedding, limit)
+    if not hits:
+        return []
+    found = {
+        row.id: row
+        for row in session.exec(select(model).where(model_id.in_([row_id for row_id, _ in hits])))
+    }
+    return [found[row_id] for row_id, _ in hits if row_id in found]
@@ -5,7 +5,7 @@ from enum import Enum
 from typing import Annotated
 
 from fastapi import Path, Query
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, StringConstraints
 
 from app.domain.risk_level import RiskLevel  # noqa: F401
 
@@ -20,6 +20,17 @@ SymbolPathParam = Annotated[
     ),
 ]
 
+SymbolItem = Annotated[
+    str,
+    StringConstraints(
+        min_length=1,
+        max_length=10,
+        pattern=r"^[A-Za-z][A-Za-z0-9.-]{0,9}$",
+    ),
+]
+
+MAX_BATCH_SYMBOLS = 500
+
 DaysQueryParam = Annotated[
     int,
     Query(
@@ -126,3 +137,32 @@ class RiskProfileResponse(BaseModel):
     days: int = Field(ge=1, le=3650, description="Requested trailing day window.")
     mode: RiskProfileMode = Field(description="Rule-based or model-based classification mode.")
     profile: RiskProfileData = Field(description="Computed risk profile.")
+
+
+class RiskProfileBatchRequest(BaseModel):
+    """Batch risk-profile request payload."""
+
+    symbols: list[SymbolItem] = Field(
+        min_length=1,
+        max_length=MAX_BATCH_SYMBOLS,
+        description=f"Ticker symbols to profile (up to {MAX_BATCH_SYMBOLS}).",
+    )
+    days: int = Field(default=90, ge=1, le=3650, description="Trailing day window.")
+    mode: RiskProfileMode = Field(
+        default=RiskProfileMode.rule,
+        description="Rule-based or model-based classification mode.",
+    )
+
+
+class RiskProfileBatchResponse(BaseModel):
+    """Batch risk-profile endpoint response schema."""
+
+    days: int = Field(ge=1, le=3650, description="Requested trailing day window.")
+    mode: RiskProfileMode = Field(description="Rule-based or model-based classification mode.")
+    profiles: dict[str, RiskProfileData] = Field(
+        description="Computed risk profile per symbol."
+    )
+    errors: dict[str, str] = Field(
+        default_factory=dict,
+        description="Error message per symbol that could not be profiled.",
+    )
@@ -4,6 +4,7 @@ from app.security.api_key import (
     api_key_header,
     build_api_key_record,
     hash_api_key,
+    invalidate_api_key_cache,
     require_api_key,
     verify_api_key_hash,
 )
@@ -12,6 +13,7 @@ __all__ = [
     "api_key_header",
     "build_api_key_record",
     "hash_api_key",
+    "invalidate_api_key_cache",
     "require_api_key",
     "verify_api_key_hash",
 ]
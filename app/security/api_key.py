@@ -1,14 +1,28 @@
-"""API-key authentication utilities and dependency wiring."""
+"""API-key authentication utilities and dependency wiring.
+
+Key lookups are cached in memory by key hash, so authenticating a request
+normally needs no database access. Stored keys are cached for
+``API_KEY_CACHE_TTL_SECONDS``; because keys are usually created and revoked
+outside the API process, a deactivated or deleted key keeps working for up
+to that long. Unknown hashes go to a separate, smaller cache with the much
+shorter ``API_KEY_NEGATIVE_CACHE_TTL_SECONDS``, so random keys cannot evict
+valid entries and a newly created key is accepted within seconds.
+``invalidate_api_key_cache`` drops entries immediately, but only in the
+calling process.
+"""
 
 import hashlib
 import hmac
 import logging
+from functools import lru_cache
 
 from fastapi import Depends, HTTPException, Security
 from fastapi.security import APIKeyHeader
-from sqlmodel import Session, select
+from sqlmodel import Session
 
+from app.core.cache import TTLCache
 from app.core.config import get_settings
+from app.repositories.api_key_repo import ApiKeyRepository
 from app.repositories.models import ApiKey
 from app.repositories.session import get_session
 
@@ -17,6 +31,69 @@ logger = logging.getLogger(__name__)
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
 
+class _UnknownKeyError(LookupError):
+    """Raised by the key loader when no key is stored for a hash."""
+
+
+@lru_cache
+def _get_key_cache() -> TTLCache[ApiKey]:
+    """Return the process-wide cache of stored API keys keyed by key hash."""
+
+    settings = get_settings()
+    return TTLCache(settings.api_key_cache_max_entries, settings.api_key_cache_ttl_seconds)
+
+
+@lru_cache
+def _get_unknown_key_cache() -> TTLCache[bool]:
+    """Return the short-lived cache of key hashes with no stored key."""
+
+    settings = get_settings()
+    return TTLCache(
+        settings.api_key_negative_cache_max_entries,
+        settings.api_key_negative_cache_ttl_seconds,
+    )
+
+
+def invalidate_api_key_cache(key_hash: str | None = None) -> None:
+    """Drop one cached key lookup by hash, or all of them when ``key_hash`` is None.
+
+    Only affects the current process; other workers catch up when their
+    entries expire.
+    """
+
+    for cache in (_get_key_cache(), _get_unknown_key_cache()):
+        if key_hash is None:
+            cache.clear()
+        else:
+            cache.invalidate(key_hash)
+
+
+def _lookup_key(session: Session, key_hash: str) -> ApiKey:
+    """Load a key by hash and detach a copy that is safe to share across requests.
+
+    Raises:
+        _UnknownKeyError: If no key is stored for the hash.
+    """
+
+    row = ApiKeyRepository(session).get_by_hash(key_hash)
+    if row is None:
+        raise _UnknownKeyError(key_hash)
+    return ApiKey(**row.model_dump())
+
+
+def _find_key(session: Session, key_hash: str) -> ApiKey | None:
+    """Return the stored key for a hash through the key caches, or None if unknown."""
+
+    unknown = _get_unknown_key_cache()
+    if unknown.get(key_hash):
+        return None
+    try:
+        return _get_key_cache().get_or_load(key_hash, lambda: _lookup_key(session, key_hash))
+    except _UnknownKeyError:
+        unknown.put(key_hash, True)
+        return None
+
+
 def hash_api_key(raw_api_key: str, salt: str) -> str:
     """Return a deterministic SHA-256 hash for an API key + salt."""
 
@@ -46,7 +123,11 @@ def require_api_key(
     api_key: str | None = Security(api_key_header),
     session: Session = Depends(get_session),
 ) -> ApiKey:
-    """Authenticate request using X-API-Key header against DB-stored key hashes."""
+    """Authenticate request using X-API-Key header against DB-stored key hashes.
+
+    Lookups go through the in-memory key caches; the database is queried by
+    the unique ``key_hash`` index only on a cache miss.
+    """
 
     if not api_key:
         logger.warning("Auth rejected: missing X-API-Key header")
@@ -54,20 +135,14 @@ def require_api_key(
 
     settings = get_settings()
     candidate_hash = hash_api_key(api_key, settings.api_key_salt)
-    keys = session.exec(select(ApiKey)).all()
-
-    inactive_match = False
+    key_row = _find_key(session, candidate_hash)
 
-    for key_row in keys:
-        if hmac.compare_digest(candidate_hash, key_row.key_hash):
-            if not key_row.is_active:
-                inactive_match = True
-                continue
-            return key_row
+    if key_row is None or not hmac.compare_digest(candidate_hash, key_row.key_hash):
+        logger.warning("Auth rejected: invalid API key")
+        raise HTTPException(status_code=401, detail="Invalid API key.")
 
-    if inactive_match:
+    if not key_row.is_active:
         logger.warning("Auth rejected: inactive API key presented (name=%s)", key_row.name)
         raise HTTPException(status_code=403, detail="API key is inactive.")
 
-    logger.warning("Auth rejected: invalid API key")
-    raise HTTPException(status_code=401, detail="Invalid API key.")
+    return key_row
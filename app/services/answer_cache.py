@@ -0,0 +1,140 @@
+"""Semantic answer cache for document chat.
+
+Stores the question embedding, answer and sources of each RAG answer per
+document. A new question reuses a cached answer when its cosine similarity
+to a stored question reaches ``ANSWER_CACHE_SIMILARITY_THRESHOLD``. Each
+document holds at most ``ANSWER_CACHE_MAX_ENTRIES_PER_DOCUMENT`` answers and
+at most ``ANSWER_CACHE_MAX_DOCUMENTS`` documents are cached; both evict the
+least recently used entry. Re-ingesting a document must call ``invalidate``.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from app.core.config import get_settings
+
+
+@dataclass(frozen=True)
+class CachedAnswer:
+    """A previously generated answer and the chunk texts it was grounded in."""
+
+    answer: str
+    sources: tuple[str, ...]
+    similarity: float
+
+
+class _DocumentAnswers:
+    """Fixed-capacity matrix of normalized question embeddings with LRU slots."""
+
+    def __init__(self, capacity: int, dimensions: int) -> None:
+        self.embeddings = np.zeros((capacity, dimensions), dtype=np.float32)
+        self.answers: list[tuple[str, tuple[str, ...]] | None] = [None] * capacity
+        self.last_used = np.full(capacity, -1, dtype=np.int64)
+        self.size = 0
+
+    def best_match(self, query: np.ndarray) -> tuple[int, float]:
+        similarities = self.embeddings[: self.size] @ query
+        slot = int(np.argmax(similarities))
+        return slot, float(similarities[slot])
+
+    def free_slot(self) -> int:
+        if self.size < len(self.answers):
+            self.size += 1
+            return self.size - 1
+        return int(np.argmin(self.last_used))
+
+
+class SemanticAnswerCache:
+    """Per-document nearest-question cache with bounded size."""
+
+    def __init__(
+        self,
+        similarity_threshold: float,
+        max_entries_per_document: int,
+        max_documents: int,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            similarity_threshold: Minimum cosine similarity for a hit.
+            max_entries_per_document: Answers kept per document; ``0`` disables the cache.
+            max_documents: Documents kept before the least recently used is dropped.
+        """
+        self._threshold = similarity_threshold
+        self._per_document = max_entries_per_document
+        self._max_documents = max_documents
+        self._documents: OrderedDict[int, _DocumentAnswers] = OrderedDict()
+        self._lock = threading.Lock()
+        self._tick = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _normalize(embedding: list[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def lookup(self, document_id: int, embedding: list[float]) -> CachedAnswer | None:
+        """Return the cached answer for the most similar stored question, if close enough."""
+        query = self._normalize(embedding)
+        with self._lock:
+            entries = self._documents.get(document_id)
+            if entries is None or entries.size == 0:
+                self.misses += 1
+                return None
+            slot, similarity = entries.best_match(query)
+            if similarity < self._threshold:
+                self.misses += 1
+                return None
+            self._documents.move_to_end(document_id)
+            self._tick += 1
+            entries.last_used[slot] = self._tick
+            self.hits += 1
+            answer, sources = entries.answers[slot]  # type: ignore[misc]
+            return CachedAnswer(answer=answer, sources=sources, similarity=similarity)
+
+    def store(self, document_id: int, embedding: list[float], answer: str, sources: list[str]) -> None:
+        """Remember an answer, evicting the least recently used one if the document is full."""
+        if self._per_document <= 0 or self._max_documents <= 0:
+            return
+        vector = self._normalize(embedding)
+        with self._lock:
+            entries = self._documents.get(document_id)
+            if entries is None:
+                entries = _DocumentAnswers(self._per_document, len(vector))
+                self._documents[document_id] = entries
+                while len(self._documents) > self._max_documents:
+                    self._documents.popitem(last=False)
+            self._documents.move_to_end(document_id)
+            slot = entries.free_slot()
+            self._tick += 1
+            entries.embeddings[slot] = vector
+            entries.answers[slot] = (answer, tuple(sources))
+            entries.last_used[slot] = self._tick
+
+    def invalidate(self, document_id: int) -> None:
+        """Drop every cached answer for a document."""
+        with self._lock:
+            self._documents.pop(document_id, None)
+
+    def stats(self) -> dict[str, int]:
+        """Return hit and miss counters plus the number of cached answers."""
+        with self._lock:
+            size = sum(entries.size for entries in self._documents.values())
+            return {"hits": self.hits, "misses": self.misses, "coalesced": 0, "size": size}
+
+
+@lru_cache
+def get_answer_cache() -> SemanticAnswerCache:
+    """Return the process-wide answer cache configured from settings."""
+    settings = get_settings()
+    return SemanticAnswerCache(
+        similarity_threshold=settings.answer_cache_similarity_threshold,
+        max_entries_per_document=settings.answer_cache_max_entries_per_document,
+        max_documents=settings.answer_cache_max_documents,
+    )
@@ -1,73 +1,180 @@
 """Document service — text extraction, chunking, and embedding storage."""
 
-import io
+from collections.abc import Callable, Iterable, Iterator
+from itertools import chain, islice
+from typing import Any
 
-from pypdf import PdfReader
+import structlog
 from sqlmodel import Session
 
+from app.core.config import get_settings
+from app.infrastructure.pdf.page_extractor import iter_pdf_pages
 from app.repositories.document_repo import DocumentRepository
 from app.repositories.models import DocumentChunk
-from app.services.embeddings import embed_text
+from app.services.answer_cache import get_answer_cache
+from app.services.embeddings import content_hash, embed_texts
+
+logger = structlog.get_logger()
 
 _CHUNK_SIZE = 500   # characters per chunk
 _CHUNK_OVERLAP = 50  # characters of overlap between consecutive chunks
+_SUPPORTED_SUFFIXES = (".pdf", ".txt", ".md")
+
+# Receives keyword counters named after ``IngestionJob`` columns
+# (``pages_total``, ``pages_extracted``, ``chunks_total``, ``chunks_embedded``).
+ProgressCallback = Callable[..., None]
+
+
+def validate_file_type(filename: str) -> None:
+    """Reject files ingestion cannot read.
+
+    Raises:
+        ValueError: If the file type is unsupported.
+    """
+    if not filename.lower().endswith(_SUPPORTED_SUFFIXES):
+        raise ValueError(
+            f"Unsupported file type '{filename}'. Upload a .pdf, .txt, or .md file."
+        )
+
 
+def _join_pages(pages: Iterable[str]) -> Iterator[str]:
+    for index, page in enumerate(pages):
+        if index:
+            yield "\n"
+        yield page
 
-def _extract_text(filename: str, file_bytes: bytes) -> str:
-    """Extract plain text from a PDF or text file.
+
+def _iter_text(
+    filename: str, file_bytes: bytes, progress: ProgressCallback | None = None
+) -> Iterator[str]:
+    """Yield a document's text in pieces, as pages are extracted.
+
+    Pages are joined with newlines and the whole text is stripped, exactly as
+    ``"\\n".join(pages).strip()`` would, without holding it in memory at once.
 
     Args:
         filename: Original filename used to detect file type.
         file_bytes: Raw file content.
+        progress: Optional callback receiving page counters as pages are read.
 
-    Returns:
-        Extracted text string.
+    Yields:
+        Consecutive non-empty pieces of the document text.
 
     Raises:
-        ValueError: If the file type is unsupported or text extraction fails.
+        ValueError: If the file type is unsupported.
     """
-    lower = filename.lower()
-    if lower.endswith(".pdf"):
-        reader = PdfReader(io.BytesIO(file_bytes))
-        pages = [page.extract_text() or "" for page in reader.pages]
-        text = "\n".join(pages).strip()
-        if not text:
-            raise ValueError("Could not extract text from PDF — it may be image-based.")
-        return text
-    if lower.endswith(".txt") or lower.endswith(".md"):
-        return file_bytes.decode("utf-8", errors="replace").strip()
-    raise ValueError(
-        f"Unsupported file type '{filename}'. Upload a .pdf, .txt, or .md file."
-    )
-
-
-def _split_into_chunks(text: str) -> list[str]:
-    """Split text into overlapping fixed-size character chunks.
+    validate_file_type(filename)
+    if filename.lower().endswith(".pdf"):
+        pages = iter_pdf_pages(
+            file_bytes,
+            None
+            if progress is None
+            else lambda total, done: progress(pages_total=total, pages_extracted=done),
+        )
+        pieces = _join_pages(pages)
+    else:
+        pieces = iter([file_bytes.decode("utf-8", errors="replace")])
+        if progress is not None:
+            progress(pages_total=1, pages_extracted=1)
+
+    started = False
+    trailing = ""  # whitespace held back until more text follows it
+    for piece in pieces:
+        if not started:
+            piece = piece.lstrip()
+            if not piece:
+                continue
+            started = True
+        body = piece.rstrip()
+        if body:
+            yield trailing + body
+            trailing = piece[len(body):]
+        else:
+            trailing += piece
+
+
+def _iter_chunks(pieces: Iterable[str]) -> Iterator[str]:
+    """Split streamed text into overlapping fixed-size character chunks.
+
+    Yields the same chunks as slicing the concatenated text every
+    ``_CHUNK_SIZE - _CHUNK_OVERLAP`` characters, while buffering at most one
+    chunk plus one piece.
 
     Args:
-        text: The full document text.
+        pieces: Consecutive pieces of the document text.
+
+    Yields:
+        Text chunk strings in document order.
+    """
+    step = _CHUNK_SIZE - _CHUNK_OVERLAP
+    buffer = ""
+    for piece in pieces:
+        buffer += piece
+        # Slice at an offset and trim once per piece: trimming after every
+        # chunk would copy a large piece (a whole .txt upload) per chunk.
+        start = 0
+        while len(buffer) - start >= _CHUNK_SIZE:
+            yield buffer[start : start + _CHUNK_SIZE]
+            start += step
+        buffer = buffer[start:]
+    for start in range(0, len(buffer), step):
+        yield buffer[start : start + _CHUNK_SIZE]
+
+
+def _batched(items: Iterator[str], size: int) -> Iterator[list[str]]:
+    while batch := list(islice(items, size)):
+        yield batch
+
+
+def _reuse_or_embed(
+    repo: DocumentRepository, texts: list[str], hashes: list[str]
+) -> tuple[dict[str, Any], int]:
+    """Return an embedding per content hash, computing only those not stored yet.
+
+    Chunks repeated within the batch or already stored for any document
+    (e.g. filing boilerplate) are embedded at most once.
 
     Returns:
-        List of text chunk strings.
+        Tuple of ``(embeddings by hash, number of texts sent to the model)``.
     """
-    chunks: list[str] = []
-    start = 0
-    while start < len(text):
-        end = start + _CHUNK_SIZE
-        chunks.append(text[start:end])
-        start += _CHUNK_SIZE - _CHUNK_OVERLAP
-    return chunks
+    embeddings: dict[str, Any] = {}
+    stored = repo.find_embeddings_by_hash(hashes)
+    missing: dict[str, str] = {}
+    for text, chunk_hash in zip(texts, hashes):
+        if chunk_hash in stored:
+            embeddings[chunk_hash] = stored[chunk_hash]
+        else:
+            missing.setdefault(chunk_hash, text)
+    if missing:
+        embeddings.update(zip(missing, embed_texts(list(missing.values()))))
+    return embeddings, len(missing)
 
 
 def ingest_document(
-    filename: str, file_bytes: bytes, session: Session
+    filename: str,
+    file_bytes: bytes,
+    session: Session,
+    document_id: int | None = None,
+    progress: ProgressCallback | None = None,
 ) -> tuple[int, int]:
-    """Extract, chunk, embed, and persist a document.
+    """Extract, chunk, embed, and persist a document as a streaming pipeline.
+
+    Pages flow through the chunker into micro-batches of
+    ``INGEST_BATCH_SIZE`` chunks; each batch is embedded and inserted before
+    the next batch is read, so embeddings and chunk rows never pile up for the
+    whole document. Only the extracted text itself is kept, and written to the
+    document row in one statement once every chunk is stored. Chunks whose
+    content hash is already stored reuse that embedding instead of calling the
+    model. If a batch fails, the chunks already stored are removed again.
 
     Args:
         filename: Original uploaded filename.
         file_bytes: Raw file content.
         session: Active database session.
+        document_id: Existing placeholder document to fill in (as created by
+            the background upload path); its previous chunks are replaced.
+            A new document is created when omitted.
+        progress: Optional callback receiving page and chunk counters.
 
     Returns:
         Tuple of ``(document_id, chunk_count)``.
@@ -75,23 +182,60 @@ def ingest_document(
     Raises:
         ValueError: On unsupported file type or empty PDF.
     """
-    text = _extract_text(filename, file_bytes)
-    raw_chunks = _split_into_chunks(text)
+    text_pieces: list[str] = []
+
+    def record(pieces: Iterator[str]) -> Iterator[str]:
+        for piece in pieces:
+            text_pieces.append(piece)
+            yield piece
+
+    chunk_stream = _iter_chunks(record(_iter_text(filename, file_bytes, progress)))
+    first_chunk = next(chunk_stream, None)
+    if first_chunk is None and filename.lower().endswith(".pdf"):
+        raise ValueError("Could not extract text from PDF — it may be image-based.")
+    chunk_stream = chain([first_chunk] if first_chunk is not None else [], chunk_stream)
 
     repo = DocumentRepository(session)
-    doc = repo.save_document(filename=filename, content_text=text)
-
-    chunks: list[DocumentChunk] = []
-    for idx, chunk_text in enumerate(raw_chunks):
-        embedding = embed_text(chunk_text)
-        chunks.append(
-            DocumentChunk(
-                document_id=doc.id,
-                chunk_index=idx,
-                chunk_text=chunk_text,
-                embedding=embedding,
+    if document_id is None:
+        doc = repo.save_document(filename=filename, content_text="")
+    else:
+        doc = repo.update_document_text(document_id, "")
+        repo.delete_chunks(document_id)
+
+    chunk_count = 0
+    reused = 0
+    try:
+        for batch in _batched(chunk_stream, get_settings().ingest_batch_size):
+            hashes = [content_hash(chunk_text) for chunk_text in batch]
+            embeddings, computed = _reuse_or_embed(repo, batch, hashes)
+            reused += len(batch) - computed
+            repo.save_chunks(
+                [
+                    DocumentChunk(
+                        document_id=doc.id,
+                        chunk_index=chunk_count + offset,
+                        chunk_text=chunk_text,
+                        content_hash=chunk_hash,
+                        embedding=embeddings[chunk_hash],
+                    )
+                    for offset, (chunk_text, chunk_hash) in enumerate(zip(batch, hashes))
+                ]
             )
-        )
-
-    repo.save_chunks(chunks)
-    return doc.id, len(chunks)
+            chunk_count += len(batch)
+            if progress is not None:
+                progress(chunks_embedded=chunk_count)
+        repo.update_document_text(doc.id, "".join(text_pieces))
+    except Exception:
+        repo.delete_chunks(doc.id)
+        raise
+
+    if progress is not None:
+        progress(chunks_total=chunk_count, chunks_embedded=chunk_count)
+    get_answer_cache().invalidate(doc.id)
+    logger.info(
+        "document.ingested",
+        document_id=doc.id,
+        chunk_count=chunk_count,
+        reused_embeddings=reused,
+    )
+    return doc.id, chunk_count
@@ -1,12 +1,28 @@
-"""Embeddings service — generates vector embeddings locally via sentence-transformers."""
+"""Embeddings service — generates vector embeddings locally via sentence-transformers.
 
+Embeddings are cached by a SHA-256 of the model name and text: an in-memory
+LRU tier (``EMBEDDING_CACHE_MAX_ENTRIES``) of float32 arrays in front of an
+optional on-disk SQLite tier (``EMBEDDING_CACHE_PATH``, off by default) that
+keeps warm entries across restarts. Only single-text lookups such as search
+queries fill the memory tier; bulk ingestion reads it but does not populate
+it, since stored chunks are already reused by content hash in the database.
+"""
+
+import hashlib
+import math
 from functools import lru_cache
 import time
+import numpy as np
 import structlog
 
 from sentence_transformers import SentenceTransformer
 
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.infrastructure.embeddings.embedding_store import EmbeddingStore
+
 _MODEL_NAME = "all-MiniLM-L6-v2"
+_BATCH_SIZE = 64
 
 logger = structlog.get_logger()
 
@@ -17,10 +33,44 @@ def _get_model() -> SentenceTransformer:
     return SentenceTransformer(_MODEL_NAME)
 
 
+@lru_cache
+def _get_embedding_cache() -> TTLCache[np.ndarray]:
+    """Return the in-memory embedding tier; entries never expire, only get evicted."""
+    return TTLCache(get_settings().embedding_cache_max_entries, math.inf)
+
+
+@lru_cache
+def _get_embedding_store() -> EmbeddingStore | None:
+    """Return the persistent embedding tier, or None when ``EMBEDDING_CACHE_PATH`` is empty."""
+    path = get_settings().embedding_cache_path
+    if not path:
+        return None
+    return EmbeddingStore(path)
+
+
+def embedding_cache_stats() -> dict[str, dict[str, int]]:
+    """Return hit and miss counters for each embedding cache tier."""
+    stats = {"memory": _get_embedding_cache().stats()}
+    store = _get_embedding_store()
+    if store is not None:
+        stats["persistent"] = store.stats()
+    return stats
+
+
+def content_hash(text: str) -> str:
+    """Return the content address of ``text`` under the current model.
+
+    Keys both embedding cache tiers and ``DocumentChunk.content_hash``, so a
+    model change never reuses vectors computed by another model.
+    """
+    return hashlib.sha256(f"{_MODEL_NAME}\0{text}".encode("utf-8")).hexdigest()
+
+
 def embed_text(text: str) -> list[float]:
     """Generate a 384-dimensional embedding vector for the given text.
 
     Uses the ``all-MiniLM-L6-v2`` model locally — no API key required.
+    Repeated texts are served from the embedding cache.
 
     Args:
         text: The text to embed. Typically an LLM-generated explanation.
@@ -28,9 +78,91 @@ def embed_text(text: str) -> list[float]:
     Returns:
         List of 384 floats representing the semantic embedding.
     """
+    key = content_hash(text)
+    return _get_embedding_cache().get_or_load(key, lambda: _load_embedding(key, text)).tolist()
+
+
+def _load_embedding(key: str, text: str) -> np.ndarray:
+    """Read one embedding from the persistent tier or compute and persist it."""
+    store = _get_embedding_store()
+    if store is not None:
+        stored = store.get_many([key]).get(key)
+        if stored is not None:
+            return np.asarray(stored, dtype=np.float32)
     model = _get_model()
     start = time.time()
-    vec = model.encode(text, normalize_embeddings=True).tolist()
+    vec = np.asarray(model.encode(text, normalize_embeddings=True), dtype=np.float32)
     duration = time.time() - start
     logger.debug("embedding.generate", text_len=len(text), duration_seconds=round(duration, 3))
+    if store is not None:
+        store.put_many({key: vec})
     return vec
+
+
+def embed_texts(texts: list[str], batch_size: int = _BATCH_SIZE) -> list[list[float]]:
+    """Generate embeddings for many texts in batched model calls.
+
+    Cached texts are served from the memory or persistent tier; the rest
+    are sorted by length before batching so each batch pads to a similar
+    sequence length. Results are returned in input order. New vectors go to
+    the persistent tier only, so ingesting a large document does not flush
+    query embeddings out of the memory tier.
+
+    Args:
+        texts: The texts to embed, e.g. the chunks of one document.
+        batch_size: Number of texts encoded per forward pass.
+
+    Returns:
+        One 384-float embedding per input text, in the same order.
+    """
+    if not texts:
+        return []
+    keys = [content_hash(text) for text in texts]
+    cache = _get_embedding_cache()
+    store = _get_embedding_store()
+
+    vectors: dict[str, list[float]] = {}
+    for key in dict.fromkeys(keys):
+        cached = cache.get(key)
+        if cached is not None:
+            vectors[key] = cached.tolist()
+
+    missing = {key: text for key, text in zip(keys, texts) if key not in vectors}
+    if missing and store is not None:
+        stored = store.get_many(missing)
+        for key, vec in stored.items():
+            vectors[key] = vec
+            del missing[key]
+
+    if missing:
+        computed = dict(zip(missing, _encode_batched(list(missing.values()), batch_size)))
+        vectors.update(computed)
+        if store is not None:
+            store.put_many(computed)
+
+    return [list(vectors[key]) for key in keys]
+
+
+def _encode_batched(texts: list[str], batch_size: int) -> list[list[float]]:
+    """Encode texts in length-sorted batches and return vectors in input order."""
+    model = _get_model()
+    start = time.time()
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    vectors: list[list[float]] = [[] for _ in texts]
+    for offset in range(0, len(order), batch_size):
+        batch = order[offset : offset + batch_size]
+        encoded = model.encode(
+            [texts[i] for i in batch],
+            batch_size=batch_size,
+            normalize_embeddings=True,
+        )
+        for i, vec in zip(batch, encoded.tolist()):
+            vectors[i] = vec
+    duration = time.time() - start
+    logger.debug(
+        "embedding.generate_batch",
+        count=len(texts),
+        batch_size=batch_size,
+        duration_seconds=round(duration, 3),
+    )
+    return vectors
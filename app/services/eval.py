@@ -1,10 +1,10 @@
 """Evaluation service — LLM-as-judge to score explanation quality."""
 
-from openai import OpenAI
 import time
 import structlog
 
 from app.core.config import get_settings
+from app.infrastructure.llm.groq_client import get_llm_client
 from app.services.metrics_logger import log_llm_metric
 
 logger = structlog.get_logger()
@@ -41,10 +41,7 @@ def score_explanation(explanation: str) -> int:
     if not settings.groq_api_key:
         raise ValueError("GROQ_API_KEY is not set.")
 
-    client = OpenAI(
-        api_key=settings.groq_api_key,
-        base_url="https://api.groq.com/openai/v1",
-    )
+    client = get_llm_client()
 
     start = time.time()
     response = client.chat.completions.create(
@@ -0,0 +1,243 @@
+"""Background document ingestion — database-backed job queue and local worker pool.
+
+Uploads store the raw bytes in ``ingestion_jobs`` and return immediately.
+``INGESTION_WORKERS`` daemon threads claim queued jobs, run
+``ingest_document`` and write page/chunk progress back to the job row, which
+``GET /documents/{id}/status`` reports. Running jobs whose heartbeat is older
+than ``INGESTION_JOB_LEASE_SECONDS`` (e.g. after a crash) are requeued, up to
+``INGESTION_MAX_ATTEMPTS`` attempts in total.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from functools import lru_cache
+from typing import Any
+
+import structlog
+from sqlmodel import Session
+
+from app.core.config import get_settings
+from app.repositories.document_repo import DocumentRepository
+from app.repositories.ingestion_job_repo import IngestionJobRepository
+from app.repositories.models import IngestionJob, utc_now
+from app.repositories.session import get_engine
+from app.services.document_service import ingest_document, validate_file_type
+
+logger = structlog.get_logger()
+
+_PROGRESS_INTERVAL_SECONDS = 1.0
+_MAX_BACKOFF_SECONDS = 60.0
+
+
+def submit_document(filename: str, file_bytes: bytes, session: Session) -> IngestionJob:
+    """Create a placeholder document and queue its ingestion.
+
+    Args:
+        filename: Original uploaded filename.
+        file_bytes: Raw file content.
+        session: Active database session.
+
+    Returns:
+        The queued job; ``document_id`` is usable once it has succeeded.
+
+    Raises:
+        ValueError: On unsupported file type.
+    """
+    validate_file_type(filename)
+    doc = DocumentRepository(session).save_document(filename=filename, content_text="")
+    job = IngestionJobRepository(session).enqueue(doc.id, filename, file_bytes)
+    get_ingestion_worker_pool().notify()
+    return job
+
+
+class _ProgressReporter:
+    """Writes ingestion counters to the job row at most once per interval."""
+
+    def __init__(
+        self, job_id: int, attempt: int, interval_seconds: float = _PROGRESS_INTERVAL_SECONDS
+    ) -> None:
+        self._job_id = job_id
+        self._attempt = attempt
+        self._interval = interval_seconds
+        self._pending: dict[str, int] = {}
+        self._last_write = 0.0
+
+    def __call__(self, **counters: int) -> None:
+        self._pending.update(counters)
+        if time.monotonic() - self._last_write >= self._interval:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        with Session(get_engine()) as session:
+            IngestionJobRepository(session).update_progress(
+                self._job_id, self._attempt, **self._pending
+            )
+        self._pending = {}
+        self._last_write = time.monotonic()
+
+
+def _record_outcome(job_id: int, attempt: int, error: str | None, log: Any) -> bool:
+    """Mark a job attempt succeeded or failed; return False if nothing was recorded.
+
+    A job whose outcome could not be written stays ``running`` and is
+    requeued once its lease expires. An attempt that was already requeued
+    and claimed again is left to the newer attempt.
+    """
+    try:
+        with Session(get_engine()) as session:
+            repo = IngestionJobRepository(session)
+            if error is None:
+                written = repo.mark_succeeded(job_id, attempt)
+            else:
+                written = repo.mark_failed(job_id, attempt, error)
+    except Exception as e:
+        log.warning("ingestion.job_status_write_failed", error=str(e))
+        return False
+    if not written:
+        log.warning("ingestion.job_attempt_superseded", attempt=attempt)
+    return written
+
+
+def run_ingestion_job(job: IngestionJob) -> None:
+    """Ingest a claimed job's upload and record the outcome on the job row."""
+    log = logger.bind(job_id=job.id, document_id=job.document_id, filename=job.filename)
+    progress = _ProgressReporter(job.id, job.attempts)  # type: ignore[arg-type]
+    start = time.perf_counter()
+    try:
+        if job.file_bytes is None:
+            raise ValueError("Uploaded file is no longer available.")
+        with Session(get_engine()) as session:
+            _, chunk_count = ingest_document(
+                job.filename,
+                job.file_bytes,
+                session,
+                document_id=job.document_id,
+                progress=progress,
+            )
+        progress.flush()
+    except Exception as e:
+        log.warning("ingestion.job_failed", error=str(e))
+        _record_outcome(job.id, job.attempts, str(e), log)  # type: ignore[arg-type]
+        return
+
+    if not _record_outcome(job.id, job.attempts, None, log):  # type: ignore[arg-type]
+        return
+    log.info(
+        "ingestion.job_succeeded",
+        chunk_count=chunk_count,
+        duration_seconds=round(time.perf_counter() - start, 3),
+    )
+
+
+def _claim_next_job(lease_seconds: float, max_attempts: int) -> IngestionJob | None:
+    with Session(get_engine()) as session:
+        repo = IngestionJobRepository(session)
+        requeued = repo.requeue_stale(utc_now() - timedelta(seconds=lease_seconds), max_attempts)
+        if requeued:
+            logger.warning("ingestion.jobs_requeued", count=requeued)
+        return repo.claim_next()
+
+
+class IngestionWorkerPool:
+    """Daemon threads that poll the job table and run ingestion jobs."""
+
+    def __init__(
+        self,
+        workers: int,
+        poll_interval_seconds: float,
+        lease_seconds: float,
+        max_attempts: int,
+        run_job: Callable[[IngestionJob], None] = run_ingestion_job,
+    ) -> None:
+        """Initialize a stopped pool.
+
+        Args:
+            workers: Number of worker threads; ``0`` disables the pool.
+            poll_interval_seconds: Idle wait between queue polls.
+            lease_seconds: Heartbeat age after which a running job is requeued.
+            max_attempts: Attempts before an abandoned job is failed.
+            run_job: Callable executing one claimed job.
+        """
+        self._workers = workers
+        self._poll_interval = poll_interval_seconds
+        self._lease = lease_seconds
+        self._max_attempts = max_attempts
+        self._run_job = run_job
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def start(self) -> None:
+        """Start the worker threads if they are not already running."""
+        if self._workers <= 0 or any(thread.is_alive() for thread in self._threads):
+            return
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._run, name=f"ingestion-worker-{i}", daemon=True)
+            for i in range(self._workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Signal the workers to exit after their current job and wait for them.
+
+        Jobs still running past ``timeout`` are picked up again after their
+        lease expires.
+        """
+        self._stop.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def notify(self) -> None:
+        """Wake idle workers because a job was just queued."""
+        self._wake.set()
+
+    def run_once(self) -> bool:
+        """Claim and run one job; return whether a job was found.
+
+        Raises:
+            Exception: Whatever claiming or running the job raised, e.g. when
+                the database is unreachable.
+        """
+        job = _claim_next_job(self._lease, self._max_attempts)
+        if job is None:
+            return False
+        self._run_job(job)
+        return True
+
+    def _run(self) -> None:
+        failures = 0
+        while not self._stop.is_set():
+            try:
+                found = self.run_once()
+            except Exception as e:
+                # Keep the thread alive through database outages, backing off
+                # exponentially so a down database is not hammered.
+                failures += 1
+                delay = min(self._poll_interval * 2**failures, _MAX_BACKOFF_SECONDS)
+                logger.warning("ingestion.worker_error", error=str(e), retry_in_seconds=delay)
+                self._stop.wait(delay)
+                continue
+            failures = 0
+            if found:
+                continue
+            self._wake.wait(self._poll_interval)
+            self._wake.clear()
+
+
+@lru_cache
+def get_ingestion_worker_pool() -> IngestionWorkerPool:
+    """Return the process-wide ingestion worker pool configured from settings."""
+    settings = get_settings()
+    return IngestionWorkerPool(
+        workers=settings.ingestion_workers,
+        poll_interval_seconds=settings.ingestion_poll_interval_seconds,
+        lease_seconds=settings.ingestion_job_lease_seconds,
+        max_attempts=settings.ingestion_max_attempts,
+    )
@@ -1,10 +1,30 @@
-"""LLM service — generates plain-English risk explanations via Groq."""
+"""LLM service — generates plain-English risk explanations via Groq.
 
-from openai import OpenAI
+Explanations are cached by a hash of the model name and the exact prompts,
+which embed the symbol, window, risk level and metrics at the 4-decimal
+precision the model sees. Lookups go through an in-memory LRU tier
+(``EXPLANATION_CACHE_MAX_ENTRIES``) and then, if ``EXPLANATION_CACHE_DB`` is
+on, the latest ``risk_explanations`` row stored for the same key; both expire
+after ``EXPLANATION_CACHE_TTL_SECONDS``.
+"""
+
+import hashlib
+import threading
 import time
+from collections.abc import AsyncIterator
+from datetime import timedelta
+from functools import lru_cache
 import structlog
+from sqlmodel import Session
 
+from app.core.cache import TTLCache
 from app.core.config import get_settings
+from app.domain.risk_level import RiskLevel
+from app.infrastructure.llm.groq_client import get_llm_client
+from app.repositories.models import RiskExplanation, utc_now
+from app.repositories.risk_explanation_repo import RiskExplanationRepository
+from app.repositories.session import get_engine
+from app.services.llm_stream import replay_text, stream_chat_completion
 from app.services.metrics_logger import log_llm_metric
 
 logger = structlog.get_logger()
@@ -17,6 +37,51 @@ Focus on what the numbers mean in practical terms and what risks the investor sh
 Do not recommend buying or selling. Do not repeat the raw numbers verbatim.
 """
 
+_MAX_TOKENS = 300
+_TEMPERATURE = 0.4
+
+
+@lru_cache
+def _get_explanation_cache() -> TTLCache[str]:
+    """Return the in-memory explanation tier."""
+    settings = get_settings()
+    return TTLCache(settings.explanation_cache_max_entries, settings.explanation_cache_ttl_seconds)
+
+
+_db_tier_lock = threading.Lock()
+_db_tier_counts = {"hits": 0, "misses": 0}
+
+
+def explanation_cache_stats() -> dict[str, dict[str, int]]:
+    """Return hit and miss counters for each explanation cache tier."""
+    with _db_tier_lock:
+        database = {**_db_tier_counts, "coalesced": 0, "size": 0}
+    return {"memory": _get_explanation_cache().stats(), "database": database}
+
+
+def _count_db_lookup(hit: bool) -> None:
+    with _db_tier_lock:
+        _db_tier_counts["hits" if hit else "misses"] += 1
+
+
+def _user_message(
+    symbol: str, days: int, volatility: float, max_drawdown: float, mean_return: float, risk_level: str
+) -> str:
+    return (
+        f"Analyze the risk profile of {symbol} over the last {days} days.\n\n"
+        f"Risk level: {risk_level}\n"
+        f"Volatility (std of daily returns): {volatility:.4f}\n"
+        f"Maximum drawdown: {max_drawdown:.4f}\n"
+        f"Mean daily return: {mean_return:.4f}\n\n"
+        "Explain what this means for an investor in plain English."
+    )
+
+
+def _explanation_key(model: str, user_message: str) -> str:
+    """Return the cache key for a prompt; changing either prompt changes the key."""
+    payload = f"{model}\0{_SYSTEM_PROMPT}\0{user_message}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
 
 def explain_risk(
     symbol: str,
@@ -28,6 +93,9 @@ def explain_risk(
 ) -> str:
     """Generate a plain-English explanation of risk metrics using an LLM.
 
+    Repeated requests whose prompt would be identical are answered from the
+    explanation cache without calling the LLM.
+
     Args:
         symbol: Asset ticker symbol.
         days: Number of trailing days the metrics cover.
@@ -50,20 +118,126 @@ def explain_risk(
             "GROQ_API_KEY is not set. Add it to your .env file to use this endpoint."
         )
 
-    user_message = (
-        f"Analyze the risk profile of {symbol} over the last {days} days.\n\n"
-        f"Risk level: {risk_level}\n"
-        f"Volatility (std of daily returns): {volatility:.4f}\n"
-        f"Maximum drawdown: {max_drawdown:.4f}\n"
-        f"Mean daily return: {mean_return:.4f}\n\n"
-        "Explain what this means for an investor in plain English."
-    )
+    user_message = _user_message(symbol, days, volatility, max_drawdown, mean_return, risk_level)
+    key = _explanation_key(settings.groq_model, user_message)
+
+    def load() -> str:
+        if settings.explanation_cache_db:
+            cached = _find_stored_explanation(key, settings.explanation_cache_ttl_seconds)
+            _count_db_lookup(cached is not None)
+            if cached is not None:
+                return cached
+        answer = _generate_explanation(symbol, days, user_message)
+        if settings.explanation_cache_db:
+            _store_explanation(key, answer, symbol, days, risk_level)
+        return answer
+
+    return _get_explanation_cache().get_or_load(key, load)
+
+
+def stream_explain_risk(
+    symbol: str,
+    days: int,
+    volatility: float,
+    max_drawdown: float,
+    mean_return: float,
+    risk_level: str,
+) -> AsyncIterator[str]:
+    """Return an async iterator of explanation text deltas for streaming.
+
+    Cache lookups and the API key check happen before this returns, so
+    errors surface before any bytes are sent. A cache hit replays the stored
+    answer as one delta; a miss streams from the LLM and caches the full
+    answer when the stream ends.
+
+    Args:
+        symbol: Asset ticker symbol.
+        days: Number of trailing days the metrics cover.
+        volatility: Standard deviation of daily returns.
+        max_drawdown: Worst peak-to-trough decline ratio.
+        mean_return: Average daily return over the period.
+        risk_level: Classified risk label (LOW, MEDIUM, or HIGH).
+
+    Returns:
+        Async iterator yielding explanation text fragments.
+
+    Raises:
+        ValueError: If the Groq API key is not configured.
+    """
+    settings = get_settings()
 
-    client = OpenAI(
-        api_key=settings.groq_api_key,
-        base_url="https://api.groq.com/openai/v1",
+    if not settings.groq_api_key:
+        raise ValueError(
+            "GROQ_API_KEY is not set. Add it to your .env file to use this endpoint."
+        )
+
+    user_message = _user_message(symbol, days, volatility, max_drawdown, mean_return, risk_level)
+    key = _explanation_key(settings.groq_model, user_message)
+    cache = _get_explanation_cache()
+
+    cached = cache.get(key)
+    if cached is None and settings.explanation_cache_db:
+        cached = _find_stored_explanation(key, settings.explanation_cache_ttl_seconds)
+        _count_db_lookup(cached is not None)
+        if cached is not None:
+            cache.put(key, cached)
+    if cached is not None:
+        return replay_text(cached)
+
+    def remember(answer: str) -> None:
+        cache.put(key, answer)
+        if settings.explanation_cache_db:
+            _store_explanation(key, answer, symbol, days, risk_level)
+
+    return stream_chat_completion(
+        [
+            {"role": "system", "content": _SYSTEM_PROMPT},
+            {"role": "user", "content": user_message},
+        ],
+        operation="explain",
+        max_tokens=_MAX_TOKENS,
+        temperature=_TEMPERATURE,
+        on_complete=remember,
     )
 
+
+def _find_stored_explanation(key: str, ttl_seconds: float) -> str | None:
+    """Return the newest stored explanation for ``key`` younger than the TTL."""
+    try:
+        with Session(get_engine()) as session:
+            return RiskExplanationRepository(session).find_latest(
+                key, since=utc_now() - timedelta(seconds=ttl_seconds)
+            )
+    except Exception as e:
+        logger.warning("llm.explain_cache_read_failed", error=str(e))
+        return None
+
+
+def _store_explanation(
+    key: str, explanation: str, symbol: str, days: int, risk_level: str
+) -> None:
+    """Persist the explanation for the database tier; failures are logged only."""
+    try:
+        with Session(get_engine()) as session:
+            RiskExplanationRepository(session).save(
+                RiskExplanation(
+                    explanation_key=key,
+                    symbol=symbol,
+                    days=days,
+                    risk_level=RiskLevel(risk_level),
+                    model=get_settings().groq_model,
+                    explanation=explanation,
+                )
+            )
+    except Exception as e:
+        logger.warning("llm.explain_cache_write_failed", error=str(e))
+
+
+def _generate_explanation(symbol: str, days: int, user_message: str) -> str:
+    """Call the LLM for an explanation and record its metrics."""
+    settings = get_settings()
+    client = get_llm_client()
+
     start = time.time()
     response = client.chat.completions.create(
         model=settings.groq_model,
@@ -71,8 +245,8 @@ def explain_risk(
             {"role": "system", "content": _SYSTEM_PROMPT},
             {"role": "user", "content": user_message},
         ],
-        max_tokens=300,
-        temperature=0.4,
+        max_tokens=_MAX_TOKENS,
+        temperature=_TEMPERATURE,
     )
     duration = time.time() - start
 
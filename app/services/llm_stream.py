@@ -0,0 +1,119 @@
+"""Streaming chat completions — relay Groq tokens as they are generated.
+
+Metrics are recorded through ``log_llm_metric`` once the stream ends, with
+the same operation names as the blocking calls so ``/metrics`` covers both.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+import structlog
+
+from app.core.config import get_settings
+from app.infrastructure.llm.groq_client import get_async_llm_client
+from app.services.metrics_logger import log_llm_metric
+
+logger = structlog.get_logger()
+
+
+def _usage_from_chunk(chunk: Any) -> Any:
+    """Return token usage from a stream chunk, if it carries any.
+
+    OpenAI-style servers put usage on the final chunk when
+    ``stream_options.include_usage`` is set; Groq also reports it under
+    ``x_groq.usage``.
+    """
+    usage = getattr(chunk, "usage", None)
+    if usage is None:
+        x_groq = getattr(chunk, "x_groq", None)
+        if isinstance(x_groq, dict):
+            usage = x_groq.get("usage")
+        elif x_groq is not None:
+            usage = getattr(x_groq, "usage", None)
+    return usage
+
+
+def _token_count(usage: Any, name: str) -> int | None:
+    if usage is None:
+        return None
+    if isinstance(usage, dict):
+        return usage.get(name)
+    return getattr(usage, name, None)
+
+
+async def replay_text(text: str) -> AsyncIterator[str]:
+    """Yield an already complete answer (e.g. a cache hit) as a single token."""
+    yield text
+
+
+async def stream_chat_completion(
+    messages: list[dict[str, str]],
+    operation: str,
+    max_tokens: int,
+    temperature: float,
+    on_complete: Callable[[str], None] | None = None,
+) -> AsyncIterator[str]:
+    """Yield completion text deltas from the shared async Groq client.
+
+    Args:
+        messages: Chat messages to send.
+        operation: Metric operation name (e.g. ``"explain"``, ``"rag"``).
+        max_tokens: Completion token limit.
+        temperature: Sampling temperature.
+        on_complete: Called in a worker thread with the full stripped answer
+            after the stream finishes, e.g. to populate a cache.
+
+    Yields:
+        Non-empty content deltas in generation order.
+    """
+    settings = get_settings()
+    client = get_async_llm_client()
+
+    start = time.perf_counter()
+    first_token_at: float | None = None
+    parts: list[str] = []
+    usage = None
+
+    stream = await client.chat.completions.create(
+        model=settings.groq_model,
+        messages=messages,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        stream=True,
+        stream_options={"include_usage": True},
+    )
+    async for chunk in stream:
+        usage = _usage_from_chunk(chunk) or usage
+        for choice in chunk.choices:
+            delta = choice.delta.content if choice.delta is not None else None
+            if delta:
+                if first_token_at is None:
+                    first_token_at = time.perf_counter()
+                parts.append(delta)
+                yield delta
+    duration = time.perf_counter() - start
+    answer = "".join(parts).strip()
+
+    logger.info(
+        f"{operation}.stream",
+        model=settings.groq_model,
+        duration_seconds=round(duration, 3),
+        time_to_first_token_seconds=(
+            round(first_token_at - start, 3) if first_token_at is not None else None
+        ),
+        answer_length=len(answer),
+    )
+
+    log_llm_metric(
+        operation=operation,
+        model=settings.groq_model,
+        duration_ms=duration * 1000,
+        input_tokens=_token_count(usage, "prompt_tokens"),
+        output_tokens=_token_count(usage, "completion_tokens"),
+        total_tokens=_token_count(usage, "total_tokens"),
+    )
+
+    if on_complete is not None and answer:
+        await asyncio.to_thread(on_complete, answer)
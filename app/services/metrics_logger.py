@@ -1,10 +1,178 @@
-"""Metrics logging utility — save LLM call metrics to the database."""
+"""Metrics logging utility — buffer LLM call metrics and persist them in batches.
 
+``log_llm_metric`` only enqueues a record; a background thread flushes the
+queue with a multi-row INSERT whenever ``METRICS_BATCH_SIZE`` records are
+waiting or ``METRICS_FLUSH_INTERVAL_SECONDS`` has passed. The queue is bounded:
+when it is full new records are dropped and counted rather than blocking
+the request path. Call ``shutdown_metrics_writer()`` at shutdown to drain it;
+records logged after that are written synchronously.
+"""
+
+import queue
+import threading
+import time
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+import structlog
 from sqlmodel import Session
 
+from app.core.config import get_settings
 from app.repositories.metrics_repo import MetricsRepository
+from app.repositories.models import utc_now
 from app.repositories.session import get_engine
 
+logger = structlog.get_logger()
+
+
+def _persist_batch(records: list[dict[str, Any]]) -> None:
+    """Write a batch of metric records in one transaction."""
+    with Session(get_engine()) as session:
+        MetricsRepository(session).save_metrics(records)
+
+
+class MetricsWriter:
+    """Background writer that batches metric records from a bounded queue."""
+
+    def __init__(
+        self,
+        write_batch: Callable[[list[dict[str, Any]]], None] = _persist_batch,
+        batch_size: int = 100,
+        flush_interval_seconds: float = 2.0,
+        max_queue: int = 10000,
+    ) -> None:
+        """Initialize a stopped writer; it starts on the first ``submit``.
+
+        Args:
+            write_batch: Callable persisting a list of records.
+            batch_size: Maximum records per write.
+            flush_interval_seconds: Maximum time a record waits before a write.
+            max_queue: Queue bound; records beyond it are dropped.
+        """
+        self._write_batch = write_batch
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_seconds
+        self._queue: queue.Queue[dict[str, Any]] = queue.Queue(maxsize=max_queue)
+        self._stop = threading.Event()
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.dropped = 0
+        self.failed = 0
+        self.written = 0
+
+    def start(self) -> None:
+        """Start the background flush thread unless it is running or was stopped."""
+        with self._lock:
+            if self._stopped or (self._thread is not None and self._thread.is_alive()):
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="metrics-writer", daemon=True
+            )
+            self._thread.start()
+
+    def submit(self, record: dict[str, Any]) -> bool:
+        """Enqueue a record without blocking.
+
+        After ``stop`` the record is written synchronously instead, so a late
+        call during shutdown neither restarts the thread nor strands it.
+
+        Returns:
+            False when the queue is full and the record was dropped.
+        """
+        if self._stopped:
+            self._write([record])
+            return True
+        self.start()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+                dropped = self.dropped
+            logger.warning("metrics.queue_full", dropped_total=dropped)
+            return False
+        if self._stopped:  # stop() ran while the record was being queued
+            self.flush()
+        return True
+
+    def flush(self) -> None:
+        """Write every queued record from the calling thread."""
+        while batch := self._next_batch(block=False):
+            self._write(batch)
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the background thread for good after draining the queue."""
+        with self._lock:
+            self._stopped = True
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            batch = self._next_batch(block=True)
+            if batch:
+                self._write(batch)
+
+    def _next_batch(self, block: bool) -> list[dict[str, Any]]:
+        """Collect up to ``batch_size`` records, waiting at most one flush interval."""
+        batch: list[dict[str, Any]] = []
+        deadline = time.monotonic() + self._flush_interval
+        while len(batch) < self._batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if block and remaining > 0 and not self._stop.is_set():
+                    record = self._queue.get(timeout=remaining)
+                else:
+                    record = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            batch.append(record)
+        return batch
+
+    def _write(self, batch: list[dict[str, Any]]) -> None:
+        try:
+            self._write_batch(batch)
+        except Exception as e:
+            # Silently fail if metrics persist fails; don't break the business logic
+            with self._lock:
+                self.failed += len(batch)
+            logger.warning("metrics.log_failed", error=str(e), batch_size=len(batch))
+            return
+        with self._lock:
+            self.written += len(batch)
+
+    def stats(self) -> dict[str, int]:
+        """Return queue depth and written/dropped/failed counters."""
+        with self._lock:
+            return {
+                "queued": self._queue.qsize(),
+                "written": self.written,
+                "dropped": self.dropped,
+                "failed": self.failed,
+            }
+
+
+@lru_cache
+def get_metrics_writer() -> MetricsWriter:
+    """Return the process-wide metrics writer configured from settings."""
+    settings = get_settings()
+    return MetricsWriter(
+        batch_size=settings.metrics_batch_size,
+        flush_interval_seconds=settings.metrics_flush_interval_seconds,
+        max_queue=settings.metrics_queue_max,
+    )
+
+
+def shutdown_metrics_writer(timeout: float | None = 10.0) -> None:
+    """Drain queued metrics and stop the background writer."""
+    get_metrics_writer().stop(timeout)
+
 
 def log_llm_metric(
     operation: str,
@@ -15,10 +183,10 @@ def log_llm_metric(
     total_tokens: int | None = None,
     eval_score: int | None = None,
 ) -> None:
-    """Log an LLM call metric to the database.
+    """Queue an LLM call metric for batched persistence.
 
-    This utility manages its own session, so it can be called from
-    anywhere without passing a session around.
+    Returns immediately; the record is written by the background writer.
+    The timestamp is taken now, not at flush time.
 
     Args:
         operation: e.g., "explain", "rag", "eval", "embed".
@@ -29,20 +197,15 @@ def log_llm_metric(
         total_tokens: Total token count, if available.
         eval_score: Evaluation score (1-5), if applicable.
     """
-    try:
-        with Session(get_engine()) as session:
-            repo = MetricsRepository(session)
-            repo.save_metric(
-                operation=operation,
-                model=model,
-                duration_ms=duration_ms,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                total_tokens=total_tokens,
-                eval_score=eval_score,
-            )
-    except Exception as e:
-        # Silently fail if metrics persist fails; don't break the business logic
-        import structlog
-        logger = structlog.get_logger()
-        logger.warning("metrics.log_failed", error=str(e))
+    get_metrics_writer().submit(
+        {
+            "operation": operation,
+            "model": model,
+            "duration_ms": duration_ms,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": total_tokens,
+            "eval_score": eval_score,
+            "created_at": utc_now(),
+        }
+    )
@@ -0,0 +1,69 @@
+"""Metrics rollup job — keeps hourly ``llm_call_metric_rollups`` up to date in the background."""
+
+import threading
+from collections.abc import Callable
+from functools import lru_cache
+
+import structlog
+from sqlmodel import Session
+
+from app.core.config import get_settings
+from app.repositories.metrics_repo import MetricsRepository
+from app.repositories.session import get_engine
+
+logger = structlog.get_logger()
+
+
+def refresh_rollups_once() -> int:
+    """Roll up all complete hours not yet aggregated and return rows written."""
+    with Session(get_engine()) as session:
+        return MetricsRepository(session).refresh_rollups()
+
+
+class MetricsRollupJob:
+    """Daemon thread that refreshes metric rollups on a fixed interval."""
+
+    def __init__(
+        self,
+        interval_seconds: float,
+        refresh: Callable[[], int] = refresh_rollups_once,
+    ) -> None:
+        self._interval = interval_seconds
+        self._refresh = refresh
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start refreshing in the background; a non-positive interval disables the job."""
+        if self._interval <= 0 or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="metrics-rollup", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Signal the thread to exit and wait for it."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def run_once(self) -> None:
+        """Run one refresh, logging rather than raising on failure."""
+        try:
+            written = self._refresh()
+        except Exception as e:
+            logger.warning("metrics.rollup_failed", error=str(e))
+            return
+        if written:
+            logger.info("metrics.rollup", rows_written=written)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.run_once()
+            self._stop.wait(self._interval)
+
+
+@lru_cache
+def get_metrics_rollup_job() -> MetricsRollupJob:
+    """Return the process-wide rollup job configured from settings."""
+    return MetricsRollupJob(get_settings().metrics_rollup_interval_seconds)
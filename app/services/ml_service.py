@@ -10,7 +10,8 @@ import joblib
 from app.core.config import get_settings
 from app.domain.metrics import compute_max_drawdown, compute_returns, compute_volatility
 from app.infrastructure.market.yfinance_client import fetch_history
-from app.ml.model import RiskModel
+from app.ml.model import FEATURE_COLUMNS, RiskModel
+from app.services.risk_service import get_batch_risk_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -69,3 +70,45 @@ def get_ml_risk_profile(symbol: str, days: int) -> dict[str, Any]:
     result = {**features, "risk_level": risk_model.predict(features)}
     logger.debug("ML risk profile for %s: %s", symbol, result["risk_level"])
     return result
+
+
+def get_ml_risk_profiles(
+    symbols: list[str], days: int
+) -> tuple[dict[str, dict[str, Any]], dict[str, str]]:
+    """Predict risk levels for many tickers with a single model call.
+
+    Args:
+        symbols: Asset ticker symbols.
+        days: Number of trailing days used for feature extraction.
+
+    Returns:
+        Tuple of ``(profiles, errors)`` keyed by symbol. Each profile has the
+        same shape as ``get_ml_risk_profile``.
+
+    Raises:
+        ValueError: Model artifacts are missing — train and export a model first.
+    """
+    risk_model = _load_risk_model()
+    if risk_model is None:
+        raise ValueError(
+            "ML model artifacts not found. Train and export a model first."
+        )
+
+    metrics, errors = get_batch_risk_metrics(symbols, days)
+    if metrics.empty:
+        return {}, errors
+
+    features = metrics[list(FEATURE_COLUMNS)]
+    labels = risk_model.predict_batch(features)
+
+    profiles = {
+        symbol: {
+            "volatility": float(row.volatility),
+            "max_drawdown": float(row.max_drawdown),
+            "mean_return": float(row.mean_return),
+            "risk_level": str(label),
+        }
+        for (symbol, row), label in zip(features.iterrows(), labels)
+    }
+    logger.debug("ML risk profiles computed for %d symbols", len(profiles))
+    return profiles, errors
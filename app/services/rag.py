@@ -1,19 +1,26 @@
 """RAG service — Retrieval Augmented Generation over uploaded documents."""
 
-from openai import OpenAI
 import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 import structlog
 
 from app.core.config import get_settings
+from app.infrastructure.llm.groq_client import get_llm_client
 from app.repositories.document_repo import DocumentRepository
 from app.repositories.models import DocumentChunk
+from app.services.answer_cache import CachedAnswer, get_answer_cache
 from app.services.embeddings import embed_text
+from app.services.llm_stream import replay_text, stream_chat_completion
 from app.services.metrics_logger import log_llm_metric
+from app.services.retrieval import hybrid_search_chunks
 
 logger = structlog.get_logger()
 
 _TOP_K = 5           # number of chunks to retrieve
 _MAX_CONTEXT_CHARS = 3000  # cap total context injected into the prompt
+_MAX_TOKENS = 500
+_TEMPERATURE = 0.2
 
 _SYSTEM_PROMPT = """\
 You are a financial analyst assistant. You answer questions strictly based on
@@ -40,18 +47,24 @@ def _build_context(chunks: list[DocumentChunk]) -> str:
     return "\n\n".join(parts)
 
 
-def answer_question(
+@dataclass
+class PreparedAnswer:
+    """Everything needed to answer a question, gathered before calling the LLM."""
+
+    question: str
+    document_id: int
+    query_embedding: list[float]
+    cached: CachedAnswer | None = None
+    sources: list[str] = field(default_factory=list)
+    messages: list[dict[str, str]] = field(default_factory=list)
+
+
+def prepare_answer(
     question: str,
     document_id: int,
     repo: DocumentRepository,
-) -> tuple[str, list[str]]:
-    """Answer a question using RAG over a specific document.
-
-    Steps:
-    1. Embed the question locally.
-    2. Retrieve the top-k most similar chunks from the document.
-    3. Inject the chunks as context into a Groq LLM prompt.
-    4. Return the answer and the source chunk texts.
+) -> PreparedAnswer:
+    """Embed the question and either find a cached answer or retrieve context.
 
     Args:
         question: The user's question about the document.
@@ -59,8 +72,8 @@ def answer_question(
         repo: DocumentRepository bound to an active session.
 
     Returns:
-        Tuple of ``(answer_text, source_chunks)`` where ``source_chunks``
-        is the list of raw chunk texts used to build the context.
+        A prepared answer carrying the cache hit, or the sources and chat
+        messages for the LLM call.
 
     Raises:
         ValueError: If no chunks are found for the document, or Groq key missing.
@@ -74,8 +87,20 @@ def answer_question(
 
     query_embedding = embed_text(question)
 
-    chunks = repo.search_chunks_by_embedding(
-        embedding=query_embedding,
+    cached = get_answer_cache().lookup(document_id, query_embedding)
+    if cached is not None:
+        logger.info(
+            "rag.answer_cache_hit",
+            document_id=document_id,
+            question_len=len(question),
+            similarity=round(cached.similarity, 4),
+        )
+        return PreparedAnswer(question, document_id, query_embedding, cached=cached)
+
+    chunks = hybrid_search_chunks(
+        repo,
+        query=question,
+        query_embedding=query_embedding,
         document_id=document_id,
         limit=_TOP_K,
     )
@@ -87,28 +112,64 @@ def answer_question(
         )
 
     context = _build_context(chunks)
-    sources = [c.chunk_text.strip() for c in chunks]
-
     user_message = (
         f"Document excerpts:\n\n{context}\n\n"
         f"Question: {question}\n\n"
         "Answer based only on the excerpts above."
     )
 
-    client = OpenAI(
-        api_key=settings.groq_api_key,
-        base_url="https://api.groq.com/openai/v1",
+    return PreparedAnswer(
+        question,
+        document_id,
+        query_embedding,
+        sources=[c.chunk_text.strip() for c in chunks],
+        messages=[
+            {"role": "system", "content": _SYSTEM_PROMPT},
+            {"role": "user", "content": user_message},
+        ],
     )
 
+
+def answer_question(
+    question: str,
+    document_id: int,
+    repo: DocumentRepository,
+) -> tuple[str, list[str]]:
+    """Answer a question using RAG over a specific document.
+
+    Steps:
+    1. Embed the question locally; return a cached answer if a
+       near-identical question was already answered for this document.
+    2. Retrieve the top-k chunks from the document by fusing keyword
+       and embedding search (reciprocal rank fusion).
+    3. Inject the chunks as context into a Groq LLM prompt.
+    4. Return the answer and the source chunk texts.
+
+    Args:
+        question: The user's question about the document.
+        document_id: ID of the document to search within.
+        repo: DocumentRepository bound to an active session.
+
+    Returns:
+        Tuple of ``(answer_text, source_chunks)`` where ``source_chunks``
+        is the list of raw chunk texts used to build the context.
+
+    Raises:
+        ValueError: If no chunks are found for the document, or Groq key missing.
+    """
+    prepared = prepare_answer(question, document_id, repo)
+    if prepared.cached is not None:
+        return prepared.cached.answer, list(prepared.cached.sources)
+
+    settings = get_settings()
+    client = get_llm_client()
+
     start = time.time()
     response = client.chat.completions.create(
         model=settings.groq_model,
-        messages=[
-            {"role": "system", "content": _SYSTEM_PROMPT},
-            {"role": "user", "content": user_message},
-        ],
-        max_tokens=500,
-        temperature=0.2,
+        messages=prepared.messages,
+        max_tokens=_MAX_TOKENS,
+        temperature=_TEMPERATURE,
     )
     duration = time.time() - start
 
@@ -124,7 +185,7 @@ def answer_question(
         "rag.answer",
         document_id=document_id,
         question_len=len(question),
-        chunks_retrieved=len(chunks),
+        chunks_retrieved=len(prepared.sources),
         model=settings.groq_model,
         duration_seconds=round(duration, 3),
         answer_length=len(answer),
@@ -140,4 +201,28 @@ def answer_question(
         total_tokens=usage.get("total_tokens") if usage else None,
     )
 
-    return answer, sources
+    get_answer_cache().store(document_id, prepared.query_embedding, answer, prepared.sources)
+    return answer, prepared.sources
+
+
+def stream_answer(prepared: PreparedAnswer) -> AsyncIterator[str]:
+    """Return an async iterator of answer text deltas for a prepared question.
+
+    A cached answer is replayed as one delta; otherwise tokens are relayed
+    from the LLM and the full answer is added to the answer cache at the end.
+    """
+    if prepared.cached is not None:
+        return replay_text(prepared.cached.answer)
+
+    def remember(answer: str) -> None:
+        get_answer_cache().store(
+            prepared.document_id, prepared.query_embedding, answer, prepared.sources
+        )
+
+    return stream_chat_completion(
+        prepared.messages,
+        operation="rag",
+        max_tokens=_MAX_TOKENS,
+        temperature=_TEMPERATURE,
+        on_complete=remember,
+    )
@@ -0,0 +1,81 @@
+"""Hybrid retrieval — fuses keyword and embedding search over document chunks.
+
+Each retriever returns its own top candidates; the lists are merged with
+reciprocal rank fusion (RRF), which needs no score calibration between
+BM25/``ts_rank`` and cosine distance. Exact tokens such as tickers, CUSIPs
+and figures are found by the lexical side even when the embedding misses.
+"""
+
+import time
+from collections.abc import Hashable, Sequence
+
+import structlog
+
+from app.repositories.document_repo import DocumentRepository
+from app.repositories.models import DocumentChunk
+
+logger = structlog.get_logger()
+
+RRF_K = 60  # rank damping constant from the original RRF paper
+_CANDIDATES_PER_RETRIEVER = 20
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[Hashable]], k: int = RRF_K
+) -> list[tuple[Hashable, float]]:
+    """Fuse ranked lists by summing ``1 / (k + rank)`` for each item.
+
+    Args:
+        rankings: Ranked lists of item keys, best first.
+        k: Damping constant; larger values flatten the rank contribution.
+
+    Returns:
+        ``(key, score)`` pairs, best first. Ties keep first-seen order.
+    """
+    scores: dict[Hashable, float] = {}
+    for ranking in rankings:
+        for rank, key in enumerate(ranking, start=1):
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+def hybrid_search_chunks(
+    repo: DocumentRepository,
+    query: str,
+    query_embedding: list[float],
+    document_id: int | None = None,
+    limit: int = 5,
+    candidates: int = _CANDIDATES_PER_RETRIEVER,
+) -> list[DocumentChunk]:
+    """Return the top ``limit`` chunks by RRF over vector and keyword search.
+
+    Args:
+        repo: Document repository bound to the current session.
+        query: Raw question text for keyword matching.
+        query_embedding: Embedding of ``query`` for vector search.
+        document_id: If provided, restrict search to this document only.
+        limit: Number of chunks to return.
+        candidates: Retrieval budget per retriever before fusion.
+
+    Returns:
+        Fused list of DocumentChunk rows, best first.
+    """
+    budget = max(candidates, limit)
+    start = time.perf_counter()
+    by_vector = repo.search_chunks_by_embedding(query_embedding, document_id=document_id, limit=budget)
+    by_keyword = repo.search_chunks_by_text(query, document_id=document_id, limit=budget)
+
+    chunks = {chunk.id: chunk for chunk in (*by_vector, *by_keyword)}
+    fused = reciprocal_rank_fusion(
+        [[chunk.id for chunk in by_vector], [chunk.id for chunk in by_keyword]]
+    )
+    result = [chunks[chunk_id] for chunk_id, _ in fused[:limit]]
+    logger.debug(
+        "retrieval.hybrid",
+        document_id=document_id,
+        vector_hits=len(by_vector),
+        keyword_hits=len(by_keyword),
+        returned=len(result),
+        duration_ms=round((time.perf_counter() - start) * 1000, 2),
+    )
+    return result
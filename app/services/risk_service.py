@@ -2,9 +2,16 @@
 
 from typing import Any
 
-from app.domain.metrics import compute_max_drawdown, compute_returns, compute_volatility
+import pandas as pd
+
+from app.domain.metrics import (
+    compute_max_drawdown,
+    compute_metrics_matrix,
+    compute_returns,
+    compute_volatility,
+)
 from app.domain.scoring import classify_risk
-from app.infrastructure.market.yfinance_client import fetch_history
+from app.infrastructure.market.yfinance_client import fetch_history, fetch_history_many
 
 
 def get_risk_metrics(symbol: str, days: int) -> dict[str, Any]:
@@ -53,3 +60,54 @@ def get_risk_profile(symbol: str, days: int) -> dict[str, Any]:
         "max_drawdown": max_drawdown,
         "risk_level": classify_risk(volatility, max_drawdown),
     }
+
+
+def get_batch_risk_metrics(
+    symbols: list[str], days: int
+) -> tuple[pd.DataFrame, dict[str, str]]:
+    """Compute risk metrics for many tickers with one bulk fetch and one vectorized pass.
+
+    Args:
+        symbols: Asset ticker symbols.
+        days: Number of trailing days used to compute metrics.
+
+    Returns:
+        Tuple of ``(metrics, errors)``: a DataFrame indexed by symbol with
+        ``volatility``, ``max_drawdown`` and ``mean_return`` columns, and an
+        error message per symbol whose history could not be used.
+    """
+    batch = fetch_history_many(symbols, days)
+    errors = dict(batch.errors)
+    metrics = compute_metrics_matrix(batch.close_matrix())
+
+    insufficient = metrics["volatility"].isna()
+    for symbol in metrics.index[insufficient]:
+        errors[symbol] = f"Not enough price history for symbol {symbol}"
+
+    return metrics[~insufficient], errors
+
+
+def get_risk_profiles(
+    symbols: list[str], days: int
+) -> tuple[dict[str, dict[str, Any]], dict[str, str]]:
+    """Classify risk level for many tickers at once (rule-based).
+
+    Args:
+        symbols: Asset ticker symbols.
+        days: Number of trailing days used for feature extraction.
+
+    Returns:
+        Tuple of ``(profiles, errors)`` keyed by symbol. Each profile has the
+        same shape as ``get_risk_profile``.
+    """
+    metrics, errors = get_batch_risk_metrics(symbols, days)
+
+    profiles = {
+        symbol: {
+            "volatility": float(row.volatility),
+            "max_drawdown": float(row.max_drawdown),
+            "risk_level": classify_risk(row.volatility, row.max_drawdown),
+        }
+        for symbol, row in metrics.iterrows()
+    }
+    return profiles, errors
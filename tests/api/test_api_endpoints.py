@@ -16,7 +16,7 @@ from app.main import (
     request_validation_exception_handler,
     unhandled_exception_handler,
 )
-from app.schemas.risk import RiskProfileMode
+from app.schemas.risk import RiskProfileBatchRequest, RiskProfileMode
 
 
 def test_health_returns_ok() -> None:
@@ -181,6 +181,50 @@ def test_risk_profile_rule_value_error_maps_to_404(
     assert exc.value.detail == "No historical data for symbol META"
 
 
+def test_risk_profile_batch_rule_mode_returns_profiles_and_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    captured: dict[str, object] = {}
+
+    def fake_rule_profiles(symbols: list[str], days: int) -> tuple[dict, dict]:
+        captured["symbols"] = symbols
+        captured["days"] = days
+        return (
+            {"AAPL": {"volatility": 0.01, "max_drawdown": -0.05, "risk_level": "LOW"}},
+            {"NOPE": "No historical data for symbol NOPE"},
+        )
+
+    monkeypatch.setattr(risk_profile_api, "get_risk_profiles", fake_rule_profiles)
+
+    result = risk_profile_api.risk_profile_batch(
+        RiskProfileBatchRequest(symbols=["aapl", "nope"], days=30)
+    )
+
+    assert captured == {"symbols": ["AAPL", "NOPE"], "days": 30}
+    assert result.mode == RiskProfileMode.rule
+    assert result.profiles["AAPL"].risk_level.value == "LOW"
+    assert result.errors == {"NOPE": "No historical data for symbol NOPE"}
+
+
+def test_risk_profile_batch_ml_value_error_maps_to_400(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        risk_profile_api,
+        "get_ml_risk_profiles",
+        lambda *_: (_ for _ in ()).throw(
+            ValueError("ML model artifacts not found. Train and export a model first.")
+        ),
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        risk_profile_api.risk_profile_batch(
+            RiskProfileBatchRequest(symbols=["meta"], mode=RiskProfileMode.ml)
+        )
+
+    assert exc.value.status_code == 400
+
+
 def test_http_exception_handler_payload() -> None:
     response = asyncio.run(
         http_exception_handler(None, HTTPException(status_code=404, detail="Missing"))
@@ -217,3 +261,72 @@ def test_unhandled_exception_handler_payload() -> None:
         "message": "Internal server error.",
         "details": None,
     }
+
+
+async def _read_stream(response) -> str:
+    return "".join([chunk async for chunk in response.body_iterator])
+
+
+def test_risk_explain_stream_emits_sse_events(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        risk_api,
+        "get_risk_metrics",
+        lambda *_: {"volatility": 0.0123, "max_drawdown": -0.15, "mean_return": 0.001},
+    )
+
+    async def fake_tokens():
+        yield "Risk is "
+        yield "moderate."
+
+    monkeypatch.setattr(risk_api, "stream_explain_risk", lambda **_: fake_tokens())
+
+    response = risk_api.risk_explain_stream("tsla", days=90)
+    body = asyncio.run(_read_stream(response))
+
+    assert response.media_type == "text/event-stream"
+    events = [block.split("\n") for block in body.strip().split("\n\n")]
+    assert [lines[0] for lines in events] == [
+        "event: metadata",
+        "event: token",
+        "event: token",
+        "event: done",
+    ]
+    assert json.loads(events[0][1][len("data: "):])["symbol"] == "TSLA"
+    assert json.loads(events[2][1][len("data: "):]) == {"text": "moderate."}
+
+
+def test_risk_explain_stream_reports_midstream_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        risk_api,
+        "get_risk_metrics",
+        lambda *_: {"volatility": 0.0123, "max_drawdown": -0.15, "mean_return": 0.001},
+    )
+
+    async def failing_tokens():
+        yield "Risk"
+        raise RuntimeError("upstream closed")
+
+    monkeypatch.setattr(risk_api, "stream_explain_risk", lambda **_: failing_tokens())
+
+    body = asyncio.run(_read_stream(risk_api.risk_explain_stream("TSLA", days=90)))
+
+    assert body.rstrip().endswith('data: {"detail": "Generation failed: upstream closed"}')
+    assert "event: done" not in body
+
+
+def test_risk_explain_stream_missing_key_maps_to_500(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        risk_api,
+        "get_risk_metrics",
+        lambda *_: {"volatility": 0.0123, "max_drawdown": -0.15, "mean_return": 0.001},
+    )
+
+    def missing_key(**_):
+        raise ValueError("GROQ_API_KEY is not set.")
+
+    monkeypatch.setattr(risk_api, "stream_explain_risk", missing_key)
+
+    with pytest.raises(HTTPException) as exc:
+        risk_api.risk_explain_stream("TSLA", days=90)
+
+    assert exc.value.status_code == 500
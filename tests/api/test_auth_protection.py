@@ -10,6 +10,10 @@ def test_business_endpoints_have_api_key_dependency() -> None:
         "/history/{symbol}",
         "/risk/{symbol}",
         "/risk-profile/{symbol}",
+        "/risk-profile/batch",
+        "/risk/{symbol}/explain/stream",
+        "/documents/{document_id}/chat/stream",
+        "/documents/{document_id}/status",
     }
 
     routes = [route for route in app.routes if isinstance(route, APIRoute)]
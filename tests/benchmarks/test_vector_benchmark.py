@@ -0,0 +1,18 @@
+import numpy as np
+
+from app.benchmarks.vector_search import DIMENSIONS, clustered_vectors, recall_at_k
+
+
+def test_recall_at_k_counts_overlap() -> None:
+    assert recall_at_k([1, 2, 3, 4], [1, 2, 5, 6]) == 0.5
+    assert recall_at_k([], []) == 1.0
+
+
+def test_clustered_vectors_are_unit_length() -> None:
+    rng = np.random.default_rng(0)
+    centroids = rng.normal(size=(4, DIMENSIONS)).astype(np.float32)
+
+    vectors = clustered_vectors(rng, 50, centroids)
+
+    assert vectors.shape == (50, DIMENSIONS)
+    np.testing.assert_allclose(np.linalg.norm(vectors, axis=1), 1.0, rtol=1e-5)
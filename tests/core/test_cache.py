@@ -0,0 +1,83 @@
+import threading
+import time
+
+import pytest
+
+from app.core.cache import TTLCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_or_load_caches_until_ttl_expires() -> None:
+    clock = _Clock()
+    cache: TTLCache[int] = TTLCache(max_entries=10, ttl_seconds=5, clock=clock)
+    calls: list[int] = []
+
+    def loader() -> int:
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_load("AAPL", loader) == 1
+    assert cache.get_or_load("AAPL", loader) == 1
+    clock.now = 5.0
+    assert cache.get_or_load("AAPL", loader) == 2
+    assert cache.stats() == {"hits": 1, "misses": 2, "coalesced": 0, "size": 1}
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache: TTLCache[str] = TTLCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    cache.get("a")
+    cache.put("c", "C")
+
+    assert cache.get("a") == "A"
+    assert cache.get("b") is None
+    assert cache.get("c") == "C"
+
+
+def test_loader_errors_are_not_cached() -> None:
+    cache: TTLCache[int] = TTLCache(max_entries=10, ttl_seconds=60)
+
+    def failing() -> int:
+        raise ValueError("No data")
+
+    with pytest.raises(ValueError):
+        cache.get_or_load("NOPE", failing)
+
+    assert cache.get_or_load("NOPE", lambda: 7) == 7
+
+
+def test_concurrent_misses_share_one_loader_call() -> None:
+    cache: TTLCache[str] = TTLCache(max_entries=10, ttl_seconds=60)
+    release = threading.Event()
+    calls: list[int] = []
+
+    def slow_loader() -> str:
+        calls.append(1)
+        release.wait(timeout=5)
+        return "value"
+
+    results: list[str] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_load("k", slow_loader)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    while cache.stats()["coalesced"] < 7:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1]
+    assert results == ["value"] * 8
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["coalesced"] == 7
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from app.core.histogram import GROWTH, LogHistogram, bucket_index
+
+
+def test_quantiles_are_within_bucket_error() -> None:
+    values = np.random.default_rng(3).lognormal(mean=5, sigma=1, size=5000)
+    histogram = LogHistogram()
+    histogram.add_all(values)
+
+    for q in (0.5, 0.9, 0.95, 0.99):
+        exact = float(np.percentile(values, q * 100, method="lower"))
+        assert histogram.quantile(q) == pytest.approx(exact, rel=GROWTH - 1)
+
+
+def test_merge_equals_single_histogram_and_round_trips_json() -> None:
+    first, second, combined = LogHistogram(), LogHistogram(), LogHistogram()
+    first.add_all([1.0, 10.0, 100.0])
+    second.add_all([0.5, 1000.0])
+    combined.add_all([1.0, 10.0, 100.0, 0.5, 1000.0])
+
+    restored = LogHistogram.from_json(first.to_json(), first.minimum, first.maximum)
+    restored.merge(second)
+
+    assert restored.counts == combined.counts
+    assert restored.minimum == 0.5
+    assert restored.maximum == 1000.0
+    assert restored.quantile(1.0) == 1000.0
+
+
+def test_empty_histogram_and_small_values() -> None:
+    assert LogHistogram().quantile(0.5) is None
+    assert bucket_index(0.2) == 0
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.domain.metrics import (
+    compute_max_drawdown,
+    compute_metrics_matrix,
+    compute_returns,
+    compute_volatility,
+)
+
+
+def _scalar_metrics(close: pd.Series) -> tuple[float, float, float]:
+    df = close.dropna().to_frame("Close")
+    returns = compute_returns(df)
+    return compute_volatility(returns), compute_max_drawdown(df), float(returns.mean())
+
+
+def test_compute_metrics_matrix_matches_scalar_functions_on_ragged_history() -> None:
+    rng = np.random.default_rng(42)
+    prices = pd.DataFrame(
+        100 * np.exp(np.cumsum(rng.normal(0, 0.02, size=(250, 6)), axis=0)),
+        columns=["AAPL", "MSFT", "NVDA", "IPO", "GAP", "DELISTED"],
+    )
+    prices.loc[:59, "IPO"] = np.nan
+    prices.loc[120, "GAP"] = np.nan
+    prices.loc[200:, "DELISTED"] = np.nan
+
+    result = compute_metrics_matrix(prices)
+
+    assert list(result.index) == list(prices.columns)
+    for symbol in prices.columns:
+        volatility, max_drawdown, mean_return = _scalar_metrics(prices[symbol])
+        assert result.loc[symbol, "volatility"] == pytest.approx(volatility, rel=1e-12)
+        assert result.loc[symbol, "max_drawdown"] == pytest.approx(max_drawdown, rel=1e-12)
+        assert result.loc[symbol, "mean_return"] == pytest.approx(mean_return, rel=1e-12)
+
+
+def test_compute_metrics_matrix_accepts_numpy_array() -> None:
+    prices = np.array([[100.0, 50.0], [110.0, 45.0], [99.0, 55.0]])
+
+    result = compute_metrics_matrix(prices)
+
+    assert list(result.index) == [0, 1]
+    expected = _scalar_metrics(pd.Series(prices[:, 0]))
+    assert tuple(result.loc[0]) == pytest.approx(expected)
+
+
+def test_compute_metrics_matrix_handles_short_and_empty_columns() -> None:
+    prices = pd.DataFrame({"ONE": [10.0, np.nan], "NONE": [np.nan, np.nan]})
+
+    result = compute_metrics_matrix(prices)
+
+    assert np.isnan(result.loc["ONE", "volatility"])
+    assert np.isnan(result.loc["ONE", "mean_return"])
+    assert result.loc["ONE", "max_drawdown"] == 0.0
+    assert result.loc["NONE"].isna().all()
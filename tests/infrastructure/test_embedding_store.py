@@ -0,0 +1,45 @@
+from pathlib import Path
+
+from app.infrastructure.embeddings.embedding_store import EmbeddingStore
+
+
+def test_round_trips_float32_vectors_and_counts_hits(tmp_path: Path) -> None:
+    store = EmbeddingStore(tmp_path / "nested" / "store.sqlite")
+    store.put_many({"a": [0.5, -1.25], "b": [1.0, 2.0]})
+
+    found = store.get_many(["a", "missing", "a"])
+
+    assert found == {"a": [0.5, -1.25]}
+    assert store.stats() == {"hits": 1, "misses": 1, "coalesced": 0, "size": 2}
+    store.close()
+    assert EmbeddingStore(tmp_path / "nested" / "store.sqlite").get_many(["b"]) == {"b": [1.0, 2.0]}
+
+
+def test_size_does_not_create_missing_file(tmp_path: Path) -> None:
+    path = tmp_path / "store.sqlite"
+
+    assert EmbeddingStore(path).size() == 0
+    assert not path.exists()
+
+
+def test_size_is_tracked_on_insert_and_read_once_on_open(tmp_path: Path) -> None:
+    path = tmp_path / "store.sqlite"
+    store = EmbeddingStore(path)
+    store.put_many({"a": [1.0], "b": [2.0]})
+    store.put_many({"b": [2.0], "c": [3.0]})
+
+    assert store.size() == 3
+    store.close()
+    reopened = EmbeddingStore(path)
+    reopened.get_many(["a"])
+    assert reopened.size() == 3
+
+
+def test_unreadable_file_is_treated_as_miss(tmp_path: Path) -> None:
+    path = tmp_path / "store.sqlite"
+    path.write_bytes(b"not a database" * 100)
+    store = EmbeddingStore(path)
+
+    assert store.get_many(["a"]) == {}
+    store.put_many({"a": [1.0]})
+    assert store.stats()["misses"] == 1
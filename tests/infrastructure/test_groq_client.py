@@ -0,0 +1,61 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.infrastructure.llm import groq_client
+
+
+def _settings(**overrides) -> SimpleNamespace:
+    values = dict(
+        groq_api_key="gsk_test",
+        llm_timeout_seconds=12.0,
+        llm_connect_timeout_seconds=3.0,
+        llm_max_retries=4,
+        llm_max_connections=7,
+        llm_keepalive_seconds=30.0,
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+@pytest.fixture(autouse=True)
+def fresh_clients(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(groq_client, "get_settings", _settings)
+    groq_client.get_llm_client.cache_clear()
+    groq_client.get_async_llm_client.cache_clear()
+    yield
+    asyncio.run(groq_client.close_llm_clients())
+
+
+def test_sync_client_is_shared_and_configured() -> None:
+    client = groq_client.get_llm_client()
+
+    assert groq_client.get_llm_client() is client
+    assert str(client.base_url).rstrip("/") == groq_client.GROQ_BASE_URL
+    assert client.max_retries == 4
+    assert client.timeout.read == 12.0
+    assert client.timeout.connect == 3.0
+
+
+def test_async_client_is_shared_and_configured() -> None:
+    client = groq_client.get_async_llm_client()
+
+    assert groq_client.get_async_llm_client() is client
+    assert client.max_retries == 4
+
+
+def test_missing_api_key_raises(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(groq_client, "get_settings", lambda: _settings(groq_api_key=""))
+
+    with pytest.raises(ValueError, match="GROQ_API_KEY"):
+        groq_client.get_llm_client()
+
+
+def test_close_releases_clients() -> None:
+    first = groq_client.get_llm_client()
+
+    asyncio.run(groq_client.close_llm_clients())
+
+    assert first.is_closed()
+    assert groq_client.get_llm_client() is not first
@@ -0,0 +1,95 @@
+import io
+from types import SimpleNamespace
+
+import pytest
+from pypdf import PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+from app.infrastructure.pdf import page_extractor
+
+
+def _make_pdf(texts: list[str]) -> bytes:
+    writer = PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    for text in texts:
+        page = writer.add_blank_page(612, 792)
+        content = DecodedStreamObject()
+        content.set_data(f"BT /F1 12 Tf 72 712 Td ({text}) Tj ET".encode())
+        page[NameObject("/Contents")] = writer._add_object(content)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def settings(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    values = SimpleNamespace(pdf_extract_workers=2, pdf_parallel_min_pages=16)
+    monkeypatch.setattr(page_extractor, "get_settings", lambda: values)
+    yield values
+    page_extractor.shutdown_pdf_extraction_pool()
+
+
+def test_default_pool_size_uses_available_cpus_and_is_capped(
+    monkeypatch: pytest.MonkeyPatch, settings: SimpleNamespace
+) -> None:
+    settings.pdf_extract_workers = 0
+    monkeypatch.setattr(page_extractor, "_available_cpus", lambda: 64)
+    assert page_extractor._pool_size() == 4
+
+    monkeypatch.setattr(page_extractor, "_available_cpus", lambda: 2)
+    assert page_extractor._pool_size() == 2
+
+    settings.pdf_extract_workers = 8
+    assert page_extractor._pool_size() == 8
+
+
+def test_small_pdf_is_extracted_in_process(
+    settings: SimpleNamespace, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        page_extractor, "_get_pool", lambda: pytest.fail("pool used for a small PDF")
+    )
+    progress: list[tuple[int, int]] = []
+
+    pages = list(page_extractor.iter_pdf_pages(_make_pdf(["alpha", "beta"]), lambda *p: progress.append(p)))
+
+    assert [page.strip() for page in pages] == ["alpha", "beta"]
+    assert progress == [(2, 1), (2, 2)]
+
+
+def test_large_pdf_is_extracted_across_processes_in_page_order(settings: SimpleNamespace) -> None:
+    texts = [f"page {i}" for i in range(40)]
+    progress: list[tuple[int, int]] = []
+
+    pages = list(page_extractor.iter_pdf_pages(_make_pdf(texts), lambda *p: progress.append(p)))
+
+    assert [page.strip() for page in pages] == texts
+    assert page_extractor._pool is not None
+    assert progress[-1] == (40, 40)
+
+
+def test_broken_pool_resumes_in_process_after_yielded_pages(
+    settings: SimpleNamespace, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def broken_after_first_range(file_bytes, total, workers, progress, done):
+        for i in range(8):
+            yield f"p{i}"
+            done[0] += 1
+        raise OSError("worker died")
+
+    monkeypatch.setattr(page_extractor, "_iter_parallel", broken_after_first_range)
+
+    pages = list(page_extractor.iter_pdf_pages(_make_pdf([f"p{i}" for i in range(20)])))
+
+    assert [page.strip() for page in pages] == [f"p{i}" for i in range(20)]
@@ -0,0 +1,147 @@
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from app.infrastructure.market import yfinance_client
+from app.infrastructure.market.price_store import PriceStore
+
+
+def _frame(dates: list[str], closes: list[float]) -> pd.DataFrame:
+    index = pd.to_datetime(dates).tz_localize("America/New_York")
+    return pd.DataFrame({"Close": closes, "Volume": [1000.0] * len(closes)}, index=index)
+
+
+def test_read_returns_empty_frame_for_unknown_symbol(tmp_path) -> None:
+    store = PriceStore(tmp_path)
+
+    assert store.coverage("AAPL") is None
+    assert store.read("AAPL", date(2026, 1, 1)).empty
+
+
+def test_append_persists_bars_and_coverage(tmp_path) -> None:
+    store = PriceStore(tmp_path)
+    frame = _frame(["2026-02-02", "2026-02-03"], [100.0, 101.0])
+
+    store.append("AAPL", frame, covered_from=date(2026, 2, 1), fetched_through=date(2026, 2, 3))
+
+    coverage = store.coverage("AAPL")
+    assert coverage is not None
+    assert coverage.covered_from == date(2026, 2, 1)
+    assert coverage.fetched_through == date(2026, 2, 3)
+
+    result = store.read("AAPL", date(2026, 2, 3))
+    assert list(result["Close"]) == [101.0]
+    assert result.index[0].date() == date(2026, 2, 3)
+
+
+def test_append_replaces_overlapping_days_and_widens_coverage(tmp_path) -> None:
+    store = PriceStore(tmp_path)
+    store.append(
+        "AAPL",
+        _frame(["2026-02-02", "2026-02-03"], [100.0, 101.0]),
+        covered_from=date(2026, 2, 1),
+        fetched_through=date(2026, 2, 3),
+    )
+
+    store.append(
+        "AAPL",
+        _frame(["2026-02-03", "2026-02-04"], [101.5, 102.0]),
+        covered_from=date(2026, 2, 3),
+        fetched_through=date(2026, 2, 4),
+    )
+
+    result = store.read("AAPL", date(2026, 1, 1))
+    assert list(result["Close"]) == [100.0, 101.5, 102.0]
+    coverage = store.coverage("AAPL")
+    assert coverage.covered_from == date(2026, 2, 1)
+    assert coverage.fetched_through == date(2026, 2, 4)
+
+
+def test_append_skips_empty_download_for_unknown_symbol(tmp_path) -> None:
+    store = PriceStore(tmp_path)
+
+    store.append(
+        "NOPE", pd.DataFrame(), covered_from=date(2026, 2, 1), fetched_through=date(2026, 2, 3)
+    )
+
+    assert store.coverage("NOPE") is None
+
+
+class _FakeTicker:
+    def __init__(self, frame: pd.DataFrame, calls: list[dict]) -> None:
+        self._frame = frame
+        self._calls = calls
+
+    def history(self, **kwargs) -> pd.DataFrame:
+        self._calls.append(kwargs)
+        return self._frame
+
+
+@pytest.fixture
+def store_backed_client(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    yfinance_client._get_price_store.cache_clear()
+    yfinance_client._get_history_cache.cache_clear()
+    monkeypatch.setattr(
+        yfinance_client,
+        "get_settings",
+        lambda: SimpleNamespace(
+            price_store_dir=str(tmp_path),
+            market_cache_max_entries=0,
+            market_cache_ttl_seconds=0,
+        ),
+    )
+    yield
+    yfinance_client._get_price_store.cache_clear()
+    yfinance_client._get_history_cache.cache_clear()
+
+
+def test_fetch_history_serves_repeat_window_from_store(
+    store_backed_client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    today = date.today()
+    frame = _frame([(today - timedelta(days=1)).isoformat(), today.isoformat()], [10.0, 11.0])
+    calls: list[dict] = []
+    monkeypatch.setattr(yfinance_client.yf, "Ticker", lambda _: _FakeTicker(frame, calls))
+
+    first = yfinance_client.fetch_history("AAPL", 5)
+    second = yfinance_client.fetch_history("AAPL", 5)
+
+    assert calls == [{"period": "5d"}]
+    assert list(first["Close"]) == [10.0, 11.0]
+    assert first.equals(second)
+
+
+def test_fetch_history_downloads_only_missing_trailing_days(
+    store_backed_client, tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    today = date.today()
+    yesterday = today - timedelta(days=1)
+    PriceStore(tmp_path).append(
+        "AAPL",
+        _frame([yesterday.isoformat()], [10.0]),
+        covered_from=today - timedelta(days=30),
+        fetched_through=yesterday,
+    )
+    calls: list[dict] = []
+    fresh = _frame([yesterday.isoformat(), today.isoformat()], [10.5, 12.0])
+    monkeypatch.setattr(yfinance_client.yf, "Ticker", lambda _: _FakeTicker(fresh, calls))
+
+    result = yfinance_client.fetch_history("AAPL", 10)
+
+    assert calls == [
+        {"start": yesterday.isoformat(), "end": (today + timedelta(days=1)).isoformat()}
+    ]
+    assert list(result["Close"]) == [10.5, 12.0]
+
+
+def test_fetch_history_raises_when_store_has_no_data(
+    store_backed_client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        yfinance_client.yf, "Ticker", lambda _: _FakeTicker(pd.DataFrame(), [])
+    )
+
+    with pytest.raises(ValueError, match="No historical data for symbol NOPE"):
+        yfinance_client.fetch_history("NOPE", 5)
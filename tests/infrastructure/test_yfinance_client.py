@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from app.infrastructure.market import yfinance_client
+
+
+@pytest.fixture(autouse=True)
+def small_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        yfinance_client,
+        "get_settings",
+        lambda: SimpleNamespace(market_fetch_max_workers=4),
+    )
+
+
+def test_fetch_history_many_collects_frames_and_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    frames = {
+        "AAPL": pd.DataFrame(
+            {"Close": [1.0, 2.0]}, index=pd.to_datetime(["2026-02-02", "2026-02-03"])
+        ),
+        "MSFT": pd.DataFrame({"Close": [3.0]}, index=pd.to_datetime(["2026-02-03"])),
+    }
+
+    def fake_fetch_history(symbol: str, days: int) -> pd.DataFrame:
+        if symbol not in frames:
+            raise ValueError(f"No historical data for symbol {symbol}")
+        return frames[symbol]
+
+    monkeypatch.setattr(yfinance_client, "fetch_history", fake_fetch_history)
+
+    batch = yfinance_client.fetch_history_many(["AAPL", "NOPE", "MSFT", "AAPL"], 5)
+
+    assert list(batch.frames) == ["AAPL", "MSFT"]
+    assert batch.errors == {"NOPE": "No historical data for symbol NOPE"}
+
+    matrix = batch.close_matrix()
+    assert list(matrix.columns) == ["AAPL", "MSFT"]
+    assert len(matrix) == 2
+    assert pd.isna(matrix.loc["2026-02-02", "MSFT"])
+
+
+def test_fetch_history_many_with_no_symbols_returns_empty_batch() -> None:
+    batch = yfinance_client.fetch_history_many([], 5)
+
+    assert batch.frames == {}
+    assert batch.errors == {}
+    assert batch.close_matrix().empty
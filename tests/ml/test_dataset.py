@@ -0,0 +1,25 @@
+import pandas as pd
+import pytest
+
+from app.infrastructure.market.yfinance_client import HistoryBatch
+from app.ml import dataset
+
+
+def test_build_dataset_labels_fetched_symbols_and_skips_failures(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    index = pd.to_datetime(["2026-02-02", "2026-02-03", "2026-02-04"])
+    batch = HistoryBatch(
+        frames={
+            "CALM": pd.DataFrame({"Close": [100.0, 100.1, 100.2]}, index=index),
+            "WILD": pd.DataFrame({"Close": [100.0, 60.0, 90.0]}, index=index),
+        },
+        errors={"NOPE": "No historical data for symbol NOPE"},
+    )
+    monkeypatch.setattr(dataset, "fetch_history_many", lambda *_: batch)
+
+    result = dataset.build_dataset(["CALM", "WILD", "NOPE"], days=3)
+
+    assert list(result["symbol"]) == ["CALM", "WILD"]
+    assert list(result["label"]) == ["LOW", "HIGH"]
+    assert list(result.columns) == ["symbol", "volatility", "max_drawdown", "mean_return", "label"]
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import LabelEncoder
+
+from app.ml.model import RiskModel
+
+
+@pytest.fixture
+def risk_model() -> RiskModel:
+    X = pd.DataFrame(
+        {
+            "volatility": [0.005, 0.006, 0.03, 0.04],
+            "max_drawdown": [-0.02, -0.03, -0.3, -0.4],
+            "mean_return": [0.001, 0.001, -0.002, -0.003],
+        }
+    )
+    encoder = LabelEncoder()
+    y = encoder.fit_transform(["LOW", "LOW", "HIGH", "HIGH"])
+    model = RandomForestClassifier(n_estimators=10, random_state=0).fit(X.to_numpy(), y)
+    return RiskModel(model=model, encoder=encoder)
+
+
+def test_predict_batch_decodes_labels_for_every_row(risk_model: RiskModel) -> None:
+    features = pd.DataFrame(
+        {
+            "mean_return": [0.001, -0.003],
+            "volatility": [0.005, 0.04],
+            "max_drawdown": [-0.02, -0.4],
+        }
+    )
+
+    labels = risk_model.predict_batch(features)
+
+    assert list(labels) == ["LOW", "HIGH"]
+
+
+def test_predict_is_consistent_with_predict_batch(risk_model: RiskModel) -> None:
+    features = {"volatility": 0.04, "max_drawdown": -0.4, "mean_return": -0.003}
+
+    label = risk_model.predict(features)
+
+    assert label == "HIGH"
+    assert isinstance(label, str)
+    assert label == risk_model.predict_batch(np.array([[0.04, -0.4, -0.003]]))[0]
+
+
+def test_predict_batch_handles_empty_input(risk_model: RiskModel) -> None:
+    assert len(risk_model.predict_batch(np.empty((0, 3)))) == 0
+
+
+def test_predict_proba_returns_probability_per_label(risk_model: RiskModel) -> None:
+    features = pd.DataFrame(
+        {"volatility": [0.005], "max_drawdown": [-0.02], "mean_return": [0.001]},
+        index=["AAPL"],
+    )
+
+    proba = risk_model.predict_proba(features)
+
+    assert set(proba.columns) == {"LOW", "HIGH"}
+    assert list(proba.index) == ["AAPL"]
+    assert proba.loc["AAPL"].sum() == pytest.approx(1.0)
+    assert proba.loc["AAPL", "LOW"] > proba.loc["AAPL", "HIGH"]
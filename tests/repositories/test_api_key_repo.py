@@ -44,6 +44,17 @@ def test_get_by_name_returns_none_when_not_found(mock_session: MagicMock) -> Non
     mock_session.exec.assert_called_once()
 
 
+def test_get_by_hash_returns_key(mock_session: MagicMock) -> None:
+    repo = ApiKeyRepository(mock_session)
+    mock_key = ApiKey(name="test-key", key_hash="abc")
+    mock_session.exec.return_value.first.return_value = mock_key
+
+    result = repo.get_by_hash("abc")
+
+    assert result == mock_key
+    mock_session.exec.assert_called_once()
+
+
 def test_save_persists_and_returns_key(mock_session: MagicMock) -> None:
     repo = ApiKeyRepository(mock_session)
     key = ApiKey(name="new-key")
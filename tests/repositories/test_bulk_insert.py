@@ -0,0 +1,144 @@
+import struct
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.domain.risk_level import AnalysisMode, RiskLevel
+from app.repositories import bulk_insert as bulk_insert_module
+from app.repositories.bulk_insert import bulk_insert
+from app.repositories.document_repo import DocumentRepository
+from app.repositories.models import Document, DocumentChunk, RiskAnalysis
+from app.repositories.risk_analysis_repo import RiskAnalysisRepository
+
+
+def _analysis(symbol: str, **overrides) -> RiskAnalysis:
+    values = dict(
+        symbol=symbol,
+        days=90,
+        mode=AnalysisMode.rule,
+        volatility=0.02,
+        max_drawdown=-0.1,
+        mean_return=0.001,
+        risk_level=RiskLevel.MEDIUM,
+    )
+    values.update(overrides)
+    return RiskAnalysis(**values)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(
+        engine,
+        tables=[Document.__table__, DocumentChunk.__table__, RiskAnalysis.__table__],
+    )
+    with Session(engine) as session:
+        yield session
+
+
+def test_save_chunks_inserts_rows_without_attaching_objects(session: Session) -> None:
+    doc = DocumentRepository(session).save_document("10k.pdf", "text")
+    chunks = [
+        DocumentChunk(document_id=doc.id, chunk_index=i, chunk_text=f"c{i}", embedding=[float(i)] * 384)
+        for i in range(250)
+    ]
+
+    DocumentRepository(session).save_chunks(chunks)
+
+    stored = session.exec(select(DocumentChunk).order_by(DocumentChunk.chunk_index)).all()
+    assert len(stored) == 250
+    assert stored[7].chunk_text == "c7"
+    assert list(stored[7].embedding) == [7.0] * 384
+    assert all(chunk.id is None and chunk not in session for chunk in chunks)
+
+
+def test_save_many_round_trips_enums(session: Session) -> None:
+    written = RiskAnalysisRepository(session).save_many(
+        [_analysis("AAPL"), _analysis("TSLA", mode=AnalysisMode.ml, risk_level=RiskLevel.HIGH)]
+    )
+
+    stored = RiskAnalysisRepository(session).get_by_symbol("TSLA")
+    assert written == 2
+    assert stored[0].mode == AnalysisMode.ml
+    assert stored[0].risk_level == RiskLevel.HIGH
+
+
+def test_empty_batch_is_a_no_op() -> None:
+    session = MagicMock()
+
+    assert bulk_insert(session, DocumentChunk, []) == 0
+    session.execute.assert_not_called()
+
+
+def _postgres_session() -> tuple[MagicMock, MagicMock]:
+    session = MagicMock()
+    session.get_bind.return_value.dialect = PGDialect_psycopg2()
+    cursor = MagicMock()
+    raw = session.connection.return_value.connection.driver_connection
+    raw.cursor.return_value.__enter__.return_value = cursor
+    return session, cursor
+
+
+def _decode_copy(data: bytes) -> list[list[bytes | None]]:
+    assert data.startswith(b"PGCOPY\n\xff\r\n\x00")
+    offset, rows = 19, []
+    while True:
+        (fields,) = struct.unpack_from(">h", data, offset)
+        offset += 2
+        if fields == -1:
+            return rows
+        row: list[bytes | None] = []
+        for _ in range(fields):
+            (length,) = struct.unpack_from(">i", data, offset)
+            offset += 4
+            if length == -1:
+                row.append(None)
+            else:
+                row.append(data[offset : offset + length])
+                offset += length
+        rows.append(row)
+
+
+def test_large_postgres_batches_use_binary_copy() -> None:
+    session, cursor = _postgres_session()
+    created = datetime(2000, 1, 1, 0, 0, 1, tzinfo=timezone.utc)
+    rows = [
+        _analysis("AAPL", embedding=[0.5, 1.0] + [0.0] * 382, model_version="", created_at=created),
+        *[_analysis(f"S{i}") for i in range(bulk_insert_module._COPY_MIN_ROWS)],
+    ]
+
+    RiskAnalysisRepository(session).save_many(rows)
+
+    session.execute.assert_not_called()
+    session.commit.assert_called_once()
+    sql, buffer = cursor.copy_expert.call_args.args
+    assert sql.startswith("COPY risk_analyses (symbol, days, mode,")
+    assert sql.endswith("FROM STDIN WITH (FORMAT binary)")
+    header = sql[sql.index("(") + 1 : sql.index(")")].split(", ")
+    decoded = _decode_copy(buffer.getvalue())
+    first, second = (dict(zip(header, row)) for row in decoded[:2])
+    assert len(decoded) == len(rows)
+    assert "id" not in header
+    assert first["symbol"] == b"AAPL"
+    assert struct.unpack(">i", first["days"]) == (90,)
+    assert struct.unpack(">d", first["volatility"]) == (0.02,)
+    assert first["mode"] == b"rule"
+    assert first["risk_level"] == b"MEDIUM"
+    assert first["model_version"] == b""
+    assert struct.unpack(">q", first["created_at"]) == (1_000_000,)
+    assert struct.unpack_from(">HH", first["embedding"]) == (384, 0)
+    assert np.frombuffer(first["embedding"][4:], dtype=">f4")[:3].tolist() == [0.5, 1.0, 0.0]
+    assert second["embedding"] is None
+
+
+def test_small_postgres_batches_use_executemany() -> None:
+    session, cursor = _postgres_session()
+
+    RiskAnalysisRepository(session).save_many([_analysis("AAPL")])
+
+    cursor.copy_expert.assert_not_called()
+    session.execute.assert_called_once()
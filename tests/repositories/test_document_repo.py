@@ -0,0 +1,25 @@
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.repositories.document_repo import DocumentRepository
+from app.repositories.models import Document, DocumentChunk
+
+
+def test_find_embeddings_by_hash_spans_documents_and_skips_unembedded() -> None:
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine, tables=[Document.__table__, DocumentChunk.__table__])
+    with Session(engine) as session:
+        repo = DocumentRepository(session)
+        first = repo.save_document("q1.pdf", "")
+        second = repo.save_document("q2.pdf", "")
+        repo.save_chunks(
+            [
+                DocumentChunk(document_id=first.id, chunk_index=0, chunk_text="a", content_hash="ha", embedding=[1.0] * 384),
+                DocumentChunk(document_id=second.id, chunk_index=0, chunk_text="b", content_hash="hb", embedding=[2.0] * 384),
+                DocumentChunk(document_id=second.id, chunk_index=1, chunk_text="c", content_hash="hc", embedding=None),
+            ]
+        )
+
+        found = repo.find_embeddings_by_hash(["ha", "hb", "hc", "missing", "ha"])
+
+    assert set(found) == {"ha", "hb"}
+    assert list(found["hb"]) == [2.0] * 384
@@ -0,0 +1,94 @@
+from datetime import timedelta
+
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.domain.ingestion import IngestionStatus
+from app.repositories.ingestion_job_repo import IngestionJobRepository
+from app.repositories.models import Document, IngestionJob, utc_now
+
+
+@pytest.fixture
+def session():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine, tables=[Document.__table__, IngestionJob.__table__])
+    with Session(engine) as session:
+        session.add(Document(id=1, filename="10k.pdf", content_text=""))
+        session.commit()
+        yield session
+
+
+def test_claim_next_runs_each_job_once_in_fifo_order(session: Session) -> None:
+    repo = IngestionJobRepository(session)
+    first = repo.enqueue(1, "a.txt", b"aaa")
+    second = repo.enqueue(1, "b.txt", b"bbb")
+
+    claimed = [repo.claim_next(), repo.claim_next(), repo.claim_next()]
+
+    assert [job.id if job else None for job in claimed] == [first.id, second.id, None]
+    assert claimed[0].status == IngestionStatus.running
+    assert claimed[0].attempts == 1
+    assert claimed[0].file_bytes == b"aaa"
+
+
+def test_progress_and_success_are_recorded(session: Session) -> None:
+    repo = IngestionJobRepository(session)
+    repo.enqueue(1, "a.txt", b"aaa")
+    job = repo.claim_next()
+
+    assert repo.update_progress(job.id, job.attempts, pages_total=3, pages_extracted=2)
+    assert repo.mark_succeeded(job.id, job.attempts)
+
+    stored = repo.get_latest_for_document(1)
+    session.refresh(stored)
+    assert (stored.pages_total, stored.pages_extracted) == (3, 2)
+    assert stored.status == IngestionStatus.succeeded
+    assert stored.file_bytes is None
+    assert stored.finished_at is not None
+
+
+def test_requeue_stale_retries_then_fails(session: Session) -> None:
+    repo = IngestionJobRepository(session)
+    job = repo.enqueue(1, "a.txt", b"aaa")
+    repo.claim_next()
+    later = utc_now() + timedelta(seconds=1)
+
+    assert repo.requeue_stale(later, max_attempts=2) == 1
+    session.refresh(job)
+    assert job.status == IngestionStatus.queued
+
+    repo.claim_next()
+    assert repo.requeue_stale(utc_now() + timedelta(seconds=1), max_attempts=2) == 1
+    session.refresh(job)
+    assert job.status == IngestionStatus.failed
+    assert job.error == "Ingestion worker stopped responding."
+
+
+def test_fresh_running_jobs_are_not_requeued(session: Session) -> None:
+    repo = IngestionJobRepository(session)
+    repo.enqueue(1, "a.txt", b"aaa")
+    repo.claim_next()
+
+    assert repo.requeue_stale(utc_now() - timedelta(minutes=15), max_attempts=3) == 0
+
+
+def test_stale_worker_does_not_overwrite_a_reclaimed_attempt(session: Session) -> None:
+    repo = IngestionJobRepository(session)
+    repo.enqueue(1, "a.txt", b"aaa")
+    stale = repo.claim_next()
+    stale_attempt = stale.attempts
+    repo.requeue_stale(utc_now() + timedelta(seconds=1), max_attempts=3)
+    current = repo.claim_next()
+
+    assert not repo.update_progress(stale.id, stale_attempt, chunks_embedded=99)
+    assert not repo.mark_failed(stale.id, stale_attempt, "late failure")
+
+    session.refresh(current)
+    assert current.status == IngestionStatus.running
+    assert current.attempts == stale_attempt + 1
+    assert current.error is None
+    assert current.chunks_embedded == 0
+    assert current.file_bytes == b"aaa"
@@ -0,0 +1,87 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.repositories import document_repo
+from app.repositories.document_repo import DocumentRepository
+from app.repositories.lexical_index import InvertedIndex, LexicalIndexRegistry, tokenize
+from app.repositories.models import Document, DocumentChunk
+
+
+def test_tokenize_keeps_identifiers_and_figures() -> None:
+    assert tokenize("What is AAPL's CUSIP 037833100, revenue $1,234.56?") == [
+        "aapl",
+        "cusip",
+        "037833100",
+        "revenue",
+        "1,234.56",
+    ]
+
+
+def test_bm25_prefers_rare_exact_terms() -> None:
+    index = InvertedIndex()
+    index.add(1, "revenue grew strongly across all segments")
+    index.add(2, "revenue for MSFT grew")
+    index.add(3, "revenue was flat")
+
+    hits = index.search("MSFT revenue", k=2)
+
+    assert [row_id for row_id, _ in hits][0] == 2
+    assert index.search("the", k=5) == []
+
+
+def test_catch_up_indexes_only_new_rows() -> None:
+    index = InvertedIndex()
+    requested: list[int] = []
+
+    def fetch(last_id: int):
+        requested.append(last_id)
+        return [(4, "tsla deliveries")] if last_id == 0 else []
+
+    index.catch_up(fetch)
+    index.catch_up(fetch)
+
+    assert requested == [0, 4]
+    assert index.search("TSLA", k=1)[0][0] == 4
+
+
+def test_postgresql_text_search_uses_tsvector_or_query() -> None:
+    session = MagicMock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    session.exec.return_value.all.return_value = []
+
+    DocumentRepository(session).search_chunks_by_text("AAPL and AAPL 10-K", document_id=3)
+
+    compiled = session.exec.call_args.args[0].compile(dialect=postgresql.dialect())
+    assert "to_tsvector('simple'::regconfig, document_chunks.chunk_text) @@" in str(compiled)
+    assert "'aapl' | '10'" in compiled.params.values()
+
+
+@pytest.fixture
+def sqlite_repo(monkeypatch: pytest.MonkeyPatch):
+    registry = LexicalIndexRegistry()
+    monkeypatch.setattr(document_repo, "get_lexical_index_registry", lambda: registry)
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine, tables=[Document.__table__, DocumentChunk.__table__])
+    with Session(engine) as session:
+        yield DocumentRepository(session)
+
+
+def test_sqlite_text_search_is_scoped_to_document(sqlite_repo: DocumentRepository) -> None:
+    first = sqlite_repo.save_document("a.txt", "a")
+    second = sqlite_repo.save_document("b.txt", "b")
+    sqlite_repo.save_chunks(
+        [
+            DocumentChunk(document_id=first.id, chunk_index=0, chunk_text="Outlook is cautious"),
+            DocumentChunk(document_id=first.id, chunk_index=1, chunk_text="CUSIP 037833100 listed"),
+            DocumentChunk(document_id=second.id, chunk_index=0, chunk_text="CUSIP 037833100 again"),
+        ]
+    )
+
+    hits = sqlite_repo.search_chunks_by_text("037833100", document_id=first.id)
+
+    assert [c.chunk_text for c in hits] == ["CUSIP 037833100 listed"]
+    assert sqlite_repo.search_chunks_by_text("???", document_id=first.id) == []
@@ -9,7 +9,10 @@ from app.repositories.models import LLMCallMetric, RiskAnalysis
 
 @pytest.fixture
 def mock_session() -> MagicMock:
-    return MagicMock()
+    session = MagicMock()
+    # No rollups yet: aggregations read raw rows.
+    session.exec.return_value.first.return_value = None
+    return session
 
 
 def test_save_metric_persists_and_returns_metric(mock_session: MagicMock) -> None:
@@ -38,6 +41,27 @@ def test_save_metric_persists_and_returns_metric(mock_session: MagicMock) -> Non
     mock_session.refresh.assert_called_once_with(result)
 
 
+def test_save_metrics_inserts_all_records_in_one_statement(mock_session: MagicMock) -> None:
+    repo = MetricsRepository(mock_session)
+    records = [
+        {"operation": "rag", "model": "m", "duration_ms": 10.0},
+        {"operation": "eval", "model": "m", "duration_ms": 20.0},
+    ]
+
+    result = repo.save_metrics(records)
+
+    assert result == 2
+    mock_session.execute.assert_called_once()
+    mock_session.commit.assert_called_once()
+
+
+def test_save_metrics_skips_empty_batch(mock_session: MagicMock) -> None:
+    repo = MetricsRepository(mock_session)
+
+    assert repo.save_metrics([]) == 0
+    mock_session.execute.assert_not_called()
+
+
 def test_get_avg_eval_score_returns_none_when_no_data(mock_session: MagicMock) -> None:
     repo = MetricsRepository(mock_session)
     mock_session.exec.return_value.first.return_value = None
@@ -65,24 +89,34 @@ def test_get_p95_latency_ms_returns_none_when_no_data(mock_session: MagicMock) -
     assert result is None
 
 
-def test_get_p95_latency_ms_returns_p95_value(mock_session: MagicMock) -> None:
+def test_get_p95_latency_ms_interpolates_between_neighbours(
+    mock_session: MagicMock,
+) -> None:
     repo = MetricsRepository(mock_session)
-    rows = [LLMCallMetric(duration_ms=100.0), LLMCallMetric(duration_ms=200.0)]
-    mock_session.exec.return_value.all.return_value = rows
+    # (operation, avg, count, then lower/upper neighbour per p50, p90, p95, p99)
+    row = ("generate", 150.0, 2, 100.0, 200.0, 100.0, 200.0, 100.0, 200.0, 100.0, 200.0)
+    mock_session.exec.return_value.all.return_value = [row]
 
     result = repo.get_p95_latency_ms(operation="generate", days=7)
 
-    assert result == 200.0
+    assert result == pytest.approx(195.0)
+    mock_session.exec.assert_called_once()
 
 
-def test_get_p95_latency_ms_without_operation_filter(mock_session: MagicMock) -> None:
+def test_get_p95_latency_ms_uses_percentile_cont_on_postgresql(
+    mock_session: MagicMock,
+) -> None:
     repo = MetricsRepository(mock_session)
-    rows = [LLMCallMetric(duration_ms=100.0), LLMCallMetric(duration_ms=150.0)]
-    mock_session.exec.return_value.all.return_value = rows
+    mock_session.get_bind.return_value.dialect.name = "postgresql"
+    mock_session.exec.return_value.all.return_value = [
+        (None, 120.0, 2, 110.0, 190.0, 195.0, 199.0)
+    ]
 
     result = repo.get_p95_latency_ms(days=7)
 
-    assert result == 150.0
+    assert result == 195.0
+    stmt = str(mock_session.exec.call_args[0][0])
+    assert "percentile_cont" in stmt
 
 
 def test_get_avg_tokens_by_model_returns_empty_when_no_data(
@@ -127,18 +161,21 @@ def test_get_operation_stats_returns_stats_per_operation(
     mock_session: MagicMock,
 ) -> None:
     repo = MetricsRepository(mock_session)
-    rows = [("generate", 150.0, 10), ("embed", 50.0, 5)]
+    rows = [
+        ("generate", 150.0, 10, 140.0, 160.0, 170.0, 180.0, 180.0, 190.0, 190.0, 200.0),
+        ("embed", 50.0, 1, 50.0, None, 50.0, None, 50.0, None, 50.0, None),
+    ]
     mock_session.exec.return_value.all.return_value = rows
 
-    def mock_p95(*, operation: str, days: int) -> float:
-        return 180.0 if operation == "generate" else 60.0
-
-    repo.get_p95_latency_ms = mock_p95
-
     result = repo.get_operation_stats(days=7)
 
+    # One rollup-coverage probe, then the raw aggregation query.
+    assert mock_session.exec.call_count == 2
     assert "generate" in result
     assert "embed" in result
     assert result["generate"]["avg_duration_ms"] == 150.0
-    assert result["generate"]["p95_duration_ms"] == 180.0
-    assert result["generate"]["call_count"] == 10
\ No newline at end of file
+    # p95 of 10 rows sits at position 8.55 between the 9th and 10th values.
+    assert result["generate"]["p95_duration_ms"] == pytest.approx(180.0 + 0.55 * 10.0)
+    assert result["generate"]["p50_duration_ms"] == pytest.approx(150.0)
+    assert result["generate"]["call_count"] == 10
+    assert result["embed"]["p99_duration_ms"] == 50.0
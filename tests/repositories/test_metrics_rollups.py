@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.repositories.metrics_repo import MetricsRepository
+from app.repositories.models import LLMCallMetric, LLMCallMetricRollup
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(
+        engine, tables=[LLMCallMetric.__table__, LLMCallMetricRollup.__table__]
+    )
+    with Session(engine) as session:
+        yield session
+
+
+def _add(session: Session, created_at: datetime, operation: str, duration_ms: float, tokens=None):
+    session.add(
+        LLMCallMetric(
+            operation=operation,
+            model="llama",
+            duration_ms=duration_ms,
+            total_tokens=tokens,
+            created_at=created_at,
+        )
+    )
+
+
+def test_refresh_rollups_aggregates_complete_hours_only(session: Session) -> None:
+    now = datetime.utcnow()
+    current_hour = now.replace(minute=0, second=0, microsecond=0)
+    _add(session, current_hour - timedelta(hours=2, minutes=-5), "explain", 100.0, 10)
+    _add(session, current_hour - timedelta(hours=2, minutes=-10), "explain", 300.0, None)
+    _add(session, current_hour - timedelta(minutes=30), "rag", 50.0, 5)
+    _add(session, current_hour + timedelta(seconds=1), "rag", 70.0, 7)
+    session.commit()
+    repo = MetricsRepository(session)
+
+    assert repo.refresh_rollups(now) == 2
+    assert repo.refresh_rollups(now) == 1  # only the latest rolled hour is recomputed
+
+    rollups = session.exec(select(LLMCallMetricRollup)).all()
+    explain = next(r for r in rollups if r.operation == "explain")
+    assert explain.call_count == 2
+    assert explain.duration_sum_ms == 400.0
+    assert explain.total_tokens_sum == 10
+    assert explain.total_tokens_count == 1
+    assert sum(r.call_count for r in rollups) == 3
+
+
+def test_stats_from_rollups_match_raw_stats(session: Session) -> None:
+    now = datetime.utcnow()
+    rng = np.random.default_rng(7)
+    durations = rng.lognormal(mean=5, sigma=0.8, size=400)
+    for i, duration in enumerate(durations):
+        _add(session, now - timedelta(minutes=10 * i), "explain", float(duration), 100 + i % 3)
+    session.commit()
+    repo = MetricsRepository(session)
+
+    raw_stats = repo.get_operation_stats(days=7)
+    raw_tokens = repo.get_avg_tokens_by_model(days=7)
+    repo.refresh_rollups()
+    rolled_stats = repo.get_operation_stats(days=7)
+    rolled_tokens = repo.get_avg_tokens_by_model(days=7)
+
+    assert session.exec(select(LLMCallMetricRollup)).first() is not None
+    assert rolled_stats["explain"]["call_count"] == raw_stats["explain"]["call_count"] == 400
+    assert rolled_stats["explain"]["avg_duration_ms"] == pytest.approx(
+        raw_stats["explain"]["avg_duration_ms"]
+    )
+    for key in ("p50_duration_ms", "p90_duration_ms", "p95_duration_ms", "p99_duration_ms"):
+        assert rolled_stats["explain"][key] == pytest.approx(raw_stats["explain"][key], rel=0.06)
+    assert rolled_tokens["llama"]["avg_total_tokens"] == pytest.approx(
+        raw_tokens["llama"]["avg_total_tokens"]
+    )
+
+
+def test_refresh_rollups_takes_advisory_lock_on_postgresql() -> None:
+    session = MagicMock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    session.exec.return_value.first.return_value = None
+
+    assert MetricsRepository(session).refresh_rollups() == 0
+
+    statement = str(session.execute.call_args_list[0].args[0])
+    assert "pg_advisory_xact_lock" in statement
+    session.commit.assert_called_once()
@@ -1,6 +1,7 @@
 from unittest.mock import MagicMock
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from app.repositories.models import RiskAnalysis
 from app.repositories.risk_analysis_repo import RiskAnalysisRepository
@@ -8,7 +9,10 @@ from app.repositories.risk_analysis_repo import RiskAnalysisRepository
 
 @pytest.fixture
 def mock_session() -> MagicMock:
-    return MagicMock()
+    session = MagicMock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    session.execute.return_value.scalar.return_value = "0.8.0"  # pgvector version
+    return session
 
 
 def test_save_persists_and_returns_analysis(mock_session: MagicMock) -> None:
@@ -88,4 +92,16 @@ def test_search_by_embedding_returns_empty_when_no_matches(
     embedding = [0.1, 0.2, 0.3]
     result = repo.search_by_embedding(embedding, limit=5)
 
-    assert result == []
\ No newline at end of file
+    assert result == []
+
+
+def test_search_by_embedding_binds_query_vector(mock_session: MagicMock) -> None:
+    repo = RiskAnalysisRepository(mock_session)
+    mock_session.exec.return_value.all.return_value = []
+
+    repo.search_by_embedding([0.125, 0.25, 0.5], limit=5)
+
+    compiled = mock_session.exec.call_args[0][0].compile(dialect=postgresql.dialect())
+    assert "<=>" in str(compiled)
+    assert "0.125" not in str(compiled)
+    assert [0.125, 0.25, 0.5] in compiled.params.values()
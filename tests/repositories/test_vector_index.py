@@ -0,0 +1,171 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.domain.risk_level import AnalysisMode, RiskLevel
+from app.repositories import vector_index, vector_search
+from app.repositories.document_repo import DocumentRepository
+from app.repositories.models import Document, DocumentChunk, RiskAnalysis
+from app.repositories.risk_analysis_repo import RiskAnalysisRepository
+from app.repositories.vector_index import NumpyVectorIndex, VectorIndexRegistry
+
+
+def _random_vectors(count: int, dims: int = 8, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(size=(count, dims)).astype(np.float32)
+
+
+def test_search_matches_brute_force_cosine_ranking() -> None:
+    vectors = _random_vectors(200)
+    index = NumpyVectorIndex(dimensions=8)
+    index.add(range(1, 201), vectors)
+    query = _random_vectors(1, seed=1)[0]
+
+    hits = index.search(query, k=5)
+
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    similarity = normalized @ (query / np.linalg.norm(query))
+    expected = (np.argsort(-similarity)[:5] + 1).tolist()
+    assert [row_id for row_id, _ in hits] == expected
+    assert hits[0][1] == pytest.approx(1 - similarity.max(), abs=1e-5)
+    assert index.last_id == 200
+
+
+def test_search_with_k_above_size_and_empty_index() -> None:
+    index = NumpyVectorIndex(dimensions=8)
+    assert index.search([1.0] * 8, k=3) == []
+
+    index.add([1, 2], _random_vectors(2))
+    assert len(index.search([1.0] * 8, k=10)) == 2
+
+
+def test_appends_persist_incrementally_and_torn_writes_are_trimmed(tmp_path: Path) -> None:
+    path = tmp_path / "docs" / "7"
+    index = NumpyVectorIndex(dimensions=8, path=path)
+    index.add([1, 2], _random_vectors(2))
+    index.add([3], _random_vectors(1, seed=2))
+    with path.with_suffix(".ids").open("ab") as f:
+        np.array([4], dtype=np.int64).tofile(f)  # ids written, vector row lost
+
+    reloaded = NumpyVectorIndex(dimensions=8, path=path)
+
+    assert len(reloaded) == 3
+    assert reloaded.last_id == 3
+    assert path.with_suffix(".ids").stat().st_size == 3 * 8
+
+
+def test_catch_up_only_requests_rows_after_last_id() -> None:
+    index = NumpyVectorIndex(dimensions=8)
+    requested: list[int] = []
+
+    def fetch(last_id: int):
+        requested.append(last_id)
+        return [(5, [1.0] * 8)] if last_id == 0 else []
+
+    index.catch_up(fetch)
+    index.catch_up(fetch)
+
+    assert requested == [0, 5]
+
+
+def test_catch_up_rebuilds_when_database_disagrees() -> None:
+    index = NumpyVectorIndex(dimensions=8)
+    index.add([1, 2, 3], _random_vectors(3))
+    requested: list[int] = []
+
+    def fetch(last_id: int):
+        requested.append(last_id)
+        return [(1, [1.0] * 8)] if last_id == 0 else []
+
+    index.catch_up(fetch, lambda last_id: (1, 1))  # rows 2 and 3 no longer exist
+
+    assert requested == [0]
+    assert len(index) == 1
+    assert index.last_id == 1
+
+
+def test_registry_invalidate_deletes_partition_files(tmp_path: Path) -> None:
+    registry = VectorIndexRegistry(tmp_path)
+    registry.get("document_chunks/1").add([1, 2], [_unit(0), _unit(1)])
+    assert (tmp_path / "document_chunks" / "1.f32").exists()
+
+    registry.invalidate("document_chunks/1")
+
+    assert not (tmp_path / "document_chunks" / "1.f32").exists()
+    assert not (tmp_path / "document_chunks" / "1.ids").exists()
+    assert len(registry.get("document_chunks/1")) == 0
+
+
+def test_registry_discards_files_from_another_database(tmp_path: Path) -> None:
+    VectorIndexRegistry(tmp_path, identity="first").get("risk_analyses").add([1], [_unit(0)])
+
+    assert len(VectorIndexRegistry(tmp_path, identity="first").get("risk_analyses")) == 1
+    assert len(VectorIndexRegistry(tmp_path, identity="second").get("risk_analyses")) == 0
+    assert (tmp_path / "DATABASE").read_text() == "second"
+
+
+@pytest.fixture
+def sqlite_session(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(vector_search, "get_settings", lambda: SimpleNamespace(vector_backend="auto"))
+    registry = VectorIndexRegistry(tmp_path / "vectors")
+    monkeypatch.setattr(vector_search, "get_vector_index_registry", lambda: registry)
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(
+        engine,
+        tables=[Document.__table__, DocumentChunk.__table__, RiskAnalysis.__table__],
+    )
+    with Session(engine) as session:
+        yield session
+
+
+def _unit(axis: int) -> list[float]:
+    vector = [0.0] * vector_index.EMBEDDING_DIMENSIONS
+    vector[axis] = 1.0
+    return vector
+
+
+def test_chunk_search_on_sqlite_uses_per_document_index(sqlite_session: Session, tmp_path: Path) -> None:
+    repo = DocumentRepository(sqlite_session)
+    first = repo.save_document("a.txt", "a")
+    second = repo.save_document("b.txt", "b")
+    repo.save_chunks(
+        [
+            DocumentChunk(document_id=first.id, chunk_index=i, chunk_text=f"a{i}", embedding=_unit(i))
+            for i in range(3)
+        ]
+        + [DocumentChunk(document_id=second.id, chunk_index=0, chunk_text="b0", embedding=_unit(1))]
+    )
+
+    hits = repo.search_chunks_by_embedding(_unit(1), document_id=first.id, limit=2)
+    assert [c.chunk_text for c in hits][0] == "a1"
+    assert {c.document_id for c in hits} == {first.id}
+
+    repo.save_chunks([DocumentChunk(document_id=first.id, chunk_index=3, chunk_text="a3", embedding=_unit(5))])
+    assert repo.search_chunks_by_embedding(_unit(5), document_id=first.id, limit=1)[0].chunk_text == "a3"
+    assert (tmp_path / "vectors" / "document_chunks" / f"{first.id}.f32").exists()
+
+
+def _analysis(symbol: str, embedding: list[float] | None) -> RiskAnalysis:
+    return RiskAnalysis(
+        symbol=symbol,
+        days=90,
+        mode=AnalysisMode.rule,
+        volatility=0.01,
+        max_drawdown=-0.1,
+        mean_return=0.001,
+        risk_level=RiskLevel.LOW,
+        embedding=embedding,
+    )
+
+
+def test_risk_search_on_sqlite_skips_rows_without_embedding(sqlite_session: Session) -> None:
+    repo = RiskAnalysisRepository(sqlite_session)
+    repo.save(_analysis("AAPL", _unit(0)))
+    repo.save(_analysis("MSFT", _unit(1)))
+    repo.save(_analysis("TSLA", None))
+
+    hits = repo.search_by_embedding(_unit(1), limit=5)
+
+    assert [a.symbol for a in hits] == ["MSFT", "AAPL"]
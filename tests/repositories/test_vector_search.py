@@ -0,0 +1,100 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.repositories import vector_search
+from app.repositories.document_repo import DocumentRepository
+
+_pgvector_version = vector_search._pgvector_version
+
+
+def _session(dialect: str) -> MagicMock:
+    session = MagicMock()
+    session.get_bind.return_value.dialect.name = dialect
+    return session
+
+
+@pytest.fixture(autouse=True)
+def settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        vector_search,
+        "get_settings",
+        lambda: SimpleNamespace(
+            vector_backend="auto",
+            vector_ef_search=100,
+            vector_iterative_scan="strict_order",
+        ),
+    )
+    monkeypatch.setattr(vector_search, "_pgvector_version", lambda session: (0, 8, 0))
+
+
+def test_sets_transaction_local_hnsw_options_on_postgresql() -> None:
+    session = _session("postgresql")
+
+    vector_search.apply_vector_search_settings(session, limit=5)
+
+    params = session.execute.call_args.args[1]
+    assert params == {"ef_search": "100", "iterative_scan": "strict_order"}
+
+
+def test_ef_search_covers_limit_within_pgvector_bounds() -> None:
+    session = _session("postgresql")
+
+    vector_search.apply_vector_search_settings(session, limit=250)
+    assert session.execute.call_args.args[1]["ef_search"] == "250"
+
+    vector_search.apply_vector_search_settings(session, limit=5000)
+    assert session.execute.call_args.args[1]["ef_search"] == "1000"
+
+
+def test_iterative_scan_is_left_out_before_pgvector_0_8(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(vector_search, "_pgvector_version", lambda session: (0, 7, 4))
+    session = _session("postgresql")
+
+    vector_search.apply_vector_search_settings(session, limit=5)
+
+    assert "iterative_scan" not in str(session.execute.call_args.args[0])
+    assert session.execute.call_args.args[1] == {"ef_search": "100"}
+
+
+def test_pgvector_version_is_queried_once_per_database(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(vector_search, "_pgvector_versions", {})
+    session = _session("postgresql")
+    session.get_bind.return_value.engine.url = "postgresql://db/finai"
+    session.execute.return_value.scalar.return_value = "0.7.4"
+
+    assert _pgvector_version(session) == (0, 7, 4)
+    assert _pgvector_version(session) == (0, 7, 4)
+    assert session.execute.call_count == 1
+
+
+def test_skipped_on_other_databases() -> None:
+    session = _session("sqlite")
+
+    vector_search.apply_vector_search_settings(session, limit=5)
+
+    session.execute.assert_not_called()
+
+
+def test_chunk_search_applies_settings_before_query() -> None:
+    session = _session("postgresql")
+    session.exec.return_value.all.return_value = []
+
+    DocumentRepository(session).search_chunks_by_embedding([0.1, 0.2], document_id=3, limit=5)
+
+    calls = [c[0] for c in session.method_calls if c[0] in ("execute", "exec")]
+    assert calls == ["execute", "exec"]
+
+
+def test_chunk_search_binds_query_vector_and_document_filter() -> None:
+    session = _session("postgresql")
+    session.exec.return_value.all.return_value = []
+
+    DocumentRepository(session).search_chunks_by_embedding([0.125, 0.5], document_id=3, limit=5)
+
+    compiled = session.exec.call_args.args[0].compile(dialect=postgresql.dialect())
+    assert "0.125" not in str(compiled)
+    assert [0.125, 0.5] in compiled.params.values()
+    assert 3 in compiled.params.values()
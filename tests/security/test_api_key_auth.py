@@ -3,6 +3,7 @@ from types import SimpleNamespace
 import pytest
 from fastapi import HTTPException
 
+from app.core.cache import TTLCache
 from app.repositories.models import ApiKey
 from app.security import api_key as api_key_security
 
@@ -14,15 +15,42 @@ class _FakeResult:
     def all(self):
         return self._rows
 
+    def first(self):
+        return self._rows[0] if self._rows else None
+
 
 class _FakeSession:
     def __init__(self, rows):
         self._rows = rows
+        self.exec_calls = 0
 
     def exec(self, _):
+        self.exec_calls += 1
         return _FakeResult(self._rows)
 
 
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    return _Clock()
+
+
+@pytest.fixture(autouse=True)
+def fresh_key_cache(monkeypatch: pytest.MonkeyPatch, clock: _Clock) -> TTLCache:
+    cache = TTLCache(max_entries=100, ttl_seconds=60, clock=clock)
+    unknown = TTLCache(max_entries=10, ttl_seconds=5, clock=clock)
+    monkeypatch.setattr(api_key_security, "_get_key_cache", lambda: cache)
+    monkeypatch.setattr(api_key_security, "_get_unknown_key_cache", lambda: unknown)
+    return cache
+
+
 def test_hash_api_key_is_deterministic() -> None:
     salt = "test-salt"
     key = "my-secret-key"
@@ -126,3 +154,83 @@ def test_require_api_key_active_match_returns_row(
 
     assert result.name == "active"
     assert result.is_active is True
+
+
+def test_require_api_key_serves_repeat_requests_from_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        api_key_security,
+        "get_settings",
+        lambda: SimpleNamespace(api_key_salt="salt-123"),
+    )
+    active_hash = api_key_security.hash_api_key("raw-key", "salt-123")
+    session = _FakeSession([ApiKey(name="active", key_hash=active_hash, is_active=True)])
+
+    first = api_key_security.require_api_key(api_key="raw-key", session=session)
+    second = api_key_security.require_api_key(api_key="raw-key", session=session)
+
+    assert first.name == second.name == "active"
+    assert session.exec_calls == 1
+
+
+def test_require_api_key_caches_unknown_keys(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        api_key_security,
+        "get_settings",
+        lambda: SimpleNamespace(api_key_salt="salt-123"),
+    )
+    session = _FakeSession([])
+
+    for _ in range(3):
+        with pytest.raises(HTTPException) as exc:
+            api_key_security.require_api_key(api_key="unknown", session=session)
+        assert exc.value.status_code == 401
+
+    assert session.exec_calls == 1
+
+
+def test_invalidate_api_key_cache_forces_fresh_lookup(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        api_key_security,
+        "get_settings",
+        lambda: SimpleNamespace(api_key_salt="salt-123"),
+    )
+    key_hash = api_key_security.hash_api_key("raw-key", "salt-123")
+
+    with pytest.raises(HTTPException):
+        api_key_security.require_api_key(api_key="raw-key", session=_FakeSession([]))
+
+    api_key_security.invalidate_api_key_cache(key_hash)
+    result = api_key_security.require_api_key(
+        api_key="raw-key",
+        session=_FakeSession([ApiKey(name="new", key_hash=key_hash, is_active=True)]),
+    )
+
+    assert result.name == "new"
+
+
+def test_unknown_keys_expire_quickly_and_do_not_fill_the_key_cache(
+    monkeypatch: pytest.MonkeyPatch, fresh_key_cache: TTLCache, clock: _Clock
+) -> None:
+    monkeypatch.setattr(
+        api_key_security,
+        "get_settings",
+        lambda: SimpleNamespace(api_key_salt="salt-123"),
+    )
+    key_hash = api_key_security.hash_api_key("raw-key", "salt-123")
+
+    with pytest.raises(HTTPException):
+        api_key_security.require_api_key(api_key="raw-key", session=_FakeSession([]))
+    assert fresh_key_cache.stats()["size"] == 0
+
+    created = _FakeSession([ApiKey(name="new", key_hash=key_hash, is_active=True)])
+    with pytest.raises(HTTPException):
+        api_key_security.require_api_key(api_key="raw-key", session=created)
+    clock.now = 6
+    result = api_key_security.require_api_key(api_key="raw-key", session=created)
+
+    assert result.name == "new"
+    assert created.exec_calls == 1
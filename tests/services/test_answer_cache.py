@@ -0,0 +1,72 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services import rag
+from app.services.answer_cache import SemanticAnswerCache
+
+
+def _cache(**overrides) -> SemanticAnswerCache:
+    values = dict(similarity_threshold=0.9, max_entries_per_document=2, max_documents=2)
+    values.update(overrides)
+    return SemanticAnswerCache(**values)
+
+
+def test_returns_answer_for_similar_question_only() -> None:
+    cache = _cache()
+    cache.store(1, [1.0, 0.0], "answer", ["chunk"])
+
+    hit = cache.lookup(1, [0.95, 0.1])
+
+    assert hit is not None
+    assert (hit.answer, hit.sources) == ("answer", ("chunk",))
+    assert cache.lookup(1, [0.5, 0.5]) is None
+    assert cache.lookup(2, [1.0, 0.0]) is None
+    assert cache.stats() == {"hits": 1, "misses": 2, "coalesced": 0, "size": 1}
+
+
+def test_evicts_least_recently_used_answer_per_document() -> None:
+    cache = _cache()
+    cache.store(1, [1.0, 0.0, 0.0], "x", [])
+    cache.store(1, [0.0, 1.0, 0.0], "y", [])
+    assert cache.lookup(1, [1.0, 0.0, 0.0]) is not None  # x is now most recent
+
+    cache.store(1, [0.0, 0.0, 1.0], "z", [])
+
+    assert cache.lookup(1, [0.0, 1.0, 0.0]) is None
+    assert cache.lookup(1, [1.0, 0.0, 0.0]).answer == "x"
+    assert cache.lookup(1, [0.0, 0.0, 1.0]).answer == "z"
+
+
+def test_bounds_documents_and_supports_invalidation() -> None:
+    cache = _cache()
+    for document_id in (1, 2, 3):
+        cache.store(document_id, [1.0, 0.0], f"doc {document_id}", [])
+
+    assert cache.lookup(1, [1.0, 0.0]) is None
+    cache.invalidate(2)
+    assert cache.lookup(2, [1.0, 0.0]) is None
+    assert cache.lookup(3, [1.0, 0.0]).answer == "doc 3"
+
+
+def test_zero_capacity_disables_storage() -> None:
+    cache = _cache(max_entries_per_document=0)
+    cache.store(1, [1.0, 0.0], "answer", [])
+
+    assert cache.lookup(1, [1.0, 0.0]) is None
+
+
+def test_answer_question_skips_retrieval_and_llm_on_hit(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = _cache()
+    cache.store(7, [1.0, 0.0], "cached answer", ["source"])
+    monkeypatch.setattr(rag, "get_settings", lambda: SimpleNamespace(groq_api_key="gsk_test"))
+    monkeypatch.setattr(rag, "embed_text", lambda question: [0.99, 0.05])
+    monkeypatch.setattr(rag, "get_answer_cache", lambda: cache)
+    search = MagicMock()
+    monkeypatch.setattr(rag, "hybrid_search_chunks", search)
+
+    answer, sources = rag.answer_question("What is revenue?", 7, MagicMock())
+
+    assert (answer, sources) == ("cached answer", ["source"])
+    search.assert_not_called()
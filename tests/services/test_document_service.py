@@ -0,0 +1,216 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.repositories import document_repo, vector_search
+from app.repositories.document_repo import DocumentRepository
+from app.repositories.lexical_index import LexicalIndexRegistry
+from app.repositories.models import Document, DocumentChunk
+from app.repositories.vector_index import EMBEDDING_DIMENSIONS, VectorIndexRegistry
+from app.services import document_service
+from app.services import embeddings as embeddings_service
+
+
+def test_ingest_document_embeds_all_chunks_in_one_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[list[str]] = []
+
+    def fake_embed_texts(texts: list[str]) -> list[list[float]]:
+        calls.append(texts)
+        return [[float(i)] for i in range(len(texts))]
+
+    repo = MagicMock()
+    repo.save_document.return_value = SimpleNamespace(id=7)
+    monkeypatch.setattr(document_service, "embed_texts", fake_embed_texts)
+    monkeypatch.setattr(document_service, "DocumentRepository", lambda session: repo)
+
+    text = "".join(chr(ord("a") + i % 26) for i in range(1200))
+
+    doc_id, chunk_count = document_service.ingest_document("notes.txt", text.encode(), MagicMock())
+
+    assert (doc_id, chunk_count) == (7, 3)
+    assert len(calls) == 1
+    saved = repo.save_chunks.call_args.args[0]
+    assert [c.chunk_index for c in saved] == [0, 1, 2]
+    assert [c.embedding for c in saved] == [[0.0], [1.0], [2.0]]
+    assert saved[0].document_id == 7
+
+
+def _reference_chunks(text: str) -> list[str]:
+    return [text[start : start + 500] for start in range(0, len(text), 450)]
+
+
+@pytest.mark.parametrize("length", [0, 1, 450, 499, 500, 501, 950, 1200, 2345])
+@pytest.mark.parametrize("piece_size", [1, 7, 450, 10_000])
+def test_streamed_chunks_match_slicing_the_full_text(length: int, piece_size: int) -> None:
+    text = "".join(chr(ord("a") + i % 26) for i in range(length))
+    pieces = [text[i : i + piece_size] for i in range(0, len(text), piece_size)]
+
+    assert list(document_service._iter_chunks(pieces)) == _reference_chunks(text)
+
+
+def test_streamed_pdf_text_matches_joined_and_stripped_pages(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pages = ["", "  \n", " Revenue grew. ", "", "Costs fell.\n ", "  "]
+    monkeypatch.setattr(document_service, "iter_pdf_pages", lambda data, progress: iter(pages))
+
+    streamed = "".join(document_service._iter_text("10k.pdf", b"%PDF"))
+
+    assert streamed == "\n".join(pages).strip()
+
+
+def test_ingest_document_embeds_and_inserts_in_micro_batches(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    batches: list[int] = []
+
+    def fake_embed_texts(texts: list[str]) -> list[list[float]]:
+        batches.append(len(texts))
+        return [[0.0] for _ in texts]
+
+    repo = MagicMock()
+    repo.save_document.return_value = SimpleNamespace(id=3)
+    monkeypatch.setattr(document_service, "embed_texts", fake_embed_texts)
+    monkeypatch.setattr(document_service, "DocumentRepository", lambda session: repo)
+    monkeypatch.setattr(
+        document_service, "get_settings", lambda: SimpleNamespace(ingest_batch_size=2)
+    )
+    text = "".join(chr(ord("a") + i % 26) for i in range(2100))
+
+    _, chunk_count = document_service.ingest_document("notes.md", text.encode(), MagicMock())
+
+    assert chunk_count == 5
+    assert batches == [2, 2, 1]
+    saved = [chunk for call in repo.save_chunks.call_args_list for chunk in call.args[0]]
+    assert [c.chunk_index for c in saved] == [0, 1, 2, 3, 4]
+    assert [c.chunk_text for c in saved] == _reference_chunks(text)
+    repo.update_document_text.assert_called_once_with(3, text)
+
+
+def test_ingest_document_removes_partial_chunks_on_failure(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = 0
+
+    def flaky_embed_texts(texts: list[str]) -> list[list[float]]:
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise RuntimeError("model crashed")
+        return [[0.0] for _ in texts]
+
+    repo = MagicMock()
+    repo.update_document_text.return_value = SimpleNamespace(id=9)
+    monkeypatch.setattr(document_service, "embed_texts", flaky_embed_texts)
+    monkeypatch.setattr(document_service, "DocumentRepository", lambda session: repo)
+    monkeypatch.setattr(
+        document_service, "get_settings", lambda: SimpleNamespace(ingest_batch_size=1)
+    )
+
+    with pytest.raises(RuntimeError):
+        document_service.ingest_document("notes.txt", b"x" * 1200, MagicMock(), document_id=9)
+
+    assert repo.save_chunks.call_count == 1
+    repo.delete_chunks.assert_called_with(9)
+
+
+def test_image_only_pdf_is_rejected_before_a_document_is_created(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repo = MagicMock()
+    monkeypatch.setattr(document_service, "DocumentRepository", lambda session: repo)
+    monkeypatch.setattr(document_service, "iter_pdf_pages", lambda data, progress: iter(["", " "]))
+
+    with pytest.raises(ValueError, match="image-based"):
+        document_service.ingest_document("scan.pdf", b"%PDF", MagicMock())
+
+    repo.save_document.assert_not_called()
+
+
+def test_ingest_document_reuses_stored_and_repeated_embeddings(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    embedded: list[str] = []
+
+    def fake_embed_texts(texts: list[str]) -> list[list[float]]:
+        embedded.extend(texts)
+        return [[float(len(embedded))] for _ in texts]
+
+    boilerplate = "b" * 500
+    stored_hash = embeddings_service.content_hash(boilerplate)
+    repo = MagicMock()
+    repo.save_document.return_value = SimpleNamespace(id=4)
+    repo.find_embeddings_by_hash.return_value = {stored_hash: [9.0]}
+    monkeypatch.setattr(document_service, "embed_texts", fake_embed_texts)
+    monkeypatch.setattr(document_service, "DocumentRepository", lambda session: repo)
+    # 450-char steps over 1400 chars: [b*500], [b*50 + x*450], [x*500], [x*50]
+    text = boilerplate + "x" * 900
+
+    document_service.ingest_document("q2.txt", text.encode(), MagicMock())
+
+    saved = repo.save_chunks.call_args.args[0]
+    assert saved[0].embedding == [9.0]
+    assert boilerplate not in embedded
+    assert len(embedded) == 3
+    assert [c.content_hash for c in saved] == [
+        embeddings_service.content_hash(c.chunk_text) for c in saved
+    ]
+
+
+def test_repeated_chunks_within_a_document_are_embedded_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    embedded: list[str] = []
+
+    def fake_embed_texts(texts: list[str]) -> list[list[float]]:
+        embedded.extend(texts)
+        return [[0.0] for _ in texts]
+
+    repo = MagicMock()
+    repo.save_document.return_value = SimpleNamespace(id=5)
+    repo.find_embeddings_by_hash.return_value = {}
+    monkeypatch.setattr(document_service, "embed_texts", fake_embed_texts)
+    monkeypatch.setattr(document_service, "DocumentRepository", lambda session: repo)
+
+    _, chunk_count = document_service.ingest_document("notes.txt", b"x" * 1400, MagicMock())
+
+    assert chunk_count == 4
+    assert sorted(embedded) == ["x" * 50, "x" * 500]
+
+
+def test_reingested_document_is_searched_by_its_new_chunks(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    def fake_embed_texts(texts: list[str]) -> list[list[float]]:
+        vectors = []
+        for text in texts:
+            vector = [0.0] * EMBEDDING_DIMENSIONS
+            vector[0 if text.startswith("alpha") else 1] = 1.0
+            vectors.append(vector)
+        return vectors
+
+    vectors = VectorIndexRegistry(tmp_path / "vectors")
+    lexical = LexicalIndexRegistry()
+    monkeypatch.setattr(document_service, "embed_texts", fake_embed_texts)
+    monkeypatch.setattr(document_repo, "get_vector_index_registry", lambda: vectors)
+    monkeypatch.setattr(document_repo, "get_lexical_index_registry", lambda: lexical)
+    monkeypatch.setattr(vector_search, "get_vector_index_registry", lambda: vectors)
+    monkeypatch.setattr(vector_search, "get_settings", lambda: SimpleNamespace(vector_backend="auto"))
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine, tables=[Document.__table__, DocumentChunk.__table__])
+
+    with Session(engine) as session:
+        repo = DocumentRepository(session)
+        doc_id, _ = document_service.ingest_document("q.txt", b"alpha revenue", session)
+        by_vector = repo.search_chunks_by_embedding(fake_embed_texts(["alpha"])[0], doc_id)
+        assert [c.chunk_text for c in by_vector] == ["alpha revenue"]
+        assert repo.search_chunks_by_text("revenue", doc_id)
+
+        document_service.ingest_document("q.txt", b"beta costs", session, document_id=doc_id)
+
+        by_vector = repo.search_chunks_by_embedding(fake_embed_texts(["beta"])[0], doc_id)
+        assert [c.chunk_text for c in by_vector] == ["beta costs"]
+        assert [c.chunk_text for c in repo.search_chunks_by_text("costs")] == ["beta costs"]
+        assert repo.search_chunks_by_text("revenue", doc_id) == []
@@ -0,0 +1,111 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.services import embeddings
+
+
+class _FakeModel:
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def encode(self, texts, batch_size=32, normalize_embeddings=False):
+        if isinstance(texts, str):
+            self.batches.append([texts])
+            return np.array([float(len(texts)), 1.0], dtype=np.float32)
+        self.batches.append(list(texts))
+        return np.array([[float(len(text)), 1.0] for text in texts], dtype=np.float32)
+
+
+def _reset_caches() -> None:
+    embeddings._get_embedding_cache.cache_clear()
+    store = embeddings._get_embedding_store()
+    if store is not None:
+        store.close()
+    embeddings._get_embedding_store.cache_clear()
+
+
+@pytest.fixture
+def cache_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "embeddings.sqlite"
+    monkeypatch.setattr(
+        embeddings,
+        "get_settings",
+        lambda: SimpleNamespace(embedding_cache_max_entries=100, embedding_cache_path=str(path)),
+    )
+    _reset_caches()
+    yield path
+    _reset_caches()
+
+
+@pytest.fixture
+def fake_model(monkeypatch: pytest.MonkeyPatch, cache_path: Path) -> _FakeModel:
+    model = _FakeModel()
+    monkeypatch.setattr(embeddings, "_get_model", lambda: model)
+    return model
+
+
+def test_embed_texts_batches_by_length_and_keeps_input_order(fake_model: _FakeModel) -> None:
+    texts = ["ccc", "a", "bbbbb", "dd"]
+
+    vectors = embeddings.embed_texts(texts, batch_size=2)
+
+    assert fake_model.batches == [["a", "dd"], ["ccc", "bbbbb"]]
+    assert vectors == [[3.0, 1.0], [1.0, 1.0], [5.0, 1.0], [2.0, 1.0]]
+
+
+def test_embed_texts_empty_input_skips_model(fake_model: _FakeModel) -> None:
+    assert embeddings.embed_texts([]) == []
+    assert fake_model.batches == []
+
+
+def test_embed_texts_encodes_only_uncached_unique_texts(fake_model: _FakeModel) -> None:
+    embeddings.embed_text("aa")
+
+    vectors = embeddings.embed_texts(["aa", "bbb", "bbb"])
+
+    assert fake_model.batches == [["aa"], ["bbb"]]
+    assert vectors == [[2.0, 1.0], [3.0, 1.0], [3.0, 1.0]]
+
+
+def test_embed_text_hits_memory_then_returns_independent_copies(fake_model: _FakeModel) -> None:
+    first = embeddings.embed_text("query")
+    first.append(99.0)
+    second = embeddings.embed_text("query")
+
+    assert second == [5.0, 1.0]
+    assert len(fake_model.batches) == 1
+    stats = embeddings.embedding_cache_stats()
+    assert stats["memory"]["hits"] == 1
+    assert stats["persistent"]["size"] == 1
+
+
+def test_memory_tier_holds_float32_arrays_and_skips_bulk_embeddings(fake_model: _FakeModel) -> None:
+    embeddings.embed_texts(["chunk one", "chunk two"])
+    embeddings.embed_text("query")
+
+    cache = embeddings._get_embedding_cache()
+    assert cache.stats()["size"] == 1
+    cached = cache.get(embeddings.content_hash("query"))
+    assert isinstance(cached, np.ndarray)
+    assert cached.dtype == np.float32
+
+
+def test_persistent_tier_survives_memory_reset(fake_model: _FakeModel) -> None:
+    embeddings.embed_texts(["alpha", "beta"])
+    _reset_caches()
+
+    assert embeddings.embed_text("alpha") == [5.0, 1.0]
+    assert embeddings.embed_texts(["beta"]) == [[4.0, 1.0]]
+
+    assert len(fake_model.batches) == 1
+    assert embeddings.embedding_cache_stats()["persistent"]["hits"] == 2
+
+
+def test_cache_key_depends_on_model_name(monkeypatch: pytest.MonkeyPatch) -> None:
+    key = embeddings.content_hash("text")
+    monkeypatch.setattr(embeddings, "_MODEL_NAME", "other-model")
+
+    assert embeddings.content_hash("text") != key
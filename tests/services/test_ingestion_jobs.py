@@ -0,0 +1,115 @@
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.api import documents as documents_api
+from app.domain.ingestion import IngestionStatus
+from app.repositories.models import Document, DocumentChunk, IngestionJob
+from app.services import document_service, ingestion_jobs
+
+
+@pytest.fixture
+def engine(monkeypatch: pytest.MonkeyPatch):
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(
+        engine,
+        tables=[Document.__table__, DocumentChunk.__table__, IngestionJob.__table__],
+    )
+    monkeypatch.setattr(ingestion_jobs, "get_engine", lambda: engine)
+    monkeypatch.setattr(
+        document_service, "embed_texts", lambda texts: [[0.1] * 384 for _ in texts]
+    )
+    pool = MagicMock()
+    monkeypatch.setattr(ingestion_jobs, "get_ingestion_worker_pool", lambda: pool)
+    return engine
+
+
+def _pool() -> ingestion_jobs.IngestionWorkerPool:
+    return ingestion_jobs.IngestionWorkerPool(
+        workers=1, poll_interval_seconds=0.1, lease_seconds=60, max_attempts=3
+    )
+
+
+def test_queued_upload_is_ingested_and_reports_progress(engine) -> None:
+    with Session(engine) as session:
+        job = ingestion_jobs.submit_document("notes.txt", b"x" * 1200, session)
+        document_id = job.document_id
+
+        pending = documents_api.document_status(document_id, session)
+        assert pending.status == IngestionStatus.queued
+        assert pending.chunks_embedded == 0
+
+    assert _pool().run_once() is True
+    assert _pool().run_once() is False
+
+    with Session(engine) as session:
+        done = documents_api.document_status(document_id, session)
+        assert done.status == IngestionStatus.succeeded
+        assert (done.pages_total, done.pages_extracted) == (1, 1)
+        assert (done.chunks_total, done.chunks_embedded) == (3, 3)
+        assert session.get(Document, document_id).content_text == "x" * 1200
+
+
+def test_failed_ingestion_is_reported_on_the_job(engine) -> None:
+    with Session(engine) as session:
+        job = ingestion_jobs.submit_document("scan.pdf", b"not a pdf", session)
+
+    _pool().run_once()
+
+    with Session(engine) as session:
+        status = documents_api.document_status(job.document_id, session)
+        assert status.status == IngestionStatus.failed
+        assert status.error
+
+
+def test_unsupported_type_is_rejected_before_queueing(engine) -> None:
+    with Session(engine) as session:
+        with pytest.raises(ValueError, match="Unsupported file type"):
+            ingestion_jobs.submit_document("sheet.xlsx", b"data", session)
+        assert session.get(Document, 1) is None
+
+
+def test_status_of_unknown_document_is_404(engine) -> None:
+    with Session(engine) as session:
+        with pytest.raises(HTTPException) as exc:
+            documents_api.document_status(99, session)
+
+    assert exc.value.status_code == 404
+
+
+def test_worker_survives_database_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    claims = iter([RuntimeError("connection refused"), SimpleNamespace(id=1), SimpleNamespace(id=2)])
+
+    def flaky_claim(lease_seconds: float, max_attempts: int):
+        outcome = next(claims, None)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    ran: list[int] = []
+    second_job_ran = threading.Event()
+
+    def run_job(job) -> None:
+        ran.append(job.id)
+        if job.id == 1:
+            raise RuntimeError("could not record outcome")
+        second_job_ran.set()
+
+    monkeypatch.setattr(ingestion_jobs, "_claim_next_job", flaky_claim)
+    pool = ingestion_jobs.IngestionWorkerPool(
+        workers=1, poll_interval_seconds=0.01, lease_seconds=60, max_attempts=3, run_job=run_job
+    )
+
+    pool.start()
+    try:
+        assert second_job_ran.wait(5)
+    finally:
+        pool.stop(timeout=5)
+    assert ran == [1, 2]
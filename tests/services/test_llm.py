@@ -0,0 +1,104 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.repositories.models import RiskAnalysis, RiskExplanation
+from app.services import llm
+
+_METRICS = dict(
+    symbol="AAPL",
+    days=90,
+    volatility=0.0123,
+    max_drawdown=-0.15,
+    mean_return=0.001,
+    risk_level="MEDIUM",
+)
+
+
+@pytest.fixture
+def generated(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+
+    def fake_generate(symbol: str, days: int, user_message: str) -> str:
+        calls.append(user_message)
+        return f"explanation {len(calls)}"
+
+    monkeypatch.setattr(llm, "_generate_explanation", fake_generate)
+    return calls
+
+
+def _use_settings(monkeypatch: pytest.MonkeyPatch, **overrides) -> None:
+    values = dict(
+        groq_api_key="gsk_test",
+        groq_model="llama-test",
+        explanation_cache_ttl_seconds=3600.0,
+        explanation_cache_max_entries=100,
+        explanation_cache_db=False,
+    )
+    values.update(overrides)
+    monkeypatch.setattr(llm, "get_settings", lambda: SimpleNamespace(**values))
+    llm._get_explanation_cache.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    yield
+    llm._get_explanation_cache.cache_clear()
+
+
+def test_repeat_explain_is_served_from_memory(
+    monkeypatch: pytest.MonkeyPatch, generated: list[str]
+) -> None:
+    _use_settings(monkeypatch)
+
+    first = llm.explain_risk(**_METRICS)
+    second = llm.explain_risk(**{**_METRICS, "volatility": 0.01230004})
+
+    assert first == second == "explanation 1"
+    assert len(generated) == 1
+    assert llm.explanation_cache_stats()["memory"]["hits"] == 1
+
+
+def test_key_changes_with_prompt_precision_and_model(
+    monkeypatch: pytest.MonkeyPatch, generated: list[str]
+) -> None:
+    _use_settings(monkeypatch)
+
+    llm.explain_risk(**_METRICS)
+    llm.explain_risk(**{**_METRICS, "volatility": 0.0124})
+    llm.explain_risk(**{**_METRICS, "days": 30})
+    _use_settings(monkeypatch, groq_model="other-model")
+    llm.explain_risk(**_METRICS)
+
+    assert len(generated) == 4
+
+
+def test_missing_api_key_still_raises(monkeypatch: pytest.MonkeyPatch, generated: list[str]) -> None:
+    _use_settings(monkeypatch, groq_api_key="")
+
+    with pytest.raises(ValueError, match="GROQ_API_KEY"):
+        llm.explain_risk(**_METRICS)
+
+
+def test_database_tier_survives_memory_reset_and_respects_ttl(
+    monkeypatch: pytest.MonkeyPatch, generated: list[str]
+) -> None:
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(
+        engine, tables=[RiskAnalysis.__table__, RiskExplanation.__table__]
+    )
+    monkeypatch.setattr(llm, "get_engine", lambda: engine)
+    _use_settings(monkeypatch, explanation_cache_db=True)
+
+    assert llm.explain_risk(**_METRICS) == "explanation 1"
+    _use_settings(monkeypatch, explanation_cache_db=True)  # drops the memory tier
+    assert llm.explain_risk(**_METRICS) == "explanation 1"
+    assert len(generated) == 1
+
+    _use_settings(monkeypatch, explanation_cache_db=True, explanation_cache_ttl_seconds=0)
+    assert llm.explain_risk(**_METRICS) == "explanation 2"
+
+    with Session(engine) as session:
+        assert session.exec(select(RiskAnalysis)).all() == []
+        assert len(session.exec(select(RiskExplanation)).all()) == 2
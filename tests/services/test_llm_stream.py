@@ -0,0 +1,131 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import llm, llm_stream
+
+
+def _chunk(content: str | None, usage: dict | None = None) -> SimpleNamespace:
+    choices = [] if content is None else [SimpleNamespace(delta=SimpleNamespace(content=content))]
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+class _FakeStream:
+    def __init__(self, chunks: list[SimpleNamespace]) -> None:
+        self._chunks = iter(chunks)
+
+    def __aiter__(self) -> "_FakeStream":
+        return self
+
+    async def __anext__(self) -> SimpleNamespace:
+        try:
+            return next(self._chunks)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+class _FakeAsyncClient:
+    def __init__(self, chunks: list[SimpleNamespace]) -> None:
+        self.requests: list[dict] = []
+
+        async def create(**kwargs) -> _FakeStream:
+            self.requests.append(kwargs)
+            return _FakeStream(chunks)
+
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+
+
+async def _collect(tokens) -> list[str]:
+    return [token async for token in tokens]
+
+
+@pytest.fixture
+def metrics(monkeypatch: pytest.MonkeyPatch) -> list[dict]:
+    calls: list[dict] = []
+    monkeypatch.setattr(llm_stream, "log_llm_metric", lambda **kwargs: calls.append(kwargs))
+    monkeypatch.setattr(
+        llm_stream, "get_settings", lambda: SimpleNamespace(groq_model="llama-test")
+    )
+    return calls
+
+
+def test_stream_yields_deltas_and_logs_usage(
+    monkeypatch: pytest.MonkeyPatch, metrics: list[dict]
+) -> None:
+    client = _FakeAsyncClient(
+        [
+            _chunk("Volatility "),
+            _chunk(""),
+            _chunk("is high."),
+            _chunk(None, usage={"prompt_tokens": 40, "completion_tokens": 5, "total_tokens": 45}),
+        ]
+    )
+    monkeypatch.setattr(llm_stream, "get_async_llm_client", lambda: client)
+    completed: list[str] = []
+
+    tokens = asyncio.run(
+        _collect(
+            llm_stream.stream_chat_completion(
+                [{"role": "user", "content": "hi"}],
+                operation="explain",
+                max_tokens=10,
+                temperature=0.1,
+                on_complete=completed.append,
+            )
+        )
+    )
+
+    assert tokens == ["Volatility ", "is high."]
+    assert client.requests[0]["stream"] is True
+    assert client.requests[0]["stream_options"] == {"include_usage": True}
+    assert completed == ["Volatility is high."]
+    assert len(metrics) == 1
+    assert metrics[0]["operation"] == "explain"
+    assert metrics[0]["model"] == "llama-test"
+    assert (metrics[0]["input_tokens"], metrics[0]["output_tokens"], metrics[0]["total_tokens"]) == (
+        40,
+        5,
+        45,
+    )
+
+
+def test_usage_falls_back_to_x_groq() -> None:
+    chunk = SimpleNamespace(usage=None, x_groq={"usage": {"total_tokens": 7}})
+
+    assert llm_stream._token_count(llm_stream._usage_from_chunk(chunk), "total_tokens") == 7
+
+
+def test_stream_explain_caches_and_replays(
+    monkeypatch: pytest.MonkeyPatch, metrics: list[dict]
+) -> None:
+    monkeypatch.setattr(
+        llm,
+        "get_settings",
+        lambda: SimpleNamespace(
+            groq_api_key="gsk_test",
+            groq_model="llama-test",
+            explanation_cache_ttl_seconds=3600.0,
+            explanation_cache_max_entries=100,
+            explanation_cache_db=False,
+        ),
+    )
+    llm._get_explanation_cache.cache_clear()
+    client = _FakeAsyncClient([_chunk("Moderate "), _chunk("risk.")])
+    monkeypatch.setattr(llm_stream, "get_async_llm_client", lambda: client)
+    params = dict(
+        symbol="AAPL", days=90, volatility=0.01, max_drawdown=-0.1, mean_return=0.001, risk_level="MEDIUM"
+    )
+
+    try:
+        first = asyncio.run(_collect(llm.stream_explain_risk(**params)))
+        second = asyncio.run(_collect(llm.stream_explain_risk(**params)))
+        explained = llm.explain_risk(**params)
+    finally:
+        llm._get_explanation_cache.cache_clear()
+
+    assert first == ["Moderate ", "risk."]
+    assert second == ["Moderate risk."]
+    assert explained == "Moderate risk."
+    assert len(client.requests) == 1
+    assert len(metrics) == 1
@@ -0,0 +1,104 @@
+import time
+
+import pytest
+
+from app.services import metrics_logger
+from app.services.metrics_logger import MetricsWriter
+
+
+def _record(operation: str = "explain") -> dict:
+    return {"operation": operation, "model": "m", "duration_ms": 1.0}
+
+
+def test_writer_flushes_full_batches_in_background() -> None:
+    batches: list[list[dict]] = []
+    writer = MetricsWriter(batches.append, batch_size=2, flush_interval_seconds=5)
+
+    for _ in range(4):
+        writer.submit(_record())
+
+    deadline = time.monotonic() + 2
+    while writer.stats()["written"] < 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    writer.stop(timeout=1)
+
+    assert [len(batch) for batch in batches] == [2, 2]
+    assert writer.stats()["written"] == 4
+
+
+def test_writer_flushes_partial_batch_after_interval() -> None:
+    batches: list[list[dict]] = []
+    writer = MetricsWriter(batches.append, batch_size=100, flush_interval_seconds=0.05)
+
+    writer.submit(_record())
+
+    deadline = time.monotonic() + 2
+    while not batches and time.monotonic() < deadline:
+        time.sleep(0.01)
+    writer.stop(timeout=1)
+
+    assert batches == [[_record()]]
+
+
+def test_writer_drops_and_counts_overflow() -> None:
+    writer = MetricsWriter(lambda _: None, max_queue=1)
+    writer.start = lambda: None  # keep the queue from draining
+
+    assert writer.submit(_record()) is True
+    assert writer.submit(_record()) is False
+    assert writer.stats()["dropped"] == 1
+
+
+def test_stop_drains_queued_records() -> None:
+    batches: list[list[dict]] = []
+    writer = MetricsWriter(batches.append, batch_size=10, flush_interval_seconds=60)
+    writer.start = lambda: None
+
+    writer.submit(_record("rag"))
+    writer.submit(_record("eval"))
+    writer.stop()
+
+    assert [r["operation"] for batch in batches for r in batch] == ["rag", "eval"]
+
+
+def test_submit_after_stop_writes_synchronously_without_restarting() -> None:
+    batches: list[list[dict]] = []
+    writer = MetricsWriter(batches.append)
+    writer.stop()
+
+    assert writer.submit(_record("late")) is True
+
+    assert batches == [[_record("late")]]
+    assert writer._thread is None
+    assert writer.stats()["queued"] == 0
+
+
+def test_write_failures_are_counted_not_raised() -> None:
+    def failing(_: list[dict]) -> None:
+        raise RuntimeError("db down")
+
+    writer = MetricsWriter(failing)
+    writer.start = lambda: None
+    writer.submit(_record())
+
+    writer.flush()
+
+    assert writer.stats()["failed"] == 1
+
+
+def test_log_llm_metric_enqueues_full_record(monkeypatch: pytest.MonkeyPatch) -> None:
+    submitted: list[dict] = []
+    monkeypatch.setattr(
+        metrics_logger,
+        "get_metrics_writer",
+        lambda: type("W", (), {"submit": staticmethod(submitted.append)})(),
+    )
+
+    metrics_logger.log_llm_metric(operation="explain", model="m", duration_ms=12.5, total_tokens=30)
+
+    assert len(submitted) == 1
+    record = submitted[0]
+    assert record["operation"] == "explain"
+    assert record["total_tokens"] == 30
+    assert record["eval_score"] is None
+    assert record["created_at"] is not None
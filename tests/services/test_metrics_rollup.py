@@ -0,0 +1,28 @@
+from app.services.metrics_rollup import MetricsRollupJob
+
+
+def test_run_once_swallows_refresh_errors() -> None:
+    def failing() -> int:
+        raise RuntimeError("db down")
+
+    MetricsRollupJob(60, refresh=failing).run_once()
+
+
+def test_job_refreshes_on_start_and_stops() -> None:
+    calls: list[int] = []
+    job = MetricsRollupJob(60, refresh=lambda: calls.append(1) or 0)
+
+    job.start()
+    job.stop(timeout=2)
+
+    assert calls == [1]
+
+
+def test_non_positive_interval_disables_job() -> None:
+    calls: list[int] = []
+    job = MetricsRollupJob(0, refresh=lambda: calls.append(1) or 0)
+
+    job.start()
+    job.stop(timeout=1)
+
+    assert calls == []
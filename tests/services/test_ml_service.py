@@ -1,9 +1,11 @@
 from pathlib import Path
 from types import SimpleNamespace
 
+import numpy as np
 import pandas as pd
 import pytest
 
+from app.ml.model import RiskModel
 from app.services import ml_service
 
 
@@ -87,3 +89,45 @@ def test_get_ml_risk_profile_returns_predicted_level(
 
     assert result["risk_level"] == "LOW"
     assert set(result.keys()) == {"volatility", "max_drawdown", "mean_return", "risk_level"}
+
+
+def test_get_ml_risk_profiles_predicts_all_symbols_in_one_call(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    metrics = pd.DataFrame(
+        {
+            "volatility": [0.01, 0.03],
+            "max_drawdown": [-0.05, -0.3],
+            "mean_return": [0.001, -0.002],
+        },
+        index=["AAPL", "TSLA"],
+    )
+    monkeypatch.setattr(
+        ml_service,
+        "get_batch_risk_metrics",
+        lambda *_: (metrics, {"NOPE": "No historical data for symbol NOPE"}),
+    )
+
+    calls: list[int] = []
+
+    class FakeEstimator:
+        def predict(self, X):
+            calls.append(len(X))
+            return [0, 1]
+
+    class FakeEncoder:
+        def inverse_transform(self, y):
+            return np.array([["LOW", "HIGH"][i] for i in y])
+
+    monkeypatch.setattr(
+        ml_service,
+        "_load_risk_model",
+        lambda: RiskModel(model=FakeEstimator(), encoder=FakeEncoder()),
+    )
+
+    profiles, errors = ml_service.get_ml_risk_profiles(["AAPL", "TSLA", "NOPE"], 30)
+
+    assert calls == [2]
+    assert profiles["AAPL"]["risk_level"] == "LOW"
+    assert profiles["TSLA"]["risk_level"] == "HIGH"
+    assert errors == {"NOPE": "No historical data for symbol NOPE"}
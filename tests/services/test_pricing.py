@@ -2,6 +2,7 @@ import pandas as pd
 import pytest
 
 from app.domain.metrics import compute_max_drawdown, compute_returns, compute_volatility
+from app.infrastructure.market.yfinance_client import HistoryBatch
 from app.services import risk_service
 
 
@@ -36,3 +37,27 @@ def test_get_risk_profile_uses_classifier(monkeypatch: pytest.MonkeyPatch) -> No
     assert result["volatility"] == pytest.approx(captured["volatility"])
     assert result["max_drawdown"] == pytest.approx(captured["max_drawdown"])
 
+
+def test_get_risk_profiles_classifies_batch_and_reports_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    index = pd.to_datetime(["2026-02-02", "2026-02-03", "2026-02-04"])
+    batch = HistoryBatch(
+        frames={
+            "AAPL": pd.DataFrame({"Close": [100.0, 110.0, 99.0]}, index=index),
+            "NEW": pd.DataFrame({"Close": [50.0]}, index=index[-1:]),
+        },
+        errors={"NOPE": "No historical data for symbol NOPE"},
+    )
+    monkeypatch.setattr(risk_service, "fetch_history_many", lambda *_: batch)
+
+    profiles, errors = risk_service.get_risk_profiles(["AAPL", "NEW", "NOPE"], 3)
+
+    df = batch.frames["AAPL"]
+    assert profiles["AAPL"]["volatility"] == pytest.approx(compute_volatility(compute_returns(df)))
+    assert profiles["AAPL"]["max_drawdown"] == pytest.approx(compute_max_drawdown(df))
+    assert profiles["AAPL"]["risk_level"] == "HIGH"
+    assert errors == {
+        "NOPE": "No historical data for symbol NOPE",
+        "NEW": "Not enough price history for symbol NEW",
+    }
@@ -0,0 +1,29 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.repositories.models import DocumentChunk
+from app.services.retrieval import RRF_K, hybrid_search_chunks, reciprocal_rank_fusion
+
+
+def _chunk(chunk_id: int) -> DocumentChunk:
+    return DocumentChunk(id=chunk_id, document_id=1, chunk_index=chunk_id, chunk_text=f"c{chunk_id}")
+
+
+def test_reciprocal_rank_fusion_rewards_items_in_both_lists() -> None:
+    fused = reciprocal_rank_fusion([[1, 2, 3], [3, 4]])
+
+    assert [key for key, _ in fused] == [3, 1, 2, 4]
+    assert fused[0][1] == pytest.approx(1 / (RRF_K + 3) + 1 / (RRF_K + 1))
+
+
+def test_hybrid_search_fuses_both_retrievers_within_budget() -> None:
+    repo = MagicMock()
+    repo.search_chunks_by_embedding.return_value = [_chunk(1), _chunk(2), _chunk(3)]
+    repo.search_chunks_by_text.return_value = [_chunk(9), _chunk(2)]
+
+    result = hybrid_search_chunks(repo, "AAPL 10-K", [0.1], document_id=1, limit=3, candidates=10)
+
+    assert [c.id for c in result] == [2, 1, 9]
+    repo.search_chunks_by_embedding.assert_called_once_with([0.1], document_id=1, limit=10)
+    repo.search_chunks_by_text.assert_called_once_with("AAPL 10-K", document_id=1, limit=10)